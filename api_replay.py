@@ -0,0 +1,252 @@
+import base64
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from cdp_session import CdpSession
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+API_TYPES = ["XHR", "Fetch"]
+# Recomputed by the browser from the replayed body, or wrong once the body is decoded
+DROPPED_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "date"}
+
+
+def archive_dir():
+    return os.environ.get("PAWFINDER_API_ARCHIVE", os.path.join(HERE, ".api_archive"))
+
+
+def request_key(method, url, body=None):
+    """Stable key for a request: method, URL with sorted query, hash of the body"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    key = f"{method.upper()} {parts.scheme}://{parts.netloc}{parts.path}"
+    if query:
+        key += f"?{query}"
+    if body:
+        key += f" #{hashlib.sha1(body.encode('utf-8')).hexdigest()[:12]}"
+    return key
+
+
+class ApiArchive:
+    """Recorded API responses, one JSON file per request key"""
+
+    def __init__(self, path=None):
+        self.path = path or archive_dir()
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _file(self, key):
+        return os.path.join(self.path, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, key):
+        """The recorded response, read from disk once and then served from memory"""
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+        try:
+            with open(self._file(key), encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except (OSError, ValueError):
+            entry = None
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def put(self, key, status, headers, body_b64):
+        entry = {"key": key, "status": status, "headers": headers, "body": body_b64, "recorded": time.time()}
+        os.makedirs(self.path, exist_ok=True)
+        path = self._file(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(entry, handle, indent=2)
+        os.replace(temp_path, path)
+        with self._lock:
+            self._entries[key] = entry
+
+    def keys(self):
+        keys = []
+        for name in sorted(os.listdir(self.path)) if os.path.isdir(self.path) else []:
+            if name.endswith(".json"):
+                with open(os.path.join(self.path, name), encoding="utf-8") as handle:
+                    keys.append(json.load(handle)["key"])
+        return sorted(keys)
+
+
+class ReplayStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = []
+        # Browsers and tabs whose traffic went straight to the backend because the tap failed
+        self.unavailable = 0
+        self.untapped_pages = 0
+
+    def count(self, field):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def miss(self, key):
+        with self._lock:
+            self.missing.append(key)
+
+    def report(self, mode):
+        if mode == "record":
+            lines = [f"📼 API archive: recorded {self.recorded} responses to {archive_dir()}"]
+            if self.untapped:
+                lines.append(f"   ⚠️  {self.unavailable} browsers and {self.untapped_pages} tabs were not recorded")
+            return lines
+        lines = [f"📼 API archive: replayed {self.replayed} responses, {len(self.missing)} not in the archive"]
+        lines.extend(f"   missing: {key}" for key in sorted(set(self.missing))[:10])
+        if self.untapped:
+            lines.append(
+                f"   ⚠️  {self.unavailable} browsers and {self.untapped_pages} tabs were not tapped "
+                f"and used the live backend"
+            )
+        return lines
+
+    @property
+    def untapped(self):
+        return self.unavailable + self.untapped_pages
+
+
+class ApiTap:
+    """Records or replays one browser's XHR/fetch traffic through the DevTools Fetch domain"""
+
+    def __init__(self, driver, mode, archive, stats, strict=False):
+        self.mode = mode
+        self.archive = archive
+        self.stats = stats
+        self.strict = strict
+        self.session = CdpSession.for_driver(driver)
+        self.session.on("Fetch.requestPaused", self._paused)
+        # Record after the response arrives; replay before the request leaves
+        stage = "Response" if mode == "record" else "Request"
+        patterns = [{"resourceType": kind, "requestStage": stage} for kind in API_TYPES]
+        self.session.attach_pages(
+            lambda session_id: self.session.send_async("Fetch.enable", {"patterns": patterns}, session_id)
+            .add_done_callback(self._enabled)
+        )
+
+    def close(self):
+        self.session.close()
+
+    def _enabled(self, done):
+        if done.exception() is not None:
+            self.stats.count("untapped_pages")
+
+    def _paused(self, params, session_id):
+        request = params["request"]
+        key = request_key(request["method"], request["url"], request.get("postData"))
+        if self.mode == "record":
+            self._record(params, session_id, key)
+        else:
+            self._replay(params, session_id, key)
+
+    def _continue(self, request_id, session_id):
+        self.session.send_async("Fetch.continueRequest", {"requestId": request_id}, session_id)
+
+    def _record(self, params, session_id, key):
+        request_id = params["requestId"]
+        if "responseStatusCode" not in params:
+            return self._continue(request_id, session_id)
+
+        def store(done):
+            if done.exception() is None:
+                result = done.result()
+                body = result["body"]
+                if not result.get("base64Encoded"):
+                    body = base64.b64encode(body.encode("utf-8")).decode("ascii")
+                headers = [
+                    header for header in params.get("responseHeaders") or []
+                    if header["name"].lower() not in DROPPED_HEADERS
+                ]
+                self.archive.put(key, params["responseStatusCode"], headers, body)
+                self.stats.count("recorded")
+            self._continue(request_id, session_id)
+
+        future = self.session.send_async("Fetch.getResponseBody", {"requestId": request_id}, session_id)
+        future.add_done_callback(store)
+
+    def _replay(self, params, session_id, key):
+        request_id = params["requestId"]
+        entry = self.archive.get(key)
+        if entry is None:
+            self.stats.miss(key)
+            if self.strict:
+                self.session.send_async(
+                    "Fetch.failRequest", {"requestId": request_id, "errorReason": "BlockedByClient"}, session_id
+                )
+            else:
+                self._continue(request_id, session_id)
+            return
+
+        self.stats.count("replayed")
+        self.session.send_async("Fetch.fulfillRequest", {
+            "requestId": request_id,
+            "responseCode": entry["status"],
+            "responseHeaders": entry["headers"],
+            "body": entry["body"],
+        }, session_id)
+
+
+_mode = None
+_strict = False
+archive = ApiArchive()
+stats = ReplayStats()
+
+
+def configure(mode, strict=False, path=None):
+    """mode is 'record', 'replay' or None (live backend)"""
+    global _mode, _strict, archive
+    _mode = mode
+    _strict = strict
+    if path is not None:
+        archive = ApiArchive(path)
+
+
+def current_mode():
+    return _mode
+
+
+def start_tap(driver):
+    """driver_pool acquire hook"""
+    if _mode is None:
+        return
+    try:
+        driver._api_tap = ApiTap(driver, _mode, archive, stats, _strict)
+    except Exception as error:
+        stats.count("unavailable")
+        print(f"⚠️  API tap unavailable, this browser uses the live backend: {type(error).__name__}: {error}")
+
+
+def stop_tap(driver):
+    """driver_pool release hook"""
+    tap = getattr(driver, "_api_tap", None)
+    if tap is not None:
+        tap.close()
+        driver._api_tap = None
+
+
+def main():
+    listing = ApiArchive()
+    if len(sys.argv) > 1 and sys.argv[1] == "clear":
+        for name in os.listdir(listing.path) if os.path.isdir(listing.path) else []:
+            os.remove(os.path.join(listing.path, name))
+        print(f"🧹 Cleared {listing.path}")
+        return 0
+
+    keys = listing.keys()
+    print(f"📼 {len(keys)} recorded responses in {listing.path}")
+    for key in keys:
+        print(f"   {key}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
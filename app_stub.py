@@ -0,0 +1,527 @@
+import argparse
+import copy
+import html
+import json
+import socket
+import sys
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import auth_stub
+from routes import route_of
+
+
+DEFAULT_PORT = 3000
+
+PETS = [
+    {"id": 1, "name": "Bella", "species": "Dog", "breed": "Golden Retriever", "age": "2 years", "gender": "Female", "size": "Large"},
+    {"id": 2, "name": "Milo", "species": "Cat", "breed": "Tabby", "age": "8 months", "gender": "Male", "size": "Small"},
+    {"id": 3, "name": "Rocky", "species": "Dog", "breed": "Beagle", "age": "4 years", "gender": "Male", "size": "Medium"},
+    {"id": 4, "name": "Luna", "species": "Cat", "breed": "Siamese", "age": "1 year", "gender": "Female", "size": "Small"},
+    {"id": 5, "name": "Max", "species": "Dog", "breed": "Labrador Retriever", "age": "3 years", "gender": "Male", "size": "Large"},
+    {"id": 6, "name": "Daisy", "species": "Dog", "breed": "Poodle puppy", "age": "5 months", "gender": "Female", "size": "Small"},
+    {"id": 7, "name": "Oliver", "species": "Cat", "breed": "Maine Coon kitten", "age": "4 months", "gender": "Male", "size": "Medium"},
+    {"id": 8, "name": "Coco", "species": "Rabbit", "breed": "Holland Lop", "age": "1 year", "gender": "Female", "size": "Small"},
+]
+
+PRODUCTS = [
+    {"id": 1, "name": "Grain-Free Dog Food", "category": "Food", "price": 39.99},
+    {"id": 2, "name": "Cat Scratching Post", "category": "Toys", "price": 24.5},
+    {"id": 3, "name": "Adjustable Dog Harness", "category": "Accessories", "price": 18.0},
+    {"id": 4, "name": "Salmon Cat Treats", "category": "Food", "price": 6.75},
+    {"id": 5, "name": "Rope Tug Toy", "category": "Toys", "price": 9.99},
+    {"id": 6, "name": "Orthopedic Pet Bed", "category": "Accessories", "price": 59.0},
+]
+
+VETS = [
+    {"id": 1, "name": "Dr. Sarah Ahmed", "specialty": "General Practice", "clinic": "Happy Paws Animal Clinic", "phone": "555-0101"},
+    {"id": 2, "name": "Dr. James Rahman", "specialty": "Emergency Care", "clinic": "24/7 Emergency Pet Hospital", "phone": "555-0102"},
+    {"id": 3, "name": "Dr. Nadia Karim", "specialty": "Dentistry", "clinic": "Bright Smile Vet Dental", "phone": "555-0103"},
+    {"id": 4, "name": "Dr. Omar Hossain", "specialty": "Surgery", "clinic": "City Animal Surgery Center", "phone": "555-0104"},
+]
+
+# Named data sets; --data takes a JSON file with the same keys instead
+DATASETS = {
+    "default": {"pets": PETS, "products": PRODUCTS, "vets": VETS},
+    "empty": {"pets": [], "products": [], "vets": []},
+    "large": {
+        "pets": [dict(pet, id=pet["id"] + 8 * n, name=f"{pet['name']} {n + 1}") for n in range(25) for pet in PETS],
+        "products": [dict(item, id=item["id"] + 6 * n) for n in range(20) for item in PRODUCTS],
+        "vets": [dict(vet, id=vet["id"] + 4 * n) for n in range(10) for vet in VETS],
+    },
+}
+
+
+LAYOUT = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 0; color: #222; }}
+header {{ display: flex; align-items: center; justify-content: space-between; padding: 16px 32px; background: #fff7ed; }}
+nav.navbar a {{ margin-left: 16px; }}
+.menu-toggle {{ display: none; }}
+main {{ padding: 24px 32px; min-height: 70vh; }}
+.grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(220px, 1fr)); gap: 16px; }}
+.card {{ border: 1px solid #ddd; border-radius: 8px; padding: 16px; min-height: 120px; }}
+.filters {{ display: flex; gap: 8px; margin: 16px 0; }}
+.toast {{ position: fixed; bottom: 16px; right: 16px; background: #333; color: #fff; padding: 8px 16px; }}
+.error {{ color: #c00; }}
+footer {{ padding: 16px 32px; background: #f3f4f6; }}
+@media (max-width: 768px) {{
+  nav.navbar {{ display: none; }}
+  .menu-toggle {{ display: block; }}
+}}
+</style>
+</head>
+<body>
+<header class="header">
+  <a href="/" class="logo">🐾 PawFinder</a>
+  <button class="menu-toggle" aria-label="Open menu">☰</button>
+  <nav class="navbar">
+    <a href="/">Home</a>
+    <a href="/pets">Find Pets</a>
+    <a href="/marketplace">Marketplace</a>
+    <a href="/veterinary">Veterinary</a>
+    {account}
+  </nav>
+</header>
+<main>
+{body}
+</main>
+<footer>© PawFinder — adopt, don't shop.</footer>
+</body>
+</html>
+"""
+
+PET_CARD = """<div class="pet-card card" data-testid="pet-card-{id}">
+  <h3>{name}</h3>
+  <p>Breed: {breed}</p>
+  <p>Age: {age} · {gender}</p>
+  <button class="favorite" aria-label="Add {name} to favorites" onclick="favorite(this)">🤍</button>
+  <a href="/pets/{id}/details"><button>View Details</button></a>
+</div>"""
+
+FAVORITE_JS = """<script>
+function favorite(button) {
+  button.textContent = button.textContent === '❤' ? '🤍' : '❤';
+  fetch('/api/favorites', {method: 'POST', body: button.closest('.pet-card').dataset.testid});
+  const toast = document.createElement('div');
+  toast.className = 'toast';
+  toast.textContent = 'Saved to favorites';
+  document.body.appendChild(toast);
+  setTimeout(() => toast.remove(), 1500);
+}
+</script>"""
+
+
+def _matches(item, query, fields):
+    return not query or any(query.lower() in str(item[field]).lower() for field in fields)
+
+
+class AppStub:
+    """Local stand-in for the PawFinder web app with seeded, deterministic data.
+
+    Serves /, /pets, /pets/<id>, /pets/<id>/details, /marketplace, /veterinary and
+    /sign-in as server-rendered pages plus JSON under /api/. Sign-in goes through an
+    in-process auth_stub.AuthStub, which also backs the embedded sign-in widget.
+    """
+
+    def __init__(self, port=DEFAULT_PORT, host="127.0.0.1", data="default", latency_ms=0,
+                 route_latency=None, require_login=False, auth=None):
+        self.host = host
+        self.port = port
+        self.data = copy.deepcopy(DATASETS[data] if isinstance(data, str) else data)
+        self.latency_ms = latency_ms
+        self.route_latency = dict(route_latency or {})
+        self.require_login = require_login
+        self.auth = auth
+        self.adoptions = []
+        self.lock = threading.Lock()
+        self.server = None
+        self.thread = None
+        self._own_auth = False
+
+    @property
+    def url(self):
+        return f"http://localhost:{self.port}"
+
+    def start(self):
+        """Serve on a background thread, starting an auth stand-in if none was given"""
+        if self.auth is None:
+            self.auth = auth_stub.AuthStub(0, app_origin=f"http://localhost:{self.port}").start()
+            self._own_auth = True
+        handler = type("Handler", (_Handler,), {"app": self})
+        self.server = ThreadingHTTPServer((self.host, self.port), handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.auth.app_origin = self.url
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if self._own_auth:
+            self.auth.stop()
+
+    def latency_for(self, path):
+        """Route-specific latency (keyed like '/pets/<id>' or '/api/pets'), else the default"""
+        return self.route_latency.get(route_of(f"http://stub{path}"), self.latency_ms)
+
+    def pet(self, pet_id):
+        return next((pet for pet in self.data["pets"] if str(pet["id"]) == str(pet_id)), None)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    app = None
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out as separate writes; without this, keep-alive
+        # responses stall ~40ms on delayed ACKs
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        self._delay(parts.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        segments = [segment for segment in parts.path.split("/") if segment]
+
+        if parts.path.startswith("/api/"):
+            return self._api(segments[1:], query)
+        if not segments:
+            return self._home(query)
+        if segments == ["pets"]:
+            return self._pet_list(query)
+        if segments[0] == "pets" and len(segments) in (2, 3) and segments[2:] in ([], ["details"]):
+            return self._pet_detail(segments[1])
+        if segments == ["marketplace"]:
+            return self._marketplace(query)
+        if segments == ["veterinary"]:
+            return self._veterinary(query)
+        if segments == ["sign-in"]:
+            return self._sign_in(query)
+        if segments == ["sign-out"]:
+            return self._sign_out()
+        if segments == ["health"]:
+            return self._json(200, {"ok": True})
+        self._not_found()
+
+    def do_POST(self):
+        parts = urlsplit(self.path)
+        self._delay(parts.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length).decode("utf-8")
+
+        if parts.path == "/sign-in":
+            form = {key: values[-1] for key, values in parse_qs(raw).items()}
+            return self._sign_in_submit(form)
+        if parts.path == "/api/adoptions":
+            try:
+                application = json.loads(raw or "{}")
+            except ValueError:
+                return self._json(400, {"error": "invalid_json"})
+            with self.app.lock:
+                self.app.adoptions.append(application)
+            return self._json(201, {"ok": True, "message": "Adoption submitted"})
+        if parts.path == "/api/favorites":
+            return self._json(200, {"ok": True})
+        self._json(404, {"error": "not_found"})
+
+    # Pages
+
+    def _home(self, query):
+        pets = self.app.data["pets"]
+        body = f"""
+<section class="hero">
+  <h1>Find your new best friend</h1>
+  <p>Dogs, cats and more waiting for a home. Adopt a pet today.</p>
+  <form class="search-form" action="/pets" method="get">
+    <input type="search" name="search" class="pet-search" placeholder="Search pets by name or breed">
+    <button type="submit">Search</button>
+  </form>
+  <a class="cta-button" href="/pets">Find Pets</a>
+</section>
+<div class="pet-filters filters">
+  <select name="animal" onchange="filterPets(this.value)">
+    <option value="">All animals</option>
+    {''.join(f'<option value="{species}">{species}s</option>' for species in sorted({pet['species'] for pet in pets}))}
+  </select>
+  <button class="filter-chip" data-filter="Dog" onclick="filterPets('Dog')">Dogs</button>
+  <button class="filter-chip" data-filter="Cat" onclick="filterPets('Cat')">Cats</button>
+</div>
+<section class="featured-pets">
+  <h2>Featured pets</h2>
+  <div class="pets-grid grid" id="pets">{self._pet_cards(pets[:6])}</div>
+</section>
+<script>
+function filterPets(species) {{
+  fetch('/api/pets?' + new URLSearchParams({{species: species}}))
+    .then(response => response.json())
+    .then(pets => {{
+      document.getElementById('pets').innerHTML = pets.slice(0, 6).map(pet => `
+        <div class="pet-card card" data-testid="pet-card-${{pet.id}}">
+          <h3>${{pet.name}}</h3><p>Breed: ${{pet.breed}}</p><p>Age: ${{pet.age}} · ${{pet.gender}}</p>
+          <button class="favorite" aria-label="Add ${{pet.name}} to favorites" onclick="favorite(this)">🤍</button>
+          <a href="/pets/${{pet.id}}/details"><button>View Details</button></a>
+        </div>`).join('') || '<p class="empty-state">No pets match this filter</p>';
+    }});
+}}
+</script>
+{FAVORITE_JS}"""
+        self._page(200, "PawFinder - Adopt a Pet", body)
+
+    def _pet_list(self, query):
+        search = query.get("search") or query.get("q") or ""
+        pets = [pet for pet in self.app.data["pets"] if _matches(pet, search, ("name", "breed", "species"))]
+        heading = f"Results for “{html.escape(search)}”" if search else "All pets"
+        cards = self._pet_cards(pets) or '<p class="empty-state">No pets found</p>'
+        body = f'<h1>{heading}</h1>\n<section class="pet-results search-results"><div class="grid">{cards}</div></section>\n{FAVORITE_JS}'
+        self._page(200, "Find Pets - PawFinder", body)
+
+    def _pet_detail(self, pet_id):
+        pet = self.app.pet(pet_id)
+        if pet is None:
+            return self._not_found()
+        body = f"""
+<article class="pet-profile">
+  <h1>{html.escape(pet['name'])}</h1>
+  <p>{html.escape(pet['breed'])} · {html.escape(pet['age'])} · {html.escape(pet['gender'])} · {html.escape(pet['size'])}</p>
+</article>
+<section class="adoption">
+  <h2>Adopt {html.escape(pet['name'])}</h2>
+  <form id="adoption-form" onsubmit="return false">
+    <input name="name" id="name" placeholder="Full name" required>
+    <input name="email" id="email" type="email" placeholder="Email" required>
+    <input name="phone" id="phone" type="tel" placeholder="Phone number" required>
+    <button type="button" onclick="submitAdoption()">Submit Application</button>
+  </form>
+  <p id="adoption-status" role="status"></p>
+</section>
+<script>
+function submitAdoption() {{
+  const form = document.getElementById('adoption-form');
+  const application = Object.fromEntries(new FormData(form).entries());
+  application.pet = {pet['id']};
+  fetch('/api/adoptions', {{method: 'POST', headers: {{'Content-Type': 'application/json'}}, body: JSON.stringify(application)}})
+    .then(response => response.json())
+    .then(result => {{
+      document.getElementById('adoption-status').textContent = result.message + '. Thank you!';
+    }});
+}}
+</script>"""
+        self._page(200, f"{pet['name']} - PawFinder", body)
+
+    def _marketplace(self, query):
+        if self.app.require_login and not self._session():
+            return self._redirect(f"/sign-in?{urlencode({'redirect_url': '/marketplace'})}")
+        category = query.get("category", "")
+        products = [item for item in self.app.data["products"] if not category or item["category"] == category]
+        cards = "".join(
+            f'<div class="product-card card" data-testid="product-{item["id"]}">'
+            f'<h3>{html.escape(item["name"])}</h3><p class="category">{html.escape(item["category"])}</p>'
+            f'<p class="price">${item["price"]:.2f}</p><button>Add to Cart</button></div>'
+            for item in products
+        ) or '<p class="empty-state">No products yet</p>'
+        body = f'<h1>Marketplace</h1>\n<section class="products"><div class="grid">{cards}</div></section>'
+        self._page(200, "Marketplace - PawFinder", body)
+
+    def _veterinary(self, query):
+        search = query.get("search", "")
+        vets = [vet for vet in self.app.data["vets"] if _matches(vet, search, ("name", "specialty", "clinic"))]
+        cards = "".join(
+            f'<div class="vet-card card" data-testid="vet-{vet["id"]}">'
+            f'<h3>{html.escape(vet["name"])}</h3><p>{html.escape(vet["specialty"])}</p>'
+            f'<p>{html.escape(vet["clinic"])} · {html.escape(vet["phone"])}</p>'
+            f'<button>Book Appointment</button></div>'
+            for vet in vets
+        ) or '<p class="no-results">No veterinarians found</p>'
+        specialties = sorted({vet["specialty"] for vet in self.app.data["vets"]})
+        body = f"""
+<section class="veterinary">
+  <h1>Veterinary Care</h1>
+  <p>Find a trusted vet, doctor or clinic near you and book an appointment.</p>
+  <form action="/veterinary" method="get" class="filters">
+    <input type="search" name="search" class="search-input" placeholder="Search vets by name or clinic" value="{html.escape(search)}">
+    <select name="specialty" class="filter">
+      <option value="">All specialties</option>
+      {''.join(f'<option>{html.escape(specialty)}</option>' for specialty in specialties)}
+    </select>
+    <button type="submit">Search</button>
+  </form>
+  <div class="grid">{cards}</div>
+</section>"""
+        self._page(200, "Veterinary - PawFinder", body)
+
+    def _sign_in(self, query, email="", error=""):
+        redirect_url = query.get("redirect_url") or "/"
+        widget = f"{self.app.auth.url}/embed/sign-in?{urlencode({'redirect_url': self.app.url + redirect_url})}"
+        body = f"""
+<h1>Sign in</h1>
+<form method="post" action="/sign-in" class="signin-form">
+  <input type="hidden" name="redirect_url" value="{html.escape(redirect_url)}">
+  <label for="email">Email</label>
+  <input type="email" id="email" name="email" required placeholder="Email address" value="{html.escape(email)}">
+  <label for="password">Password</label>
+  <input type="password" id="password" name="password" required placeholder="Password">
+  {f'<p class="error" role="alert">{html.escape(error)}</p>' if error else ''}
+  <button type="submit">Sign In</button>
+</form>
+<h2>Or continue with</h2>
+<iframe src="{html.escape(widget)}" title="Sign in with a provider" width="420" height="480"></iframe>"""
+        self._page(200, "Sign In - PawFinder", body)
+
+    def _sign_in_submit(self, form):
+        email = form.get("email", "").strip().lower()
+        redirect_url = form.get("redirect_url") or "/"
+        if not self.app.auth.check_password(email, form.get("password", "")):
+            return self._sign_in({"redirect_url": redirect_url}, email, "Incorrect email or password")
+        session_id = self.app.auth.new_session(email, self.app.auth.users[email]["name"])
+        self._redirect(redirect_url if redirect_url.startswith("/") else "/", cookie=session_id)
+
+    def _sign_out(self):
+        with self.app.auth.lock:
+            self.app.auth.sessions.pop(self._cookie(), None)
+        self._redirect("/", cookie="")
+
+    # API
+
+    def _api(self, segments, query):
+        data = self.app.data
+        if segments == ["pets"]:
+            search = query.get("search", "")
+            species = query.get("species", "")
+            pets = [
+                pet for pet in data["pets"]
+                if _matches(pet, search, ("name", "breed", "species")) and (not species or pet["species"] == species)
+            ]
+            return self._json(200, pets)
+        if len(segments) == 2 and segments[0] == "pets":
+            pet = self.app.pet(segments[1])
+            return self._json(200, pet) if pet else self._json(404, {"error": "not_found"})
+        if segments == ["products"]:
+            return self._json(200, data["products"])
+        if segments == ["vets"]:
+            search = query.get("search", "")
+            return self._json(200, [vet for vet in data["vets"] if _matches(vet, search, ("name", "specialty", "clinic"))])
+        if segments == ["session"]:
+            session = self._session()
+            return self._json(200, {"signed_in": bool(session), "user": session})
+        self._json(404, {"error": "not_found"})
+
+    # Plumbing
+
+    def _pet_cards(self, pets):
+        return "".join(
+            PET_CARD.format(**{key: html.escape(str(value)) for key, value in pet.items()}) for pet in pets
+        )
+
+    def _delay(self, path):
+        latency = self.app.latency_for(path)
+        if latency:
+            time.sleep(latency / 1000)
+
+    def _cookie(self):
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        name = auth_stub.SESSION_COOKIE
+        return cookies[name].value if name in cookies else None
+
+    def _session(self):
+        session = self.app.auth.sessions.get(self._cookie())
+        return {"email": session["email"], "name": session["name"]} if session else None
+
+    def _send(self, status, payload, content_type, cookie=None, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if cookie is not None:
+            max_age = 0 if cookie == "" else 86400
+            self.send_header(
+                "Set-Cookie", f"{auth_stub.SESSION_COOKIE}={cookie}; Path=/; Max-Age={max_age}; HttpOnly; SameSite=Lax"
+            )
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _page(self, status, title, body):
+        session = self._session()
+        account = (
+            f'<a href="/sign-out" class="account">Sign Out ({html.escape(session["name"])})</a>'
+            if session else '<a href="/sign-in">Sign In</a>'
+        )
+        payload = LAYOUT.format(title=html.escape(title), body=body, account=account).encode("utf-8")
+        self._send(status, payload, "text/html; charset=utf-8")
+
+    def _json(self, status, data):
+        self._send(status, json.dumps(data).encode("utf-8"), "application/json")
+
+    def _redirect(self, location, cookie=None):
+        self._send(302, b"", "text/plain", cookie, {"Location": location})
+
+    def _not_found(self):
+        self._page(404, "404: This page could not be found", "<h1>404</h1><p>This page could not be found.</p>")
+
+
+def parse_route_latency(values):
+    """['/pets/<id>=300', '/api/pets=50'] -> {'/pets/<id>': 300, '/api/pets': 50}"""
+    latency = {}
+    for value in values or []:
+        route, _, ms = value.rpartition("=")
+        latency[route] = int(ms)
+    return latency
+
+
+def load_data(name_or_path):
+    if name_or_path in DATASETS:
+        return name_or_path
+    with open(name_or_path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    return {key: data.get(key, []) for key in ("pets", "products", "vets")}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the PawFinder app with seeded data")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--data", default="default",
+                        help=f"data set ({', '.join(DATASETS)}) or a JSON file with pets/products/vets")
+    parser.add_argument("--latency-ms", type=int, default=0, help="delay added to every response")
+    parser.add_argument("--route-latency", action="append", metavar="ROUTE=MS",
+                        help="per-route delay, e.g. /pets/<id>=300 (repeatable)")
+    parser.add_argument("--require-login", action="store_true", help="redirect /marketplace to sign-in when signed out")
+    parser.add_argument("--auth-port", type=int, default=auth_stub.DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    auth = auth_stub.AuthStub(args.auth_port, args.host, app_origin=f"http://localhost:{args.port}").start()
+    app = AppStub(
+        args.port, args.host, load_data(args.data), args.latency_ms,
+        parse_route_latency(args.route_latency), args.require_login, auth,
+    ).start()
+    print(f"🐾 PawFinder stand-in on {app.url} ({args.data} data), auth stand-in on {auth.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        app.stop()
+        auth.stop()
+        print("🧹 PawFinder stand-in stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
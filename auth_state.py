@@ -0,0 +1,224 @@
+import hashlib
+import json
+import os
+import sys
+import time
+
+from driver_pool import APP_ORIGIN
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TTL = float(os.environ.get("PAWFINDER_AUTH_TTL", "3600"))
+RESTORED_MARKER = "__pawfinder_restored"
+
+
+# Web storage of the page the driver is on
+CAPTURE_JS = """
+const dump = storage => {
+    const items = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+};
+return {origin: location.origin, local: dump(localStorage), session: dump(sessionStorage)};
+"""
+
+# Runs before any page script on every new document in the tab. Storage is filled in
+# the first time the tab reaches the saved origin, so the app boots already signed in;
+# the marker keeps later navigations from undoing what the test itself changed.
+RESTORE_JS = """
+(function (state) {
+    if (location.origin !== state.origin || sessionStorage.getItem('%s')) return;
+    for (const [key, value] of Object.entries(state.local)) localStorage.setItem(key, value);
+    for (const [key, value] of Object.entries(state.session)) sessionStorage.setItem(key, value);
+    sessionStorage.setItem('%s', '1');
+})(%%s);
+""" % (RESTORED_MARKER, RESTORED_MARKER)
+
+
+def state_dir():
+    return os.environ.get("PAWFINDER_AUTH_STATE_DIR", os.path.join(HERE, ".auth_state"))
+
+
+def state_path(account):
+    """One file per credential set, named by a hash of the account"""
+    digest = hashlib.sha1(account.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(state_dir(), f"{digest}.json")
+
+
+def enabled():
+    return os.environ.get("PAWFINDER_AUTH_STATE") != "off"
+
+
+class StorageState:
+    """Cookies plus local/session storage of a signed-in browser"""
+
+    def __init__(self, data):
+        self.account = data["account"]
+        self.origin = data["origin"]
+        self.cookies = data["cookies"]
+        self.local = data["local"]
+        self.session = data["session"]
+        self.saved = data["saved"]
+        self.expires = data["expires"]
+
+    @property
+    def expired(self):
+        return time.time() >= self.expires
+
+    def to_dict(self):
+        return {
+            "account": self.account, "origin": self.origin, "cookies": self.cookies,
+            "local": self.local, "session": self.session,
+            "saved": self.saved, "expires": self.expires,
+        }
+
+
+def capture_state(driver, account, ttl=None):
+    """Snapshot the signed-in state; call it while the driver is on an app page.
+
+    The snapshot expires after ttl seconds or when the first persistent cookie does,
+    whichever comes first.
+    """
+    now = time.time()
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+    storage = driver.execute_script(CAPTURE_JS)
+    # Bookkeeping the suite itself keeps in storage (restore marker, vitals history) is not app state
+    for area in ("local", "session"):
+        storage[area] = {key: value for key, value in storage[area].items() if not key.startswith("__pawfinder_")}
+
+    expires = now + (DEFAULT_TTL if ttl is None else ttl)
+    for cookie in cookies:
+        if not cookie.get("session") and cookie.get("expires", -1) > 0:
+            expires = min(expires, cookie["expires"])
+
+    return StorageState({
+        "account": account,
+        "origin": storage["origin"] if storage["origin"] != "null" else APP_ORIGIN,
+        "cookies": cookies,
+        "local": storage["local"],
+        "session": storage["session"],
+        "saved": now,
+        "expires": expires,
+    })
+
+
+def save_state(state):
+    path = state_path(state.account)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(state.to_dict(), handle, indent=2)
+    os.replace(temp_path, path)
+
+
+def load_state(account):
+    """The saved state for this account, or None if there is none or it has expired"""
+    path = state_path(account)
+    try:
+        with open(path, encoding="utf-8") as handle:
+            state = StorageState(json.load(handle))
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if state.expired:
+        invalidate(account)
+        return None
+    return state
+
+
+def invalidate(account):
+    try:
+        os.remove(state_path(account))
+    except OSError:
+        pass
+
+
+def restore_state(driver, state):
+    """Inject cookies now and storage on the next load of the saved origin.
+
+    Call it before navigating; cookies go in over DevTools so no page load is needed.
+    Returns the id of the storage script, or None when there was no storage to restore.
+    """
+    cookies = []
+    for cookie in state.cookies:
+        restored = {
+            key: cookie[key]
+            for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+            if key in cookie
+        }
+        if not cookie.get("session") and cookie.get("expires", -1) > 0:
+            restored["expires"] = cookie["expires"]
+        cookies.append(restored)
+    if cookies:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+    if state.local or state.session:
+        storage = {"origin": state.origin, "local": state.local, "session": state.session}
+        return driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": RESTORE_JS % json.dumps(storage)}
+        )["identifier"]
+    return None
+
+
+def discard_state(driver, state, script_id):
+    """Undo restore_state: stop injecting storage and drop the restored cookies and storage"""
+    if script_id is not None:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_id})
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": state.origin, "storageTypes": "local_storage"})
+    # sessionStorage belongs to the tab; DevTools cannot clear it per origin
+    if driver.execute_script("return location.origin") == state.origin:
+        driver.execute_script("sessionStorage.clear()")
+
+
+def signed_in(driver, account, login, check, ttl=None):
+    """Start signed in as account: restore the saved state, or run login() once and save it.
+
+    login() drives the real sign-in and returns True on success. check() tells whether
+    the browser holds a session; a restored state that fails it (the app or the auth
+    stand-in restarted since it was saved) is deleted and login() runs instead.
+    Returns True when the browser holds a session afterwards.
+    """
+    if not enabled():
+        return login()
+
+    state = load_state(account)
+    if state is not None:
+        script_id = restore_state(driver, state)
+        if check():
+            return True
+        print(f"🔁 Saved sign-in for {account} is no longer valid, signing in again")
+        invalidate(account)
+        discard_state(driver, state, script_id)
+
+    if not login():
+        return False
+    save_state(capture_state(driver, account, ttl))
+    return True
+
+
+def main():
+    directory = state_dir()
+    if len(sys.argv) > 1 and sys.argv[1] == "clear":
+        for name in os.listdir(directory) if os.path.isdir(directory) else []:
+            os.remove(os.path.join(directory, name))
+        print(f"🧹 Cleared {directory}")
+        return 0
+
+    names = sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+    if not names:
+        print("🔓 No saved sign-in states")
+    for name in names:
+        with open(os.path.join(directory, name), encoding="utf-8") as handle:
+            state = StorageState(json.load(handle))
+        remaining = state.expires - time.time()
+        status = f"expires in {remaining / 60:.0f} min" if remaining > 0 else "expired"
+        print(f"🔐 {state.account:<28} {len(state.cookies)} cookies, {len(state.local)} localStorage keys  {status}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+import argparse
+import base64
+import hashlib
+import html
+import json
+import os
+import socket
+import secrets
+import sys
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+
+DEFAULT_PORT = 4100
+SESSION_COOKIE = "paw_auth_session"
+
+# Accounts the stand-in accepts; every credential set used by the suite is here
+DEFAULT_USERS = {
+    "testuser@pawfinder.com": {"password": "TestPassword123", "name": "Test User"},
+    "testuser@example.com": {"password": "password123", "name": "Marketplace Tester"},
+}
+DEFAULT_GOOGLE_USER = {"email": "pawfinder.tester@gmail.com", "name": "PawFinder Tester"}
+
+
+PAGE = """<!doctype html>
+<html>
+<head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 0; padding: 24px; }}
+form {{ display: flex; flex-direction: column; gap: 12px; max-width: 360px; }}
+.error {{ color: #c00; }}
+.password-row {{ display: flex; gap: 8px; }}
+</style>
+</head>
+<body>{body}</body>
+</html>
+"""
+
+SIGN_IN_BODY = """
+<h1>Sign in to PawFinder</h1>
+<button type="button" id="google" data-testid="google-signin">Continue with Google</button>
+<form method="post" action="/embed/sign-in" novalidate>
+  <input type="hidden" name="redirect_url" value="{redirect_url}">
+  <label for="email">Email address</label>
+  <input type="email" id="email" name="email" required placeholder="Email" value="{email}">
+  <label for="password">Password</label>
+  <div class="password-row">
+    <input type="password" id="password" name="password" required placeholder="Password">
+    <button type="button" class="password-toggle" aria-label="Show password"
+            onclick="const p = document.getElementById('password'); p.type = p.type === 'password' ? 'text' : 'password';">Show</button>
+  </div>
+  <label><input type="checkbox" id="remember" name="remember"> Remember me</label>
+  {error}
+  <button type="submit">Sign in</button>
+</form>
+<script>
+const redirectUrl = {redirect_json};
+document.getElementById('google').addEventListener('click', () => {{
+  window.open({google_json}, 'google-oauth', 'width=480,height=640');
+}});
+window.addEventListener('message', event => {{
+  if (event.data && event.data.type === 'pawfinder-auth' && event.data.ok) {{
+    window.top.location = redirectUrl;
+  }}
+}});
+</script>
+"""
+
+# Ends the flow: tell the opener (the sign-in iframe) and close, or redirect when there is none
+DONE_BODY = """
+<p>Signed in. You can close this window.</p>
+<script>
+if (window.opener) {{
+  window.opener.postMessage({{type: 'pawfinder-auth', ok: true}}, '*');
+  window.close();
+}} else {{
+  window.top.location = {redirect_json};
+}}
+</script>
+"""
+
+
+def _b64(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def id_token(issuer, audience, user):
+    """Unsigned (alg: none) JWT with the claims a Google id_token carries"""
+    now = int(time.time())
+    claims = {
+        "iss": issuer, "aud": audience, "sub": user["sub"], "email": user["email"],
+        "email_verified": True, "name": user["name"], "iat": now, "exp": now + 3600,
+    }
+    return f"{_b64({'alg': 'none', 'typ': 'JWT'})}.{_b64(claims)}."
+
+
+class AuthStub:
+    """In-process stand-in for the hosted sign-in widget and Google's OAuth endpoints.
+
+    Sign-in widget:  GET/POST /embed/sign-in, GET /v1/session, GET /sign-out
+    Google OAuth:    GET /o/oauth2/v2/auth, POST /token, GET /oauth2/v3/userinfo
+    Provider side:   GET /oauth/callback (exchanges the code, sets the session, closes the popup)
+
+    The authorize endpoint consents immediately, so the whole popup flow takes a
+    few redirects instead of a human at a Google login page.
+    """
+
+    def __init__(self, port=DEFAULT_PORT, host="127.0.0.1", users=None, google_user=None,
+                 app_origin="http://localhost:3000", latency_ms=0):
+        self.host = host
+        self.port = port
+        self.users = dict(DEFAULT_USERS if users is None else users)
+        self.google_user = dict(DEFAULT_GOOGLE_USER if google_user is None else google_user)
+        self.app_origin = app_origin
+        self.latency_ms = latency_ms
+        self.codes = {}
+        self.tokens = {}
+        self.sessions = {}
+        self.lock = threading.Lock()
+        self.server = None
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://localhost:{self.port}"
+
+    def start(self):
+        """Serve on a background thread; port=0 picks a free port"""
+        handler = type("Handler", (_Handler,), {"stub": self})
+        self.server = ThreadingHTTPServer((self.host, self.port), handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def check_password(self, email, password):
+        user = self.users.get(email.strip().lower())
+        return user is not None and user["password"] == password
+
+    def new_session(self, email, name):
+        session_id = secrets.token_urlsafe(24)
+        with self.lock:
+            self.sessions[session_id] = {"email": email, "name": name, "created": time.time()}
+        return session_id
+
+    def issue_code(self, client_id, redirect_uri):
+        code = secrets.token_urlsafe(16)
+        user = dict(self.google_user, sub=hashlib.sha1(self.google_user["email"].encode("utf-8")).hexdigest()[:21])
+        with self.lock:
+            self.codes[code] = {"client_id": client_id, "redirect_uri": redirect_uri, "user": user}
+        return code
+
+    def redeem_code(self, code):
+        """Tokens for a code, or None if the code is unknown or already used"""
+        with self.lock:
+            grant = self.codes.pop(code, None)
+        if grant is None:
+            return None
+        access_token = secrets.token_urlsafe(24)
+        with self.lock:
+            self.tokens[access_token] = grant["user"]
+        return {
+            "access_token": access_token, "token_type": "Bearer", "expires_in": 3600,
+            "scope": "openid email profile",
+            "id_token": id_token(self.url, grant["client_id"], grant["user"]),
+        }
+
+    def google_authorize_url(self, redirect_url):
+        query = urlencode({
+            "client_id": "pawfinder-stub", "response_type": "code", "scope": "openid email profile",
+            "redirect_uri": f"{self.url}/oauth/callback", "state": redirect_url,
+        })
+        return f"{self.url}/o/oauth2/v2/auth?{query}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    stub = None
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out as separate writes; without this, keep-alive
+        # responses stall ~40ms on delayed ACKs
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_OPTIONS(self):
+        self._send(204, b"", "text/plain")
+
+    def do_GET(self):
+        self._delay()
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        routes = {
+            "/embed/sign-in": self._sign_in_page,
+            "/o/oauth2/v2/auth": self._authorize,
+            "/oauth/callback": self._callback,
+            "/oauth2/v3/userinfo": self._userinfo,
+            "/v1/session": self._session,
+            "/sign-out": self._sign_out,
+            "/health": lambda query: self._json(200, {"ok": True}),
+        }
+        route = routes.get(parts.path)
+        if route is None:
+            self._json(404, {"error": "not_found"})
+        else:
+            route(query)
+
+    def do_POST(self):
+        self._delay()
+        length = int(self.headers.get("Content-Length") or 0)
+        form = {key: values[-1] for key, values in parse_qs(self.rfile.read(length).decode("utf-8")).items()}
+        path = urlsplit(self.path).path
+        if path == "/embed/sign-in":
+            self._sign_in_submit(form)
+        elif path == "/token":
+            self._token(form)
+        else:
+            self._json(404, {"error": "not_found"})
+
+    # Sign-in widget
+
+    def _sign_in_page(self, query, email="", error=""):
+        redirect_url = query.get("redirect_url") or self.stub.app_origin + "/"
+        body = SIGN_IN_BODY.format(
+            redirect_url=html.escape(redirect_url), email=html.escape(email),
+            error=f'<p class="error" role="alert">{html.escape(error)}</p>' if error else "",
+            redirect_json=json.dumps(redirect_url),
+            google_json=json.dumps(self.stub.google_authorize_url(redirect_url)),
+        )
+        self._page(200, "Sign in", body)
+
+    def _sign_in_submit(self, form):
+        email = form.get("email", "")
+        redirect_url = form.get("redirect_url") or self.stub.app_origin + "/"
+        if "@" not in email:
+            return self._sign_in_page({"redirect_url": redirect_url}, email, "Enter a valid email address")
+        if not self.stub.check_password(email, form.get("password", "")):
+            return self._sign_in_page({"redirect_url": redirect_url}, email, "Incorrect email or password")
+
+        user = self.stub.users[email.strip().lower()]
+        session_id = self.stub.new_session(email.strip().lower(), user["name"])
+        self._page(200, "Signed in", DONE_BODY.format(redirect_json=json.dumps(redirect_url)),
+                   cookie=session_id)
+
+    def _session(self, query):
+        session = self.stub.sessions.get(self._cookie())
+        if session is None:
+            return self._json(200, {"signed_in": False})
+        self._json(200, {"signed_in": True, "user": {"email": session["email"], "name": session["name"]}})
+
+    def _sign_out(self, query):
+        with self.stub.lock:
+            self.stub.sessions.pop(self._cookie(), None)
+        redirect_url = query.get("redirect_url") or self.stub.app_origin + "/"
+        self._redirect(redirect_url, cookie="")
+
+    # Google OAuth
+
+    def _authorize(self, query):
+        redirect_uri = query.get("redirect_uri")
+        if not redirect_uri or query.get("response_type", "code") != "code":
+            return self._json(400, {"error": "invalid_request"})
+        code = self.stub.issue_code(query.get("client_id", ""), redirect_uri)
+        separator = "&" if "?" in redirect_uri else "?"
+        self._redirect(f"{redirect_uri}{separator}{urlencode({'code': code, 'state': query.get('state', '')})}")
+
+    def _token(self, form):
+        if form.get("grant_type", "authorization_code") != "authorization_code":
+            return self._json(400, {"error": "unsupported_grant_type"})
+        tokens = self.stub.redeem_code(form.get("code", ""))
+        if tokens is None:
+            return self._json(400, {"error": "invalid_grant"})
+        self._json(200, tokens)
+
+    def _userinfo(self, query):
+        token = self.headers.get("Authorization", "").replace("Bearer ", "", 1)
+        user = self.stub.tokens.get(token)
+        if user is None:
+            return self._json(401, {"error": "invalid_token"})
+        self._json(200, {"sub": user["sub"], "email": user["email"], "email_verified": True, "name": user["name"]})
+
+    def _callback(self, query):
+        tokens = self.stub.redeem_code(query.get("code", ""))
+        if tokens is None:
+            return self._page(400, "Sign-in failed", '<p class="error">Sign-in failed</p>')
+        user = self.stub.tokens[tokens["access_token"]]
+        session_id = self.stub.new_session(user["email"], user["name"])
+        redirect_url = query.get("state") or self.stub.app_origin + "/"
+        self._page(200, "Signed in", DONE_BODY.format(redirect_json=json.dumps(redirect_url)),
+                   cookie=session_id)
+
+    # Plumbing
+
+    def _delay(self):
+        if self.stub.latency_ms:
+            time.sleep(self.stub.latency_ms / 1000)
+
+    def _cookie(self):
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookies[SESSION_COOKIE].value if SESSION_COOKIE in cookies else None
+
+    def _headers(self, cookie):
+        origin = self.headers.get("Origin")
+        if origin:
+            self.send_header("Access-Control-Allow-Origin", origin)
+            self.send_header("Access-Control-Allow-Credentials", "true")
+            self.send_header("Access-Control-Allow-Headers", "Authorization, Content-Type")
+        if cookie is not None:
+            max_age = 0 if cookie == "" else 86400
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}={cookie}; Path=/; Max-Age={max_age}; HttpOnly; SameSite=Lax")
+
+    def _send(self, status, payload, content_type, cookie=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Cache-Control", "no-store")
+        self._headers(cookie)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _page(self, status, title, body, cookie=None):
+        payload = PAGE.format(title=html.escape(title), body=body).encode("utf-8")
+        self._send(status, payload, "text/html; charset=utf-8", cookie)
+
+    def _json(self, status, data):
+        self._send(status, json.dumps(data).encode("utf-8"), "application/json")
+
+    def _redirect(self, location, cookie=None):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self._headers(cookie)
+        self.end_headers()
+
+
+def stub_url():
+    """URL of the stand-in the suite was started with, or None when the real provider is used"""
+    return os.environ.get("PAWFINDER_AUTH_STUB") or None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the sign-in provider and Google OAuth")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--users", help="JSON file of {email: {password, name}} to accept")
+    parser.add_argument("--app-origin", default="http://localhost:3000",
+                        help="where to send the browser after sign-in by default")
+    parser.add_argument("--latency-ms", type=int, default=0, help="delay added to every response")
+    args = parser.parse_args(argv)
+
+    users = None
+    if args.users:
+        with open(args.users, encoding="utf-8") as handle:
+            users = {email.lower(): user for email, user in json.load(handle).items()}
+
+    stub = AuthStub(args.port, args.host, users, app_origin=args.app_origin, latency_ms=args.latency_ms).start()
+    print(f"🔑 Auth stand-in on {stub.url} (sign-in widget at {stub.url}/embed/sign-in)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stub.stop()
+        print("🧹 Auth stand-in stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+import argparse
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from selenium import webdriver # type: ignore
+from selenium.webdriver.chrome.options import Options # type: ignore
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection # type: ignore
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Union of the flags MarketplaceTests and VeterinaryPageTests use in setup_driver, headless
+CHROME_FLAGS = [
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+
+
+def state_dir():
+    return os.environ.get(
+        "PAWFINDER_DAEMON_DIR", os.path.join(tempfile.gettempdir(), "pawfinder-browser-daemon")
+    )
+
+
+def state_path():
+    return os.path.join(state_dir(), "state.json")
+
+
+def read_state():
+    try:
+        with open(state_path(), encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def daemon_running(state):
+    """The state file survives a hard kill, so ask chromedriver whether it is really up"""
+    try:
+        urllib.request.urlopen(f"{state['chromedriver']}/status", timeout=1).close()
+        return True
+    except OSError:
+        return False
+
+
+def find_binaries(chrome=None, chromedriver=None):
+    """Locate Chrome and chromedriver the same way webdriver.Chrome() would"""
+    chrome = chrome or os.environ.get("CHROME_BIN")
+    chromedriver = chromedriver or os.environ.get("CHROMEDRIVER") or shutil.which("chromedriver")
+    if not chrome:
+        for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"):
+            chrome = shutil.which(name)
+            if chrome:
+                break
+
+    if not chrome or not chromedriver:
+        from selenium.webdriver.common.selenium_manager import SeleniumManager # type: ignore
+        paths = SeleniumManager().binary_paths(["--browser", "chrome"])
+        chrome = chrome or paths.get("browser_path")
+        chromedriver = chromedriver or paths.get("driver_path")
+    return chrome, chromedriver
+
+
+class BrowserDaemon:
+    """Keeps a chromedriver and N headless Chrome instances warm for test processes to attach to"""
+
+    def __init__(self, size=4, port_base=9300, chrome=None, chromedriver=None):
+        self.size = size
+        self.port_base = port_base
+        self.chrome, self.chromedriver = find_binaries(chrome, chromedriver)
+        self.chromedriver_process = None
+        self.browsers = []
+
+    def start(self):
+        os.makedirs(state_dir(), exist_ok=True)
+        self.chromedriver_process = self._start_chromedriver()
+        for slot in range(self.size):
+            self.browsers.append(self._start_chrome(slot))
+        for browser in self.browsers:
+            self._wait_for_devtools(browser["debugger_address"])
+        self._write_state()
+        print(f"🔥 {self.size} warm Chrome instances ready (chromedriver {self.chromedriver_url})")
+
+    @property
+    def chromedriver_url(self):
+        return f"http://127.0.0.1:{self.port_base}"
+
+    def serve_forever(self, interval=2.0):
+        """Restart anything that dies until stopped"""
+        while True:
+            time.sleep(interval)
+            if self.chromedriver_process.poll() is not None:
+                print("⚠️  chromedriver exited, restarting")
+                self.chromedriver_process = self._start_chromedriver()
+            for index, browser in enumerate(self.browsers):
+                if browser["process"].poll() is not None:
+                    print(f"⚠️  Chrome slot {browser['slot']} exited, restarting")
+                    self.browsers[index] = self._start_chrome(browser["slot"])
+                    self._wait_for_devtools(self.browsers[index]["debugger_address"])
+
+    def stop(self):
+        processes = [browser["process"] for browser in self.browsers]
+        if self.chromedriver_process is not None:
+            processes.append(self.chromedriver_process)
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        try:
+            os.remove(state_path())
+        except OSError:
+            pass
+        print("🧹 Browser daemon stopped")
+
+    def _start_chromedriver(self):
+        return subprocess.Popen(
+            [self.chromedriver, f"--port={self.port_base}"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+    def _start_chrome(self, slot):
+        port = self.port_base + 1 + slot
+        profile = os.path.join(state_dir(), f"profile-{slot}")
+        process = subprocess.Popen(
+            [self.chrome, *CHROME_FLAGS, f"--remote-debugging-port={port}",
+             f"--user-data-dir={profile}", "about:blank"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        return {"slot": slot, "debugger_address": f"127.0.0.1:{port}", "process": process}
+
+    def _wait_for_devtools(self, address, timeout=30):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                urllib.request.urlopen(f"http://{address}/json/version", timeout=1).close()
+                return
+            except OSError:
+                time.sleep(0.1)
+        raise RuntimeError(f"Chrome at {address} did not come up within {timeout}s")
+
+    def _write_state(self):
+        state = {
+            "pid": os.getpid(),
+            "chromedriver": self.chromedriver_url,
+            "flags": CHROME_FLAGS,
+            "browsers": [
+                {"slot": browser["slot"], "debugger_address": browser["debugger_address"]}
+                for browser in self.browsers
+            ],
+        }
+        temp_path = state_path() + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(state, handle, indent=2)
+        os.replace(temp_path, state_path())
+
+
+def _try_lock(handle):
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def lease_browser():
+    """Reserve a free warm browser; the OS drops the lock if this process dies"""
+    state = read_state()
+    if not state or not daemon_running(state):
+        return None, None
+
+    for browser in state["browsers"]:
+        handle = open(os.path.join(state_dir(), f"slot-{browser['slot']}.lock"), "a+")
+        if _try_lock(handle):
+            return state, (browser, handle)
+        handle.close()
+    return state, None
+
+
+def _flag(argument):
+    # Plain --headless is the new headless mode in current Chrome
+    return "--headless=new" if argument == "--headless" else argument
+
+
+def serves(state, options):
+    """Whether the daemon's browsers were started with every flag these options ask for.
+
+    Headless mode has to match both ways: options without --headless want a headed
+    window, which the daemon's headless browsers cannot give them.
+    """
+    if options.experimental_options or options.extensions or options.binary_location:
+        return False
+    flags = {_flag(argument) for argument in state.get("flags", CHROME_FLAGS)}
+    requested = {_flag(argument) for argument in options.arguments}
+    headless = {flag for flag in flags if flag.startswith("--headless")}
+    if headless != {flag for flag in requested if flag.startswith("--headless")}:
+        return False
+    return requested <= flags
+
+
+def attach_driver(options):
+    """WebDriver session on a warm daemon browser, or None when no daemon/slot is available.
+
+    Helpers that need flags the daemon's Chrome was not started with (headed windows,
+    their own profile, ...) get None too, so they launch the browser they asked for.
+    """
+    state = read_state()
+    if state is not None and not serves(state, options):
+        return None
+    state, lease = lease_browser()
+    if lease is None:
+        return None
+
+    browser, handle = lease
+    options = Options()
+    options.debugger_address = browser["debugger_address"]
+    try:
+        executor = ChromiumRemoteConnection(state["chromedriver"], "goog", "chrome")
+        driver = webdriver.Remote(command_executor=executor, options=options)
+    except Exception:
+        handle.close()
+        return None
+
+    driver._daemon_lease = handle
+    # webdriver.Remote has no execute_cdp_cmd; chromedriver still serves the endpoint
+    driver.execute_cdp_cmd = lambda cmd, params: driver.execute(
+        "executeCdpCommand", {"cmd": cmd, "params": params}
+    )["value"]
+    return driver
+
+
+def detach_driver(driver):
+    """End the session without killing the daemon's Chrome, and free its slot"""
+    try:
+        driver.quit()
+    finally:
+        lease = getattr(driver, "_daemon_lease", None)
+        if lease is not None:
+            lease.close()
+
+
+def stop_daemon():
+    state = read_state()
+    if not state:
+        print("ℹ️  No browser daemon running")
+        return 1
+    os.kill(state["pid"], signal.SIGTERM)
+    print(f"🛑 Sent stop to browser daemon (pid {state['pid']})")
+    return 0
+
+
+def print_status():
+    state = read_state()
+    if not state:
+        print("ℹ️  No browser daemon running")
+        return 1
+
+    print(f"🔥 Browser daemon pid {state['pid']}, chromedriver {state['chromedriver']}")
+    for browser in state["browsers"]:
+        with open(os.path.join(state_dir(), f"slot-{browser['slot']}.lock"), "a+") as handle:
+            status = "idle" if _try_lock(handle) else "leased"
+        print(f"   slot {browser['slot']}: {browser['debugger_address']} ({status})")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep warm headless Chrome instances for the test suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+    start = commands.add_parser("start", help="run the daemon in the foreground")
+    start.add_argument("-n", "--size", type=int, default=os.cpu_count() or 2)
+    start.add_argument("--port-base", type=int, default=9300)
+    commands.add_parser("stop", help="stop a running daemon")
+    commands.add_parser("status", help="show warm browsers and their leases")
+    args = parser.parse_args(argv)
+
+    if args.command == "stop":
+        return stop_daemon()
+    if args.command == "status":
+        return print_status()
+
+    state = read_state()
+    if state and daemon_running(state):
+        print(f"❌ A daemon is already running (see {state_path()})")
+        return 1
+
+    daemon = BrowserDaemon(size=args.size, port_base=args.port_base)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        daemon.start()
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
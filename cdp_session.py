@@ -0,0 +1,116 @@
+import itertools
+import json
+import threading
+from concurrent.futures import Future
+from urllib.request import urlopen
+
+import websocket # type: ignore
+
+
+def debugger_address(driver):
+    """host:port of the browser's DevTools endpoint, as reported by chromedriver"""
+    return driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+
+
+class CdpSession:
+    """Browser-level DevTools connection that, unlike execute_cdp_cmd, also delivers events.
+
+    Handlers registered with on() run on the reader thread, so they must use
+    send_async(): a blocking send() there would wait on the thread that reads its reply.
+    """
+
+    def __init__(self, address):
+        with urlopen(f"http://{address}/json/version", timeout=5) as response:
+            url = json.load(response)["webSocketDebuggerUrl"]
+        # Chrome rejects DevTools websockets that send an Origin it does not allow
+        self.ws = websocket.create_connection(url, suppress_origin=True, enable_multithread=True)
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._handlers = {}
+        self._lock = threading.Lock()
+        self.closed = False
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    @classmethod
+    def for_driver(cls, driver):
+        return cls(debugger_address(driver))
+
+    def on(self, method, handler):
+        """handler(params, session_id) for every event of this method, on any attached target"""
+        self._handlers.setdefault(method, []).append(handler)
+
+    def send_async(self, method, params=None, session_id=None):
+        message_id = next(self._ids)
+        future = Future()
+        with self._lock:
+            self._pending[message_id] = future
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        try:
+            self.ws.send(json.dumps(message))
+        except Exception as error:
+            with self._lock:
+                self._pending.pop(message_id, None)
+            future.set_exception(error)
+        return future
+
+    def send(self, method, params=None, session_id=None, timeout=10):
+        return self.send_async(method, params, session_id).result(timeout)
+
+    def attach_pages(self, on_attached):
+        """Call on_attached(session_id) for every page tab, now and whenever one opens.
+
+        on_attached runs on the reader thread, with the same rules as on() handlers.
+        """
+        attached = set()
+        lock = threading.Lock()
+
+        def attach(target):
+            with lock:
+                if target.get("type") != "page" or target["targetId"] in attached:
+                    return
+                attached.add(target["targetId"])
+            future = self.send_async("Target.attachToTarget", {"targetId": target["targetId"], "flatten": True})
+            future.add_done_callback(lambda done: done.exception() or on_attached(done.result()["sessionId"]))
+
+        self.on("Target.targetCreated", lambda params, session_id: attach(params["targetInfo"]))
+        self.send("Target.setDiscoverTargets", {"discover": True})
+        for target in self.send("Target.getTargets")["targetInfos"]:
+            attach(target)
+
+    def close(self):
+        self.closed = True
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+
+    def _read(self):
+        while not self.closed:
+            try:
+                message = json.loads(self.ws.recv())
+            except Exception:
+                break
+            if "id" in message:
+                with self._lock:
+                    future = self._pending.pop(message["id"], None)
+                if future is None:
+                    continue
+                if "error" in message:
+                    future.set_exception(RuntimeError(message["error"].get("message", "CDP error")))
+                else:
+                    future.set_result(message.get("result", {}))
+                continue
+            for handler in self._handlers.get(message.get("method"), []):
+                try:
+                    handler(message.get("params", {}), message.get("sessionId"))
+                except Exception:
+                    pass
+
+        self.closed = True
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(ConnectionError("DevTools connection closed"))
@@ -0,0 +1,31 @@
+def listen(driver, listener):
+    """Route every WebDriver command this driver sends through listener(command, params, run).
+
+    The listener must call run() (which sends the command, or hands it to the next
+    listener) and return its result. Listeners wrap in the order they were added,
+    the first one outermost. Only this driver instance is affected.
+    """
+    listeners = driver.__dict__.setdefault("_command_listeners", [])
+    if not listeners:
+        original = type(driver).execute.__get__(driver)
+
+        def execute(command, params=None):
+            return _dispatch(list(driver._command_listeners), command, params, lambda: original(command, params))
+
+        driver.execute = execute
+    listeners.append(listener)
+
+
+def unlisten(driver, listener):
+    listeners = driver.__dict__.get("_command_listeners") or []
+    if listener in listeners:
+        listeners.remove(listener)
+    if not listeners and "execute" in driver.__dict__:
+        del driver.execute
+
+
+def _dispatch(listeners, command, params, send):
+    if not listeners:
+        return send()
+    first, rest = listeners[0], listeners[1:]
+    return first(command, params, lambda: _dispatch(rest, command, params, send))
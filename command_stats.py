@@ -0,0 +1,161 @@
+import json
+import os
+import sys
+import threading
+import time
+
+from selenium.webdriver.remote.command import Command # type: ignore
+
+import command_hooks
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Histogram bucket upper bounds in ms; the last bucket is everything slower
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+# Frames inside these never count as the call site
+PLUMBING = {"command_stats.py", "command_hooks.py", "driver_pool.py", "timeline.py", "web_vitals.py"}
+
+# Selenium sends get_attribute and is_displayed as executeScript with an atom
+SCRIPT_ATOMS = {"/* getAttribute */": "get_attribute", "/* isDisplayed */": "is_displayed", "/* submitForm */": "submit"}
+
+
+def command_name(command, params):
+    if command in (Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC) and params:
+        script = params.get("script") or ""
+        for prefix, name in SCRIPT_ATOMS.items():
+            if script.startswith(prefix):
+                return name
+    return command
+
+
+def call_site():
+    """file:line of the innermost test module frame, else of the innermost repo frame"""
+    frame = sys._getframe(2)
+    fallback = None
+    while frame is not None:
+        path = frame.f_code.co_filename
+        name = os.path.basename(path)
+        if os.path.dirname(os.path.abspath(path)) == HERE and name not in PLUMBING:
+            site = f"{name}:{frame.f_lineno} {frame.f_code.co_name}"
+            if name.startswith("test_"):
+                return site
+            fallback = fallback or site
+        frame = frame.f_back
+    return fallback or "(outside the suite)"
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        index = next((i for i, bound in enumerate(BUCKETS_MS) if ms <= bound), len(BUCKETS_MS))
+        self.counts[index] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, pct):
+        """Upper bound of the bucket holding the pct-th sample (the max for the overflow bucket)"""
+        rank = pct / 100 * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(BUCKETS_MS[index], self.max_ms) if index < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def bars(self):
+        peak = max(self.counts) or 1
+        return "".join(" ▁▂▃▄▅▆▇█"[min(8, round(count / peak * 8))] if count else "·" for count in self.counts)
+
+    def to_dict(self):
+        return {
+            "buckets_ms": BUCKETS_MS, "counts": self.counts, "total": self.total,
+            "mean_ms": round(self.sum_ms / self.total, 3) if self.total else None, "max_ms": round(self.max_ms, 3),
+        }
+
+
+class CommandStats:
+    """Round trips to chromedriver: per command type, per test and per call site"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}
+        self.per_test = {}
+        self.sites = {}
+        self.test = None
+
+    def add(self, name, ms, site):
+        with self._lock:
+            self.histograms.setdefault(name, Histogram()).add(ms)
+            counts = self.per_test.setdefault(self.test or "(outside tests)", {})
+            counts[name] = counts.get(name, 0) + 1
+            entry = self.sites.setdefault(site, {"count": 0, "ms": 0.0, "commands": {}})
+            entry["count"] += 1
+            entry["ms"] += ms
+            entry["commands"][name] = entry["commands"].get(name, 0) + 1
+
+    @property
+    def total(self):
+        return sum(histogram.total for histogram in self.histograms.values())
+
+    def report(self, top=10):
+        if not self.histograms:
+            return []
+        total_ms = sum(histogram.sum_ms for histogram in self.histograms.values())
+        lines = [f"📡 WebDriver commands: {self.total} round trips, {total_ms / 1000:.1f}s"]
+        lines.append(f"   {'command':<24} {'n':>6} {'mean':>7} {'p50':>6} {'p95':>6} {'max':>7}  "
+                     f"histogram {BUCKETS_MS[0]}ms…>{BUCKETS_MS[-1]}ms")
+        for name, histogram in sorted(self.histograms.items(), key=lambda item: -item[1].total):
+            lines.append(
+                f"   {name:<24} {histogram.total:>6} {histogram.sum_ms / histogram.total:>6.1f} "
+                f"{histogram.percentile(50):>6.0f} {histogram.percentile(95):>6.0f} {histogram.max_ms:>7.0f}  "
+                f"{histogram.bars()}"
+            )
+
+        lines.append("   Most round trips per test:")
+        tests = sorted(self.per_test.items(), key=lambda item: -sum(item[1].values()))
+        for test, counts in tests[:top]:
+            busiest = ", ".join(f"{name} {count}" for name, count in sorted(counts.items(), key=lambda item: -item[1])[:3])
+            lines.append(f"   {sum(counts.values()):>6}  {test}  ({busiest})")
+
+        lines.append("   Call sites generating the most round trips:")
+        for site, entry in sorted(self.sites.items(), key=lambda item: -item[1]["count"])[:top]:
+            busiest = ", ".join(
+                f"{name} {count}" for name, count in sorted(entry["commands"].items(), key=lambda item: -item[1])[:3]
+            )
+            lines.append(f"   {entry['count']:>6}  {entry['ms'] / 1000:>5.1f}s  {site}  ({busiest})")
+        return lines
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({
+                "commands": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+                "tests": self.per_test,
+                "call_sites": self.sites,
+            }, handle, indent=2)
+
+
+stats = CommandStats()
+
+
+def _on_command(command, params, run):
+    start = time.perf_counter()
+    try:
+        return run()
+    finally:
+        stats.add(command_name(command, params), (time.perf_counter() - start) * 1000, call_site())
+
+
+def start_counting(driver):
+    """driver_pool acquire hook"""
+    command_hooks.listen(driver, _on_command)
+
+
+def stop_counting(driver):
+    """driver_pool release hook"""
+    command_hooks.unlisten(driver, _on_command)
@@ -0,0 +1,333 @@
+import pytest # type: ignore
+
+import os
+
+import api_replay
+import app_stub
+import auth_stub
+import command_stats
+import driver_pool
+import interaction_profiler
+import perf_budgets
+import perf_trace
+import request_policy
+import selector_cache
+import timeline
+import timing_store
+import web_vitals
+
+
+POOL_KEY = pytest.StashKey()
+BUDGET_KEY = pytest.StashKey()
+REGRESSIONS_KEY = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("pawfinder")
+    group.addoption(
+        "--no-driver-pool", action="store_true", default=False,
+        help="Launch a fresh Chrome for every test instead of reusing pooled drivers"
+    )
+    group.addoption(
+        "--strict-hooks", action="store_true", default=False,
+        help="Fail the test when a browser hook (interception, API tap, vitals, tracing) cannot be set up"
+    )
+    group.addoption(
+        "--auth-stub", action="store_true", default=False,
+        help="Serve the local sign-in/Google OAuth stand-in for the run"
+    )
+    group.addoption(
+        "--auth-stub-port", type=int, default=auth_stub.DEFAULT_PORT, metavar="PORT",
+        help="Port for --auth-stub (default %d)" % auth_stub.DEFAULT_PORT
+    )
+    group.addoption(
+        "--app-stub", action="store_true", default=False,
+        help="Serve the local PawFinder stand-in on port %d for the run" % app_stub.DEFAULT_PORT
+    )
+    group.addoption(
+        "--app-stub-data", default="default", metavar="DATA",
+        help="Seeded data set for --app-stub: default, empty, large or a JSON file"
+    )
+    group.addoption(
+        "--intercept", action="store", default=None, metavar="POLICY",
+        help="Request policy for test browsers: functional, third-party, off, or a JSON file "
+             "(default: off when performance budgets are checked, otherwise functional)"
+    )
+    group.addoption(
+        "--api-mode", choices=("record", "replay"), default=None,
+        help="Record XHR/fetch responses to the API archive, or replay them from it instead of the backend"
+    )
+    group.addoption(
+        "--api-archive", default=None, metavar="DIR",
+        help="API archive directory (default .api_archive, or PAWFINDER_API_ARCHIVE)"
+    )
+    group.addoption(
+        "--api-strict", action="store_true", default=False,
+        help="With --api-mode replay, fail requests (and the test) that are not in the archive"
+    )
+    group.addoption(
+        "--vitals-json", default=None, metavar="PATH",
+        help="Write TTFB/FCP/LCP/CLS/DOMContentLoaded/load/hydration for every navigation to PATH"
+    )
+    group.addoption(
+        "--budgets", default=perf_budgets.DEFAULT_PATH, metavar="PATH",
+        help="Per-route performance budget file checked at the end of the run (default perf_budgets.json)"
+    )
+    group.addoption(
+        "--no-budgets", action="store_true", default=False,
+        help="Report navigations but do not fail the run on exceeded budgets"
+    )
+    group.addoption(
+        "--command-stats", action="store_true", default=False,
+        help="Count WebDriver round trips per test, command type and call site, with latency histograms"
+    )
+    group.addoption(
+        "--command-stats-json", default=None, metavar="PATH",
+        help="Also save the --command-stats counts and histograms to PATH as JSON (implies --command-stats)"
+    )
+    group.addoption(
+        "--timing-store", default=None, metavar="PATH",
+        help="SQLite file every run's test durations and route metrics (and --command-stats counts) are saved to "
+             "(default .timings.sqlite, or PAWFINDER_TIMING_DB)"
+    )
+    group.addoption(
+        "--no-timing-store", action="store_true", default=False,
+        help="Do not save this run or check it for regressions"
+    )
+    group.addoption(
+        "--fail-on-regression", action="store_true", default=False,
+        help="Fail the run when a test or route is significantly slower than its rolling baseline"
+    )
+    group.addoption(
+        "--trace-slow", type=float, default=os.environ.get("PAWFINDER_TRACE_SLOW_MS"), metavar="MS",
+        help="Save a DevTools performance trace whenever a navigation or interaction takes MS or longer "
+             "(default PAWFINDER_TRACE_SLOW_MS; off when unset)"
+    )
+    group.addoption(
+        "--trace-dir", default=None, metavar="DIR",
+        help="Where slow-step traces go (default: the repository root, next to test_screenshot)"
+    )
+    group.addoption(
+        "--soak-cycles", type=int, default=0, metavar="N",
+        help="Run the memory soak (test_memory_soak.py) for N navigation cycles; skipped when 0"
+    )
+    group.addoption(
+        "--soak-limits", default=None, metavar="LIMITS",
+        help="Allowed growth per cycle, e.g. heap_kb=512,nodes=200,listeners=50"
+    )
+    group.addoption(
+        "--timeline", default=None, metavar="DIR",
+        help="Profile where wall time goes (Chrome startup, sleeps, waits, navigation, test code) "
+             "and write a per-test, per-worker timeline to DIR as JSON and HTML"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "intercept(policy): request policy for this test's browsers, overriding --intercept"
+    )
+    driver_pool.strict_hooks(config.getoption("--strict-hooks"))
+    if config.getoption("--intercept") is None:
+        # Budgets need real fonts, media and images; stubbed pages would leave routes unjudged
+        config.option.intercept = "off" if budgets_checked(config) else "functional"
+    driver_pool.add_driver_hook(request_policy.start_interception, request_policy.stop_interception)
+    api_replay.configure(
+        config.getoption("--api-mode"), config.getoption("--api-strict"), config.getoption("--api-archive")
+    )
+    driver_pool.add_driver_hook(api_replay.start_tap, api_replay.stop_tap)
+    driver_pool.add_driver_hook(web_vitals.start_collecting, web_vitals.stop_collecting)
+    perf_trace.configure(config.getoption("--trace-slow"), config.getoption("--trace-dir"))
+    driver_pool.add_driver_hook(perf_trace.start_tracing, perf_trace.stop_tracing)
+    if not config.getoption("--no-timing-store"):
+        timing_store.current = timing_store.RunTimings()
+    if command_stats_enabled(config):
+        driver_pool.add_driver_hook(command_stats.start_counting, command_stats.stop_counting)
+    if config.getoption("--timeline"):
+        timeline.install(os.environ.get("PAWFINDER_WORKER", "0"))
+
+
+def budgets_checked(config):
+    return not config.getoption("--no-budgets") and os.path.exists(
+        config.getoption("--budgets") or perf_budgets.DEFAULT_PATH
+    )
+
+
+def command_stats_enabled(config):
+    return config.getoption("--command-stats") or config.getoption("--command-stats-json") is not None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_driver_pool(request):
+    """One DriverPool for the whole run; the *Tests helpers borrow from it"""
+    if request.config.getoption("--no-driver-pool"):
+        yield None
+        return
+
+    pool = driver_pool.DriverPool()
+    request.config.stash[POOL_KEY] = pool
+    driver_pool.activate(pool)
+    yield pool
+    driver_pool.deactivate()
+    pool.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def auth_stand_in(request):
+    """The local auth provider, when --auth-stub is given; the app must be configured to use it"""
+    if not request.config.getoption("--auth-stub"):
+        yield None
+        return
+
+    stub = auth_stub.AuthStub(request.config.getoption("--auth-stub-port")).start()
+    os.environ["PAWFINDER_AUTH_STUB"] = stub.url
+    yield stub
+    os.environ.pop("PAWFINDER_AUTH_STUB", None)
+    stub.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app_stand_in(request, auth_stand_in):
+    """The local PawFinder app, when --app-stub is given, so the run needs no dev server"""
+    if not request.config.getoption("--app-stub"):
+        yield None
+        return
+
+    data = app_stub.load_data(request.config.getoption("--app-stub-data"))
+    app = app_stub.AppStub(data=data, auth=auth_stand_in).start()
+    os.environ["PAWFINDER_AUTH_STUB"] = app.auth.url
+    yield app
+    app.stop()
+    if auth_stand_in is None:
+        os.environ.pop("PAWFINDER_AUTH_STUB", None)
+
+
+@pytest.fixture(autouse=True)
+def request_interception(request):
+    """Pick the request policy before the test's helper acquires its driver"""
+    marker = request.node.get_closest_marker("intercept")
+    name = marker.args[0] if marker else request.config.getoption("--intercept")
+    request_policy.set_policy(request_policy.load_policy(name))
+    yield
+    request_policy.set_policy(None)
+
+
+@pytest.fixture(autouse=True)
+def test_name_tags(request):
+    """Tag the navigations, interactions, WebDriver commands and traces a test makes with its node id"""
+    nodeid = request.node.nodeid
+    web_vitals.recorder.test = interaction_profiler.recorder.test = command_stats.stats.test = perf_trace.test = nodeid
+    yield
+    web_vitals.recorder.test = interaction_profiler.recorder.test = command_stats.stats.test = perf_trace.test = None
+
+
+@pytest.fixture(autouse=True)
+def api_archive_misses(request):
+    """In strict replay, a test whose requests were not all recorded fails instead of hitting the backend"""
+    before = len(api_replay.stats.missing)
+    yield
+    missing = api_replay.stats.missing[before:]
+    if missing and api_replay.current_mode() == "replay" and request.config.getoption("--api-strict"):
+        pytest.fail(f"{len(missing)} API requests not in the archive: {', '.join(sorted(set(missing))[:5])}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Attribute profiled time (setup, call and teardown) to the test"""
+    if timeline.recorder is None:
+        yield
+        return
+    timeline.recorder.begin_test(item.nodeid)
+    yield
+    timeline.recorder.end_test()
+
+
+def pytest_runtest_logreport(report):
+    if timing_store.current is not None:
+        timing_store.current.add_report(report)
+    if timeline.recorder is None:
+        return
+    if report.failed:
+        timeline.recorder.set_outcome("failed")
+    elif report.skipped:
+        timeline.recorder.set_outcome("skipped")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session, exitstatus):
+    """Exceeded budgets, untapped browsers in strict replay and (if asked) regressions fail a green run"""
+    config = session.config
+    strict_replay = api_replay.current_mode() == "replay" and config.getoption("--api-strict")
+    if strict_replay and api_replay.stats.untapped and session.exitstatus == 0:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    budgets = None if config.getoption("--no-budgets") else perf_budgets.load_budgets(config.getoption("--budgets"))
+    if budgets is not None:
+        check = perf_budgets.BudgetCheck(budgets, web_vitals.recorder.records)
+        config.stash[BUDGET_KEY] = check
+        if not check.passed and session.exitstatus == 0:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    if timing_store.current is not None and timing_store.current.tests:
+        store = timing_store.TimingStore(config.getoption("--timing-store"))
+        try:
+            store.save_run(
+                timing_store.current, web_vitals.recorder.records, command_stats.stats.per_test, int(session.exitstatus)
+            )
+            regressions = store.regressions(timing_store.current.run_id)
+            if regressions and config.getoption("--fail-on-regression") and session.exitstatus == 0:
+                session.exitstatus = pytest.ExitCode.TESTS_FAILED
+                store.set_exit_status(timing_store.current.run_id, int(session.exitstatus))
+        finally:
+            store.close()
+        config.stash[REGRESSIONS_KEY] = regressions
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    pool = config.stash.get(POOL_KEY, None)
+    if pool is not None:
+        terminalreporter.write_line(pool.summary())
+    for line in driver_pool.hook_report():
+        terminalreporter.write_line(line)
+
+    for line in request_policy.stats.report():
+        terminalreporter.write_line(line)
+    if api_replay.current_mode() is not None:
+        for line in api_replay.stats.report(api_replay.current_mode()):
+            terminalreporter.write_line(line)
+
+    for line in web_vitals.recorder.report():
+        terminalreporter.write_line(line)
+    for line in web_vitals.recorder.weight_report():
+        terminalreporter.write_line(line)
+    for line in interaction_profiler.recorder.report():
+        terminalreporter.write_line(line)
+    vitals_path = config.getoption("--vitals-json")
+    if vitals_path:
+        web_vitals.recorder.save(vitals_path)
+    check = config.stash.get(BUDGET_KEY, None)
+    if check is not None:
+        for line in check.report():
+            terminalreporter.write_line(line)
+
+    for line in perf_trace.report():
+        terminalreporter.write_line(line)
+    regressions = config.stash.get(REGRESSIONS_KEY, None)
+    if regressions is not None:
+        for line in timing_store.report(regressions, timing_store.current.run_id):
+            terminalreporter.write_line(line)
+
+    if command_stats_enabled(config):
+        for line in command_stats.stats.report():
+            terminalreporter.write_line(line)
+        stats_path = config.getoption("--command-stats-json")
+        if stats_path:
+            command_stats.stats.save(stats_path)
+    if timeline.recorder is not None:
+        for line in timeline.recorder.report():
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(f"🕒 Timeline: {timeline.write(config.getoption('--timeline'))}")
+
+    cache = selector_cache.loaded_cache()
+    if cache is not None:
+        cache.save()
+        for line in cache.report():
+            terminalreporter.write_line(line)
@@ -0,0 +1,79 @@
+from selector_resolver import to_candidate
+
+
+# One round trip: tag, attributes, rendered text, box, visibility and state for every match
+SNAPSHOT_JS = """
+const [candidate, given, root] = arguments;
+const scope = root || document;
+let elements = given || [];
+if (candidate) {
+    if (candidate.kind === 'xpath') {
+        const result = document.evaluate(
+            candidate.selector, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        elements = [];
+        for (let i = 0; i < result.snapshotLength; i++) elements.push(result.snapshotItem(i));
+    } else {
+        elements = Array.from(scope.querySelectorAll(candidate.selector));
+    }
+}
+return elements.filter(el => el && el.nodeType === 1).map(el => {
+    const style = window.getComputedStyle(el);
+    const box = el.getBoundingClientRect();
+    const attributes = {};
+    for (const attr of Array.from(el.attributes)) attributes[attr.name] = attr.value;
+    return {
+        element: el,
+        tag: el.tagName.toLowerCase(),
+        attributes: attributes,
+        text: (el.innerText || '').trim(),
+        value: el.value === undefined ? null : el.value,
+        checked: el.checked === undefined ? null : el.checked,
+        labels: el.labels ? Array.from(el.labels).map(label => (label.innerText || '').trim()) : [],
+        rect: {x: box.x, y: box.y, width: box.width, height: box.height},
+        visible: el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+        enabled: !el.disabled
+    };
+});
+"""
+
+
+class ElementSnapshot:
+    """Plain-data view of one element, captured in bulk by snapshot()"""
+
+    def __init__(self, data):
+        self.element = data["element"]
+        self.tag = data["tag"]
+        self.attributes = data["attributes"]
+        self.text = data["text"]
+        self.value = data["value"]
+        self.checked = data["checked"]
+        self.labels = data["labels"]
+        self.rect = data["rect"]
+        self.height = data["rect"]["height"]
+        self.visible = data["visible"]
+        self.enabled = data["enabled"]
+
+    def attr(self, name, default=None):
+        return self.attributes.get(name, default)
+
+    def __repr__(self):
+        return f"<{self.tag} {self.attributes} visible={self.visible}>"
+
+
+def snapshot(driver, target, within=None, visible_only=False):
+    """Snapshot every element matching a selector (CSS or XPath), or a given list of elements.
+
+    Replaces per-element get_attribute / .text / is_displayed loops, which cost
+    one WebDriver round trip per element per property.
+    """
+    if isinstance(target, (str, tuple)):
+        rows = driver.execute_script(SNAPSHOT_JS, to_candidate(target), None, within)
+    else:
+        elements = target if isinstance(target, list) else [target]
+        rows = driver.execute_script(SNAPSHOT_JS, None, elements, within)
+
+    snapshots = [ElementSnapshot(row) for row in rows]
+    if visible_only:
+        snapshots = [item for item in snapshots if item.visible]
+    return snapshots
@@ -0,0 +1,291 @@
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+from selenium import webdriver # type: ignore
+from selenium.webdriver.chrome.options import Options # type: ignore
+
+import browser_daemon
+
+
+_active_pool = None
+_driver_hooks = []
+_strict_hooks = False
+_hook_lock = threading.Lock()
+# "module.function" -> [failures, first error]
+hook_failures = {}
+
+
+def options_key(options):
+    """Drivers are only shared between helpers that asked for the same Chrome flags"""
+    return tuple(sorted(options.arguments))
+
+
+class DriverPool:
+    """Session-wide pool of Chrome drivers borrowed by the *Tests helper classes"""
+
+    def __init__(self):
+        self._idle = {}
+        self._keys = {}
+        self._lock = threading.Lock()
+        self.launches = 0
+        self.borrows = 0
+        self.launch_seconds = 0.0
+
+    def launch(self, options):
+        """Start a brand-new Chrome and account for the startup cost"""
+        start = time.time()
+        driver = launch_chrome(options)
+        elapsed = time.time() - start
+        with self._lock:
+            self.launches += 1
+            self.launch_seconds += elapsed
+        return driver
+
+    def acquire(self, options):
+        """Hand out a clean driver for these options, launching one only if none is idle"""
+        key = options_key(options)
+        with self._lock:
+            self.borrows += 1
+            idle = self._idle.get(key) or []
+            driver = idle.pop() if idle else None
+
+        if driver is not None and not self._is_alive(driver):
+            self._quit(driver)
+            driver = None
+
+        if driver is None:
+            driver = self.launch(options)
+
+        with self._lock:
+            self._keys[id(driver)] = key
+        return driver
+
+    def release(self, driver):
+        """Take a driver back, wiping its state so the next test starts clean"""
+        with self._lock:
+            key = self._keys.pop(id(driver), None)
+
+        if key is None:
+            self._quit(driver)
+            return
+
+        try:
+            reset_driver(driver)
+        except Exception:
+            self._quit(driver)
+            return
+
+        with self._lock:
+            self._idle.setdefault(key, []).append(driver)
+
+    def close(self):
+        """Quit every idle driver"""
+        with self._lock:
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle = {}
+        for driver in drivers:
+            self._quit(driver)
+
+    @property
+    def saved_launches(self):
+        return max(self.borrows - self.launches, 0)
+
+    def summary(self):
+        average = self.launch_seconds / self.launches if self.launches else 0.0
+        return (
+            f"🚗 Driver pool: {self.borrows} borrows, {self.launches} Chrome launches, "
+            f"{self.saved_launches} launches saved (~{self.saved_launches * average:.1f}s)"
+        )
+
+    def _is_alive(self, driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, driver):
+        try:
+            quit_driver(driver)
+        except Exception:
+            pass
+
+
+def profile_dir(name="selenium"):
+    """Chrome profile location; parallel workers get their own root via PAWFINDER_PROFILE_DIR"""
+    root = os.environ.get("PAWFINDER_PROFILE_DIR")
+    if root is None:
+        return os.path.join(tempfile.gettempdir(), name)
+    return os.path.join(root, name)
+
+
+APP_ORIGIN = "http://localhost:3000"
+STORAGE_TYPES = "local_storage,indexeddb,websql,cache_storage,service_workers,file_systems"
+
+
+def _origin(url):
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _tab_origins(driver):
+    """Origins the current tab navigated through and the ones its frames are on now"""
+    urls = [entry["url"] for entry in driver.execute_cdp_cmd("Page.getNavigationHistory", {})["entries"]]
+    frames = [driver.execute_cdp_cmd("Page.getFrameTree", {})["frameTree"]]
+    while frames:
+        tree = frames.pop()
+        urls.append(tree["frame"]["url"])
+        frames.extend(tree.get("childFrames", []))
+    return {origin for origin in map(_origin, urls) if origin}
+
+
+def reset_driver(driver, origins=(APP_ORIGIN,)):
+    """Wipe cookies, storage, cache and extra tabs over DevTools, leaving one about:blank tab.
+
+    Much cheaper than quit() + relaunch, and used by the pool between tests. Storage can
+    only be cleared per origin, so every origin a tab or frame reached is collected and
+    remembered on the driver; later resets clear them again in case a popup that closed
+    itself went back to one.
+    """
+    seen = getattr(driver, "_visited_origins", set()) | set(origins)
+    for target in driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]:
+        origin = _origin(target.get("url", ""))
+        if origin:
+            seen.add(origin)
+
+    # A brand-new tab has no history and no sessionStorage for any origin
+    old_handles = driver.window_handles
+    driver.switch_to.new_window("tab")
+    fresh = driver.current_window_handle
+    for handle in old_handles:
+        driver.switch_to.window(handle)
+        seen |= _tab_origins(driver)
+        driver.close()
+    driver.switch_to.window(fresh)
+    driver._visited_origins = seen
+
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    for origin in seen:
+        driver.execute_cdp_cmd(
+            "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": STORAGE_TYPES}
+        )
+    driver.set_window_size(1920, 1080)
+
+
+def launch_chrome(options):
+    """Attach to a warm daemon browser if one is free and started with these flags,
+    otherwise start Chrome.
+
+    A fresh Chrome inside a parallel worker gets an isolated profile.
+    """
+    if not os.environ.get("PAWFINDER_NO_DAEMON"):
+        driver = browser_daemon.attach_driver(options)
+        if driver is not None:
+            reset_driver(driver)
+            return driver
+
+    root = os.environ.get("PAWFINDER_PROFILE_DIR")
+    if root and not any(arg.startswith("--user-data-dir") for arg in options.arguments):
+        os.makedirs(root, exist_ok=True)
+        options.add_argument(f"--user-data-dir={tempfile.mkdtemp(prefix='chrome-', dir=root)}")
+    return webdriver.Chrome(options=options)
+
+
+def activate(pool):
+    global _active_pool
+    _active_pool = pool
+
+
+def deactivate():
+    global _active_pool
+    _active_pool = None
+
+
+def active_pool():
+    return _active_pool
+
+
+def add_driver_hook(on_acquire, on_release=None):
+    """Run on_acquire(driver) for every driver handed to a helper and on_release(driver) when it is given back"""
+    _driver_hooks.append((on_acquire, on_release))
+
+
+def remove_driver_hook(on_acquire):
+    _driver_hooks[:] = [hook for hook in _driver_hooks if hook[0] is not on_acquire]
+
+
+def strict_hooks(strict=True):
+    """Let a failing acquire/release hook fail the helper instead of only being reported"""
+    global _strict_hooks
+    _strict_hooks = strict
+
+
+def _run_hooks(driver, index):
+    """A failing hook leaves this browser unstubbed or unmeasured, so it is always reported"""
+    for hook in list(_driver_hooks):
+        function = hook[index]
+        if function is None:
+            continue
+        try:
+            function(driver)
+        except Exception as error:
+            name = f"{function.__module__}.{function.__name__}"
+            message = f"{type(error).__name__}: {error}"[:200]
+            with _hook_lock:
+                failure = hook_failures.setdefault(name, [0, message])
+                failure[0] += 1
+            print(f"⚠️  Driver hook {name} failed: {message}")
+            if _strict_hooks:
+                raise
+
+
+def hook_report():
+    if not hook_failures:
+        return []
+    total = sum(count for count, _ in hook_failures.values())
+    lines = [f"⚠️  Driver hooks: {total} failures, those browsers ran without them (--strict-hooks to fail)"]
+    for name, (count, message) in sorted(hook_failures.items()):
+        lines.append(f"   {name} ×{count}: {message}")
+    return lines
+
+
+def acquire_driver(options=None):
+    """Borrow a driver from the active pool, or launch a private one when there is no pool"""
+    if options is None:
+        options = Options()
+    pool = active_pool()
+    if pool is not None:
+        driver = pool.acquire(options)
+    else:
+        driver = launch_chrome(options)
+    try:
+        _run_hooks(driver, 0)
+    except Exception:
+        release_driver(driver)
+        raise
+    return driver
+
+
+def quit_driver(driver):
+    """Quit a driver, handing daemon browsers back instead of killing them"""
+    if getattr(driver, "_daemon_lease", None) is not None:
+        browser_daemon.detach_driver(driver)
+    else:
+        driver.quit()
+
+
+def release_driver(driver):
+    """Return a driver to the pool it came from, or quit it"""
+    try:
+        _run_hooks(driver, 1)
+    finally:
+        pool = active_pool()
+        if pool is not None:
+            pool.release(driver)
+        else:
+            quit_driver(driver)
@@ -0,0 +1,186 @@
+import math
+import statistics
+import threading
+from contextlib import contextmanager
+
+from selenium.common.exceptions import ( # type: ignore
+    ElementClickInterceptedException, ElementNotInteractableException, MoveTargetOutOfBoundsException
+)
+from selenium.webdriver.common.action_chains import ActionChains # type: ignore
+
+
+# Observes Event Timing entries (trusted input to next paint) and long tasks, once per document
+OBSERVE_JS = """
+if (!window.__pawInput) {
+    const state = window.__pawInput = {events: [], longTasks: []};
+    const observe = (type, options, callback) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback))
+                .observe(Object.assign({type, buffered: true}, options));
+        } catch (e) {}
+    };
+    observe('event', {durationThreshold: 16}, entry => state.events.push(
+        {name: entry.name, start: entry.startTime, duration: entry.duration}
+    ));
+    observe('longtask', {}, entry => state.longTasks.push({start: entry.startTime, duration: entry.duration}));
+}
+"""
+
+# Waits for the next frame after the interaction's work, then reports what happened since t0
+FINISH_JS = """
+const nextPaint = () => new Promise(resolve => requestAnimationFrame(() => setTimeout(resolve, 0)));
+nextPaint().then(() => {
+    const painted = performance.now();
+    // Give the observers a moment to deliver the entries of that frame
+    setTimeout(() => {
+        const state = window.__pawInput || {events: [], longTasks: []};
+        const events = state.events.filter(entry => entry.start >= t0 - 1);
+        const tasks = state.longTasks.filter(task => task.start + task.duration >= t0 && task.start <= painted);
+        done({
+            origin: performance.timeOrigin,
+            frame_ms: painted - t0,
+            event_ms: events.length ? Math.max(...events.map(entry => entry.duration)) : null,
+            events: events.map(entry => entry.name),
+            long_tasks: tasks.map(task => task.duration)
+        });
+    }, 50);
+});
+"""
+
+BEGIN_JS = OBSERVE_JS + "return {origin: performance.timeOrigin, now: performance.now()};"
+
+END_JS = """
+const t0 = arguments[0];
+const done = arguments[arguments.length - 1];
+""" + FINISH_JS
+
+
+class Interaction:
+    """One UI action: input-to-next-paint latency and the long tasks it caused"""
+
+    def __init__(self, action, label, data, test=None, navigated=False, fallback=None):
+        self.action = action
+        self.label = label
+        self.test = test
+        self.navigated = navigated
+        # Why trusted input could not be used and a script click stood in for it
+        self.fallback = fallback
+        # Event Timing is exact but only reports input handled in 16ms or more; faster input
+        # falls back to the frame measurement, which also holds the WebDriver round trips
+        self.event_ms = None if navigated else data.get("event_ms")
+        self.frame_ms = None if navigated else data.get("frame_ms")
+        self.latency_ms = self.event_ms if self.event_ms is not None else self.frame_ms
+        if navigated:
+            self.source = "navigated"
+        elif fallback:
+            # Script clicks are untrusted, so they never get Event Timing entries
+            self.source = "js click"
+        else:
+            self.source = "event timing" if self.event_ms is not None else "next frame"
+        self.long_tasks = [] if navigated else data.get("long_tasks", [])
+
+    @property
+    def long_task_ms(self):
+        return sum(self.long_tasks)
+
+    def __repr__(self):
+        if self.navigated:
+            return f"<Interaction {self.action} {self.label!r} navigated>"
+        return (f"<Interaction {self.action} {self.label!r} {self.latency_ms:.0f}ms ({self.source}), "
+                f"{len(self.long_tasks)} long tasks {self.long_task_ms:.0f}ms>")
+
+
+class InteractionRecorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = []
+        self.test = None
+
+    def add(self, interaction):
+        with self._lock:
+            self.records.append(interaction)
+
+    def report(self):
+        if not self.records:
+            return []
+        # Event Timing and frame measurements are not comparable, so they get separate rows
+        by_action = {}
+        for interaction in self.records:
+            by_action.setdefault((interaction.action, interaction.source), []).append(interaction)
+        lines = [f"👆 Interactions: {len(self.records)} UI actions (input to next paint, ms)"]
+        lines.append(
+            f"   {'action':<12} {'source':<12} {'n':>3} {'p50':>6} {'p95':>6} {'max':>6} {'long tasks':>11} {'blocked':>8}"
+        )
+        for (action, source), interactions in sorted(by_action.items()):
+            latencies = sorted(i.latency_ms for i in interactions if i.latency_ms is not None)
+            tasks = [task for i in interactions for task in i.long_tasks]
+            if latencies:
+                p95 = latencies[max(1, math.ceil(0.95 * len(latencies))) - 1]
+                cells = f"{statistics.median(latencies):>6.0f} {p95:>6.0f} {latencies[-1]:>6.0f}"
+            else:
+                cells = f"{'-':>6} {'-':>6} {'-':>6}"
+            lines.append(
+                f"   {action:<12} {source:<12} {len(interactions):>3} {cells} {len(tasks):>11} {sum(tasks):>7.0f}ms"
+            )
+        return lines
+
+
+recorder = InteractionRecorder()
+
+
+class InteractionProfiler:
+    """Measures UI actions on one driver; results go to the run-wide recorder"""
+
+    def __init__(self, driver, recorder=recorder):
+        self.driver = driver
+        self.recorder = recorder
+
+    @contextmanager
+    def measure(self, action, label=""):
+        """Time whatever the block does (send_keys, Select, WebDriver clicks) to the next paint.
+
+        Trusted input gets its Event Timing duration; if the browser reports none, the
+        frame measurement also includes the WebDriver round trips inside the block.
+        """
+        begin = self._call(lambda: self.driver.execute_script(BEGIN_JS))
+        notes = {}
+        yield notes
+        if begin is None:
+            return
+        data = self._call(lambda: self.driver.execute_async_script(END_JS, begin["now"]))
+        navigated = data is None or data["origin"] != begin["origin"]
+        self._record(action, label, data or {}, navigated, notes.get("fallback"))
+
+    def click(self, element, action, label=""):
+        """Click element with real (trusted) mouse input and time it to the next paint.
+
+        An element that is covered or off-screen gets the script click the tests used
+        before, and the interaction is recorded as such.
+        """
+        with self.measure(action, label) as notes:
+            try:
+                ActionChains(self.driver).move_to_element(element).click().perform()
+            except (ElementClickInterceptedException, ElementNotInteractableException,
+                    MoveTargetOutOfBoundsException) as error:
+                notes["fallback"] = type(error).__name__
+                self.driver.execute_script("arguments[0].click();", element)
+
+    def _record(self, action, label, data, navigated, fallback=None):
+        interaction = Interaction(action, label, data, self.recorder.test, navigated, fallback)
+        self.recorder.add(interaction)
+        name = f"{action} {label}".strip()
+        if fallback:
+            print(f"⚠️  {name}: trusted click failed ({fallback}), used a script click")
+        if interaction.navigated:
+            print(f"👆 {name}: navigated away")
+        else:
+            print(f"👆 {name}: {interaction.latency_ms:.0f}ms to next paint ({interaction.source}), "
+                  f"{len(interaction.long_tasks)} long tasks ({interaction.long_task_ms:.0f}ms)")
+        return interaction
+
+    def _call(self, script):
+        """Profiling never fails the action it wraps"""
+        try:
+            return script()
+        except Exception:
+            return None
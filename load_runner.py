@@ -0,0 +1,290 @@
+import argparse
+import io
+import json
+import math
+import random
+import sys
+import threading
+import time
+
+from selenium.webdriver.common.by import By # type: ignore
+from selenium.webdriver.support import expected_conditions as EC # type: ignore
+from selenium.webdriver.support.ui import WebDriverWait # type: ignore
+
+import driver_pool
+
+
+DEFAULT_MIX = {"view_details": 3, "marketplace": 3, "vet_search": 2, "adoption": 1}
+WINDOW_SECONDS = 10
+
+
+class StepFailed(Exception):
+    pass
+
+
+def _check(result, message):
+    """Helper test methods report failure by returning False"""
+    if result is False:
+        raise StepFailed(message)
+
+
+# Journeys: each is a list of (step name, callable(state)); state carries the helper
+# object from one step to the next. They drive the same helpers the test modules use.
+# Getting a browser (reset, or a Chrome launch when the pool is empty) is its own
+# "browser: acquire" step so it does not inflate the first page step's latency.
+
+def _acquire_driver(state):
+    state["driver"] = driver_pool.acquire_driver()
+
+
+def _view_details_steps():
+    def open_home(state):
+        state["driver"].get("http://localhost:3000/")
+        WebDriverWait(state["driver"], 10).until(
+            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'View Details')]"))
+        )
+
+    def open_details(state):
+        driver = state["driver"]
+        driver.find_element(By.XPATH, "//button[contains(text(), 'View Details')]").click()
+        WebDriverWait(driver, 10).until(EC.url_contains("/details"))
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
+
+    return [("browser: acquire", _acquire_driver), ("home: load", open_home), ("home: view details", open_details)]
+
+
+def _marketplace_steps():
+    from test_marketplace import MarketplaceTests
+
+    def acquire(state):
+        state["tester"] = MarketplaceTests()
+
+    def sign_in(state):
+        state["tester"].login_if_needed()
+
+    def browse(state):
+        _check(state["tester"].test_page_loads_with_products(), "no products visible")
+
+    return [("browser: acquire", acquire), ("marketplace: sign in", sign_in), ("marketplace: browse products", browse)]
+
+
+def _vet_search_steps():
+    from test_veterinary import VeterinaryPageTests
+
+    def acquire(state):
+        state["tester"] = VeterinaryPageTests()
+
+    def open_page(state):
+        _check(state["tester"].navigate_to_page(), "veterinary page did not load")
+
+    def search(state):
+        _check(state["tester"].test_search_functionality(), "search failed")
+
+    return [("browser: acquire", acquire), ("veterinary: load", open_page), ("veterinary: search", search)]
+
+
+def _adoption_steps():
+    from test_adoptionform import submit_adoption_form
+
+    def submit(state):
+        _check(submit_adoption_form(state["driver"]), "adoption form not found, nothing submitted")
+
+    return [("browser: acquire", _acquire_driver), ("adoption: submit form", submit)]
+
+
+JOURNEYS = {
+    "view_details": _view_details_steps,
+    "marketplace": _marketplace_steps,
+    "vet_search": _vet_search_steps,
+    "adoption": _adoption_steps,
+}
+
+
+def _finish(state):
+    """Give back whatever the journey borrowed so the next iteration reuses the browser"""
+    tester = state.get("tester")
+    if tester is not None:
+        tester.cleanup()
+    if state.get("driver") is not None:
+        driver_pool.release_driver(state["driver"])
+
+
+class HeadlessPool(driver_pool.DriverPool):
+    """Virtual users never open visible windows, whatever flags the helper asked for"""
+
+    def acquire(self, options):
+        if not any(arg.startswith("--headless") for arg in options.arguments):
+            options.add_argument("--headless=new")
+        return super().acquire(options)
+
+
+class ThreadOutput(io.TextIOBase):
+    """Swallows the helpers' progress prints from virtual-user threads, keeps the runner's own"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.main = threading.get_ident()
+
+    def write(self, text):
+        if threading.get_ident() == self.main:
+            return self.stream.write(text)
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+class LoadResults:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.steps = []
+        self.journeys = []
+
+    def step(self, journey, name, started, elapsed, error):
+        with self._lock:
+            self.steps.append({
+                "journey": journey, "step": name, "started": started,
+                "seconds": elapsed, "error": error,
+            })
+
+    def journey(self, name, started, elapsed, ok):
+        with self._lock:
+            self.journeys.append({"journey": name, "started": started, "seconds": elapsed, "ok": ok})
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[max(1, math.ceil(pct / 100 * len(values))) - 1]
+
+
+def virtual_user(index, mix, deadline, results, seed):
+    rng = random.Random(seed + index)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    while time.time() < deadline:
+        name = rng.choices(names, weights)[0]
+        state = {}
+        journey_start = time.time()
+        ok = True
+        try:
+            for step_name, step in JOURNEYS[name]():
+                start = time.time()
+                try:
+                    step(state)
+                    results.step(name, step_name, start, time.time() - start, None)
+                except Exception as error:
+                    results.step(name, step_name, start, time.time() - start, f"{type(error).__name__}: {error}"[:200])
+                    ok = False
+                    break
+        finally:
+            try:
+                _finish(state)
+            except Exception:
+                pass
+        results.journey(name, journey_start, time.time() - journey_start, ok)
+
+
+def print_report(results, users, duration, started):
+    print(f"\n📊 Load results: {users} virtual users for {duration:.0f}s")
+    print(f"{'step':<32} {'n':>5} {'err%':>6} {'p50':>7} {'p90':>7} {'p95':>7} {'p99':>7} {'max':>7}  (seconds)")
+    steps = {}
+    for row in results.steps:
+        steps.setdefault(row["step"], []).append(row)
+    for name, rows in sorted(steps.items()):
+        ok = [row["seconds"] for row in rows if row["error"] is None]
+        errors = len(rows) - len(ok)
+        cells = [f"{percentile(ok, pct):.2f}" if ok else "-" for pct in (50, 90, 95, 99)]
+        cells.append(f"{max(ok):.2f}" if ok else "-")
+        print(f"{name:<32} {len(rows):>5} {errors / len(rows) * 100:>5.1f}% " + " ".join(f"{cell:>7}" for cell in cells))
+
+    finished = len(results.journeys)
+    failed = sum(1 for row in results.journeys if not row["ok"])
+    print(f"\n🔁 {finished} journeys ({failed} failed), {finished / duration * 60:.1f} journeys/min, "
+          f"{len(results.steps) / duration:.2f} steps/s")
+
+    # Latency and errors over time show whether the app degrades as load is sustained
+    print(f"\n⏱️  Per {WINDOW_SECONDS}s window")
+    print(f"{'window':<10} {'steps':>6} {'errors':>7} {'p95':>7}")
+    windows = {}
+    for row in results.steps:
+        windows.setdefault(int((row["started"] - started) // WINDOW_SECONDS), []).append(row)
+    for window, rows in sorted(windows.items()):
+        ok = [row["seconds"] for row in rows if row["error"] is None]
+        p95 = f"{percentile(ok, 95):.2f}" if ok else "-"
+        errors = sum(1 for row in rows if row["error"])
+        label = f"{window * WINDOW_SECONDS}-{(window + 1) * WINDOW_SECONDS}s"
+        print(f"{label:<10} {len(rows):>6} {errors:>7} {p95:>7}")
+
+    messages = {}
+    for row in results.steps:
+        if row["error"]:
+            messages[(row["step"], row["error"])] = messages.get((row["step"], row["error"]), 0) + 1
+    if messages:
+        print("\n❌ Most common errors")
+        for (step, error), count in sorted(messages.items(), key=lambda item: -item[1])[:5]:
+            print(f"   {count:>4}× {step}: {error}")
+
+
+def parse_mix(text):
+    """'view_details=3,adoption=1' -> {'view_details': 3, 'adoption': 1}"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in JOURNEYS:
+            raise argparse.ArgumentTypeError(f"unknown journey {name!r} (choose from {', '.join(JOURNEYS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive concurrent headless virtual users through the suite's journeys")
+    parser.add_argument("-u", "--users", type=int, default=4, help="concurrent virtual users (browsers)")
+    parser.add_argument("-d", "--duration", type=float, default=60, help="seconds to keep starting journeys")
+    parser.add_argument("--ramp-up", type=float, default=0, help="seconds over which users are started")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="weighted journeys, e.g. view_details=3,marketplace=3,vet_search=2,adoption=1")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write every step and journey timing here")
+    args = parser.parse_args(argv)
+
+    pool = HeadlessPool()
+    driver_pool.activate(pool)
+    results = LoadResults()
+    started = time.time()
+    deadline = started + args.ramp_up + args.duration
+    print(f"🚦 {args.users} virtual users, {args.duration:.0f}s, mix "
+          + ", ".join(f"{name}×{weight:g}" for name, weight in args.mix.items()))
+
+    stdout, sys.stdout = sys.stdout, ThreadOutput(sys.stdout)
+    threads = []
+    try:
+        for index in range(args.users):
+            thread = threading.Thread(
+                target=virtual_user, args=(index, args.mix, deadline, results, args.seed), daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+            if args.ramp_up and args.users > 1:
+                time.sleep(args.ramp_up / (args.users - 1) if index < args.users - 1 else 0)
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        print("🚫 Stopped early; reporting what finished")
+    finally:
+        sys.stdout = stdout
+        driver_pool.deactivate()
+        pool.close()
+
+    elapsed = time.time() - started
+    print_report(results, args.users, elapsed, started)
+    print(pool.summary())
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"users": args.users, "duration": elapsed, "mix": args.mix,
+                       "steps": results.steps, "journeys": results.journeys}, handle, indent=2)
+    return 0 if not any(row["error"] for row in results.steps) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
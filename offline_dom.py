@@ -0,0 +1,175 @@
+import os
+import re
+
+from dom_snapshot import snapshot
+from selector_resolver import to_candidate
+
+try:
+    import lxml.html # type: ignore
+    from cssselect import GenericTranslator # type: ignore
+except ImportError:  # offline mode needs lxml + cssselect; without them queries go to the browser
+    lxml = None
+
+
+# Serialises a clone of the rendered DOM, tagging each element with what only the live
+# page knows (visibility, rendered height) so later queries need no browser at all.
+CAPTURE_JS = """
+const live = document.documentElement.querySelectorAll('*');
+const clone = document.documentElement.cloneNode(true);
+const copies = clone.querySelectorAll('*');
+for (let i = 0; i < live.length; i++) {
+    const el = live[i];
+    const style = window.getComputedStyle(el);
+    if (!el.getClientRects().length || style.visibility === 'hidden' || style.display === 'none') {
+        copies[i].setAttribute('data-paw-hidden', '');
+    } else {
+        copies[i].setAttribute('data-paw-height', Math.round(el.getBoundingClientRect().height));
+    }
+}
+return {html: clone.outerHTML, url: location.href, title: document.title};
+"""
+
+# cssselect has no case-insensitive attribute flag ([placeholder*='search' i]), so those
+# attributes are lower-cased with translate() in the generated XPath instead
+CASE_FLAG = re.compile(r"""\[\s*([\w-]+)\s*([~|^$*]?=)\s*(['"])(.*?)\3\s+i\s*\]""")
+UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+# Never rendered as text, though lxml's text_content() includes them
+NON_TEXT_TAGS = {"script", "style", "noscript", "template", "head"}
+# Everything else starts a new line in innerText, so its words do not run into the next element's
+INLINE_TAGS = {
+    "a", "abbr", "b", "bdi", "bdo", "cite", "code", "em", "i", "kbd", "label",
+    "mark", "q", "s", "small", "span", "strong", "sub", "sup", "time", "u",
+}
+
+
+def rendered_text(node):
+    """Text a user could see in node, roughly innerText: no script/style or hidden subtrees"""
+    parts = [node.text or ""]
+    for child in node:
+        if isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS and "data-paw-hidden" not in child.attrib:
+            text = rendered_text(child)
+            parts.append(text if child.tag in INLINE_TAGS else f" {text} ")
+        parts.append(child.tail or "")
+    return " ".join("".join(parts).split())
+
+
+def css_to_xpath(selector):
+    folded = []
+
+    def fold(match):
+        name, operator, quote, value = match.groups()
+        folded.append(name)
+        return f"[{name}{operator}{quote}{value.lower()}{quote}]"
+
+    xpath = GenericTranslator().css_to_xpath(CASE_FLAG.sub(fold, selector))
+    for name in set(folded):
+        xpath = xpath.replace(f"@{name}", f"translate(@{name}, '{UPPER}', '{UPPER.lower()}')")
+    return xpath
+
+
+class OfflineNode:
+    """Same read-only surface as dom_snapshot.ElementSnapshot, backed by the parsed tree"""
+
+    def __init__(self, node):
+        self.node = node
+        self.tag = node.tag
+        self.attributes = {
+            name: value for name, value in node.attrib.items() if not name.startswith("data-paw-")
+        }
+        self.text = rendered_text(node)
+        self.visible = "data-paw-hidden" not in node.attrib
+        self.height = float(node.get("data-paw-height") or 0)
+
+    def attr(self, name, default=None):
+        return self.attributes.get(name, default)
+
+    def __repr__(self):
+        return f"<{self.tag} {self.attributes} visible={self.visible}>"
+
+
+class _Page:
+    def contains(self, *keywords):
+        """Keywords (case-insensitive) that appear anywhere in the page source"""
+        source = self.source.lower()
+        return [keyword for keyword in keywords if keyword.lower() in source]
+
+    def count(self, selector, visible=False):
+        return len(self.select(selector, visible))
+
+    def exists(self, selector, visible=False):
+        return bool(self.select(selector, visible))
+
+    def first(self, selectors, visible=False):
+        """(selector, nodes) for the first selector in the list that matches anything"""
+        for selector in selectors:
+            nodes = self.select(selector, visible)
+            if nodes:
+                return selector, nodes
+        return None, []
+
+    def texts(self, selector, visible=False):
+        return [node.text for node in self.select(selector, visible)]
+
+
+class PageCapture(_Page):
+    """The rendered DOM captured once; CSS/XPath assertions run against a local lxml tree"""
+
+    offline = True
+
+    def __init__(self, html, url, title):
+        self.source = html
+        self.url = url
+        self.title = title
+        self.tree = lxml.html.fromstring(html)
+        self._cache = {}
+
+    def select(self, selector, visible=False):
+        if selector not in self._cache:
+            self._cache[selector] = [OfflineNode(node) for node in self._query(selector)]
+        nodes = self._cache[selector]
+        return [node for node in nodes if node.visible] if visible else nodes
+
+    def _query(self, selector):
+        candidate = to_candidate(selector)
+        try:
+            xpath = candidate["selector"]
+            if candidate["kind"] == "css":
+                xpath = css_to_xpath(xpath)
+            return [node for node in self.tree.xpath(xpath) if isinstance(getattr(node, "tag", None), str)]
+        except Exception:
+            return []
+
+
+class LivePage(_Page):
+    """Fallback with the same API that asks the browser, one snapshot call per query"""
+
+    offline = False
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.source = driver.page_source
+        self.url = driver.current_url
+        self.title = driver.title
+
+    def select(self, selector, visible=False):
+        try:
+            return snapshot(self.driver, selector, visible_only=visible)
+        except Exception:
+            return []
+
+
+def offline_enabled():
+    return lxml is not None and os.environ.get("PAWFINDER_OFFLINE_DOM", "1") != "0"
+
+
+def capture(driver):
+    """Freeze the current page state for read-only assertions.
+
+    Capture again after anything that changes the page (navigation, clicks, resizes).
+    """
+    if not offline_enabled():
+        return LivePage(driver)
+    page = driver.execute_script(CAPTURE_JS)
+    return PageCapture(page["html"], page["url"], page["title"])
@@ -0,0 +1,315 @@
+import argparse
+import ast
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def discover_units(pattern="test_*.py"):
+    """Split the suite into schedulable units: one per Test* class or module-level test function.
+
+    Files are parsed rather than imported so discovery does not need selenium or a browser.
+    Returns (node_id, test_count) pairs.
+    """
+    units = []
+    for path in sorted(glob.glob(os.path.join(HERE, pattern))):
+        module = os.path.basename(path)
+        with open(path, encoding="utf-8") as source:
+            tree = ast.parse(source.read(), filename=module)
+
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+                count = sum(
+                    1 for item in node.body
+                    if isinstance(item, ast.FunctionDef) and item.name.startswith("test")
+                )
+                if count:
+                    units.append((f"{module}::{node.name}", count))
+            elif isinstance(node, ast.FunctionDef) and node.name.startswith("test"):
+                units.append((f"{module}::{node.name}", 1))
+    return units
+
+
+def partition(units, workers):
+    """Greedy longest-first packing so every worker gets a similar number of tests"""
+    buckets = [[] for _ in range(workers)]
+    loads = [0] * workers
+    for node_id, count in sorted(units, key=lambda unit: unit[1], reverse=True):
+        target = loads.index(min(loads))
+        buckets[target].append(node_id)
+        loads[target] += count
+    return [bucket for bucket in buckets if bucket]
+
+
+def run_worker(index, node_ids, output_dir, pytest_args, run_id):
+    """Run one pytest process with its own Chrome profile root, JUnit report and vitals file"""
+    worker_dir = os.path.join(output_dir, f"worker-{index}")
+    os.makedirs(worker_dir, exist_ok=True)
+    report = os.path.join(worker_dir, "results.xml")
+    vitals = os.path.join(worker_dir, "vitals.json")
+    log_path = os.path.join(worker_dir, "pytest.log")
+
+    env = dict(os.environ)
+    env["PAWFINDER_WORKER"] = str(index)
+    env.setdefault("PAWFINDER_RUN_ID", run_id)
+    env["PAWFINDER_PROFILE_DIR"] = os.path.join(worker_dir, "profile")
+
+    command = [
+        sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+        f"--junitxml={report}", "--vitals-json", vitals, *pytest_args, *node_ids
+    ]
+    start = time.time()
+    with open(log_path, "w", encoding="utf-8") as log:
+        returncode = subprocess.call(command, cwd=HERE, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+    return {
+        "worker": index,
+        "returncode": returncode,
+        "duration": time.time() - start,
+        "log": log_path,
+        "results": read_junit(report, index),
+        "vitals": read_vitals(vitals),
+    }
+
+
+def read_junit(path, worker):
+    """Turn a worker's JUnit XML into result rows"""
+    if not os.path.exists(path):
+        return []
+
+    results = []
+    for case in ET.parse(path).getroot().iter("testcase"):
+        if case.find("skipped") is not None:
+            outcome = "skipped"
+        elif case.find("failure") is not None or case.find("error") is not None:
+            outcome = "failed"
+        else:
+            outcome = "passed"
+        results.append({
+            "name": f"{case.get('classname')}::{case.get('name')}",
+            "outcome": outcome,
+            "time": float(case.get("time") or 0),
+            "worker": worker,
+        })
+    return results
+
+
+def read_vitals(path):
+    """A worker's --vitals-json navigations, as saved"""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+class UsageError(Exception):
+    """A pytest option the runner has to read is missing its value"""
+
+
+def find_option(args, name, has_value=True):
+    """(index, token count, value) of a pytest option in args, as --name value or --name=value.
+
+    Returns None when absent; a flag's value is True.
+    """
+    for index, arg in enumerate(args):
+        if arg == name:
+            if not has_value:
+                return index, 1, True
+            if index + 1 >= len(args) or args[index + 1].startswith("-"):
+                raise UsageError(f"{name} expects a value")
+            return index, 2, args[index + 1]
+        if has_value and arg.startswith(name + "="):
+            value = arg[len(name) + 1:]
+            if not value:
+                raise UsageError(f"{name} expects a value")
+            return index, 1, value
+    return None
+
+
+def option_value(args, name):
+    """Value of a pytest option left in args for the workers, or None when absent"""
+    found = find_option(args, name)
+    return found[2] if found else None
+
+
+def take_option(args, name, has_value=True):
+    """Remove a pytest option from args; returns its value (True for a flag, None when absent)"""
+    found = find_option(args, name, has_value)
+    if found is None:
+        return None
+    index, count, value = found
+    del args[index:index + count]
+    return value
+
+
+def check_budgets(workers, budgets_path, vitals_path):
+    """Judge every worker's navigations against the budgets together; True when they are met"""
+    import perf_budgets
+    import web_vitals
+
+    navigations = [data for worker in workers for data in worker["vitals"]]
+    if vitals_path:
+        with open(vitals_path, "w", encoding="utf-8") as handle:
+            json.dump(navigations, handle, indent=2)
+    budgets = perf_budgets.load_budgets(budgets_path)
+    if budgets is None:
+        return True
+    records = [web_vitals.PageVitals(dict(data, id=str(index))) for index, data in enumerate(navigations)]
+    check = perf_budgets.BudgetCheck(budgets, records)
+    for line in check.report():
+        print(line)
+    return check.passed
+
+
+def start_stand_ins(pytest_args):
+    """Serve --auth-stub / --app-stub once for every worker, which would all bind the same ports.
+
+    Workers find the auth stand-in through PAWFINDER_AUTH_STUB; returns the servers to stop.
+    """
+    auth_port = take_option(pytest_args, "--auth-stub-port")
+    app_data = take_option(pytest_args, "--app-stub-data")
+    servers = []
+    auth = None
+    if take_option(pytest_args, "--auth-stub", has_value=False):
+        import auth_stub
+        auth = auth_stub.AuthStub(int(auth_port or auth_stub.DEFAULT_PORT)).start()
+        servers.append(auth)
+    if take_option(pytest_args, "--app-stub", has_value=False):
+        import app_stub
+        app = app_stub.AppStub(data=app_stub.load_data(app_data or "default"), auth=auth).start()
+        servers.insert(0, app)
+        auth = app.auth
+        print(f"🐾 PawFinder stand-in on {app.url}")
+    if auth is not None:
+        os.environ["PAWFINDER_AUTH_STUB"] = auth.url
+        print(f"🔐 Auth stand-in on {auth.url}")
+    return servers
+
+
+def print_summary(workers, wall_time):
+    results = sorted(
+        (row for worker in workers for row in worker["results"]),
+        key=lambda row: row["name"]
+    )
+
+    print("\n" + "=" * 70)
+    print("📊 PARALLEL TEST SUMMARY")
+    print("=" * 70)
+
+    icons = {"passed": "✅ PASSED", "failed": "❌ FAILED", "skipped": "⏭️  SKIPPED"}
+    for row in results:
+        print(f"{row['name']:<55} {icons[row['outcome']]}  (w{row['worker']}, {row['time']:.1f}s)")
+
+    print("-" * 70)
+    for worker in workers:
+        if worker["returncode"] != 0 and not any(
+            row["outcome"] == "failed" for row in worker["results"]
+        ):
+            print(f"⚠️  Worker {worker['worker']} exited with {worker['returncode']}, see {worker['log']}")
+
+    passed = sum(1 for row in results if row["outcome"] == "passed")
+    serial_time = sum(worker["duration"] for worker in workers)
+    print(f"📈 Overall Result: {passed}/{len(results)} tests passed")
+    print(f"⏱️  Wall time {wall_time:.1f}s across {len(workers)} workers (worker time {serial_time:.1f}s)")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the PawFinder Selenium suite across CPU cores")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("-k", dest="keyword", help="only schedule units whose node id contains this text")
+    parser.add_argument("--output-dir", help="where worker logs, reports and profiles go")
+    parser.add_argument("--timeline", metavar="DIR", help="profile every worker and merge their timelines into DIR")
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER,
+                        help="extra pytest arguments, after --")
+    args = parser.parse_args(argv)
+
+    pytest_args = [arg for arg in args.pytest_args if arg != "--"]
+    try:
+        # Budgets and regressions are judged once over the whole run, not per worker on part of it
+        vitals_path = take_option(pytest_args, "--vitals-json")
+        budgets_path = take_option(pytest_args, "--budgets")
+        no_budgets = take_option(pytest_args, "--no-budgets", has_value=False)
+        fail_on_regression = take_option(pytest_args, "--fail-on-regression", has_value=False)
+        timing_store_path = option_value(pytest_args, "--timing-store")
+        intercept = option_value(pytest_args, "--intercept")
+    except UsageError as error:
+        parser.error(str(error))
+    if not no_budgets and intercept is None:
+        import perf_budgets
+        if perf_budgets.load_budgets(budgets_path) is not None:
+            # Workers run with --no-budgets, so they would pick the functional policy themselves
+            pytest_args += ["--intercept", "off"]
+    if args.timeline:
+        for path in glob.glob(os.path.join(args.timeline, "timeline-w*.json")):
+            os.remove(path)
+        pytest_args += ["--timeline", os.path.abspath(args.timeline)]
+    units = discover_units()
+    if args.keyword:
+        units = [unit for unit in units if args.keyword in unit[0]]
+    if not units:
+        print("❌ No tests to run")
+        return 1
+
+    output_dir = args.output_dir or tempfile.mkdtemp(prefix="pawfinder-parallel-")
+    buckets = partition(units, max(1, args.workers))
+
+    print(f"🚀 Running {len(units)} units on {len(buckets)} workers")
+    for index, bucket in enumerate(buckets):
+        print(f"   worker {index}: {', '.join(bucket)}")
+    print(f"📁 Artifacts: {output_dir}")
+
+    start = time.time()
+    run_id = os.environ.get("PAWFINDER_RUN_ID") or time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+    try:
+        stand_ins = start_stand_ins(pytest_args)
+    except UsageError as error:
+        parser.error(str(error))
+    try:
+        with ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+            futures = [
+                executor.submit(run_worker, index, bucket, output_dir, pytest_args + ["--no-budgets"], run_id)
+                for index, bucket in enumerate(buckets)
+            ]
+            workers = [future.result() for future in futures]
+    finally:
+        for server in stand_ins:
+            server.stop()
+
+    results = print_summary(workers, time.time() - start)
+    if args.timeline:
+        import timeline
+        if timeline.load(args.timeline):
+            print(f"🕒 Timeline: {timeline.render(args.timeline)}")
+    within_budget = no_budgets or check_budgets(workers, budgets_path, vitals_path)
+    regressed = False
+    if "--no-timing-store" not in pytest_args:
+        # Workers each compare only their own tests; check the whole run once they are all in
+        import timing_store
+        store = timing_store.TimingStore(timing_store_path)
+        try:
+            regressions = store.regressions(run_id)
+            for line in timing_store.report(regressions, run_id):
+                print(line)
+            regressed = bool(regressions) and fail_on_regression
+            if not within_budget or regressed:
+                store.set_exit_status(run_id, 1)
+        finally:
+            store.close()
+    failed = any(row["outcome"] == "failed" for row in results)
+    exited = any(worker["returncode"] != 0 for worker in workers)
+    return 1 if failed or exited or not within_budget or regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import json
+import math
+import os
+import sys
+
+from web_vitals import RESOURCE_TYPES
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(HERE, "perf_budgets.json")
+
+# Budget keys and how to read them off a web_vitals.PageVitals record
+METRICS = {
+    "ttfb": ("ms", lambda vitals: vitals.ttfb),
+    "fcp": ("ms", lambda vitals: vitals.fcp),
+    "lcp": ("ms", lambda vitals: vitals.lcp),
+    "cls": ("", lambda vitals: vitals.cls),
+    "dom_content_loaded": ("ms", lambda vitals: vitals.dom_content_loaded),
+    "load": ("ms", lambda vitals: vitals.load),
+    "hydration": ("ms", lambda vitals: vitals.hydration),
+    "long_task_ms": ("ms", lambda vitals: vitals.long_task_ms),
+    "requests": ("", lambda vitals: vitals.requests),
+    "transfer_kb": ("KB", lambda vitals: vitals.transfer_bytes / 1024 if vitals.transfer_bytes is not None else None),
+}
+
+
+def _kilobytes(value):
+    return value / 1024 if value is not None else None
+
+
+# Per resource type: js_requests, js_kb (transferred), js_decoded_kb, css_..., image_..., font_..., api_...
+for _kind in RESOURCE_TYPES:
+    METRICS[f"{_kind}_requests"] = ("", lambda vitals, kind=_kind: vitals.resource(kind, "requests"))
+    METRICS[f"{_kind}_kb"] = ("KB", lambda vitals, kind=_kind: _kilobytes(vitals.resource(kind, "transfer")))
+    METRICS[f"{_kind}_decoded_kb"] = ("KB", lambda vitals, kind=_kind: _kilobytes(vitals.resource(kind, "decoded")))
+del _kind
+
+
+def load_budgets(path=None):
+    """{"aggregate": "p75", "routes": {route: {metric: limit}}}, or None when there is no file"""
+    path = path or DEFAULT_PATH
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as handle:
+        budgets = json.load(handle)
+    unknown = {
+        metric for limits in budgets.get("routes", {}).values() for metric in limits if metric not in METRICS
+    }
+    if unknown:
+        raise ValueError(f"{path}: unknown budget metrics {', '.join(sorted(unknown))}")
+    return budgets
+
+
+def aggregate(values, how):
+    """'median', 'max', or 'pNN' (nearest-rank percentile)"""
+    values = sorted(values)
+    if how == "max":
+        return values[-1]
+    if how == "median":
+        how = "p50"
+    rank = max(1, math.ceil(int(how[1:]) / 100 * len(values)))
+    return values[rank - 1]
+
+
+class Violation:
+    def __init__(self, route, metric, limit, actual, samples, aggregate_name):
+        self.route = route
+        self.metric = metric
+        self.limit = limit
+        self.actual = actual
+        self.samples = samples
+        self.aggregate = aggregate_name
+
+    @property
+    def over(self):
+        return self.actual - self.limit
+
+    @property
+    def over_percent(self):
+        return self.over / self.limit * 100 if self.limit else math.inf
+
+    def describe(self):
+        unit = METRICS[self.metric][0]
+        precision = 3 if self.metric == "cls" else 0
+        return (
+            f"{self.route:<16} {self.metric:<14} {self.aggregate} {self.actual:.{precision}f}{unit} "
+            f"> {self.limit:.{precision}f}{unit} (+{self.over:.{precision}f}{unit}, "
+            f"+{self.over_percent:.0f}%, {self.samples} navigations)"
+        )
+
+
+class BudgetCheck:
+    """Compares recorded navigations against the budget file, route by route.
+
+    Navigations made under a request policy (--intercept) are not judged: fonts and
+    media are blocked and images are placeholders there, so weights and LCP are not real.
+    A budgeted route the run visited only that way is unjudged, which fails the check;
+    routes the run never visited are only mentioned.
+    """
+
+    def __init__(self, budgets, records):
+        self.budgets = budgets
+        self.how = budgets.get("aggregate", "p75")
+        self.violations = []
+        self.checked = []
+        self.unmeasured = []
+        self.unjudged = []
+        self.intercepted = [vitals for vitals in records if vitals.intercept]
+        intercepted_routes = {vitals.route for vitals in self.intercepted}
+        by_route = {}
+        for vitals in records:
+            if not vitals.intercept:
+                by_route.setdefault(vitals.route, []).append(vitals)
+
+        for route, limits in sorted(budgets.get("routes", {}).items()):
+            records_for_route = by_route.get(route, [])
+            if not records_for_route:
+                (self.unjudged if route in intercepted_routes else self.unmeasured).append(route)
+                continue
+            for metric, limit in sorted(limits.items()):
+                values = [value for value in map(METRICS[metric][1], records_for_route) if value is not None]
+                if not values:
+                    continue
+                actual = aggregate(values, self.how)
+                self.checked.append((route, metric))
+                if actual > limit:
+                    self.violations.append(Violation(route, metric, limit, actual, len(values), self.how))
+
+    @property
+    def passed(self):
+        return not self.violations and not self.unjudged
+
+    def report(self):
+        if not self.checked and not self.unmeasured and not self.unjudged:
+            return []
+        if self.passed:
+            lines = [f"💰 Performance budgets: {len(self.checked)} limits met ({self.how})"]
+        else:
+            lines = [
+                f"💸 Performance budgets: {len(self.violations)} of {len(self.checked)} limits exceeded, "
+                f"{len(self.unjudged)} routes not judged"
+            ]
+            lines.extend(f"   ❌ {violation.describe()}" for violation in self.violations)
+        if self.unjudged:
+            lines.append(
+                f"   ❌ {', '.join(self.unjudged)}: only visited under a request policy, "
+                f"so nothing was measured (run with --intercept off)"
+            )
+        if self.unmeasured:
+            lines.append(f"   ℹ️  No navigations to {', '.join(self.unmeasured)} in this run")
+        return lines
+
+
+def main():
+    """Check a --vitals-json file against the budgets: perf_budgets.py vitals.json [budgets.json]"""
+    import web_vitals
+
+    if len(sys.argv) < 2:
+        print("Usage: python perf_budgets.py vitals.json [perf_budgets.json]")
+        return 2
+    with open(sys.argv[1], encoding="utf-8") as handle:
+        records = [web_vitals.PageVitals(dict(data, id=str(index))) for index, data in enumerate(json.load(handle))]
+    budgets = load_budgets(sys.argv[2] if len(sys.argv) > 2 else None)
+    if budgets is None:
+        print("❌ No budget file")
+        return 2
+
+    check = BudgetCheck(budgets, records)
+    for line in check.report():
+        print(line)
+    return 0 if check.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
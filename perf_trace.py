@@ -0,0 +1,164 @@
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium.webdriver.remote.command import Command # type: ignore
+
+import command_hooks
+from cdp_session import CdpSession
+from routes import route_of
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# What the DevTools performance panel records
+CATEGORIES = [
+    "devtools.timeline", "disabled-by-default-devtools.timeline", "disabled-by-default-devtools.timeline.frame",
+    "disabled-by-default-devtools.timeline.stack", "v8.execute", "disabled-by-default-v8.cpu_profiler",
+    "blink.user_timing", "blink.console", "loading", "latencyInfo", "toplevel",
+]
+BUFFER_KB = 64 * 1024
+MAX_TRACES = 20
+TRACED_COMMANDS = {
+    Command.GET: "navigate", Command.GO_BACK: "back", Command.GO_FORWARD: "forward", Command.REFRESH: "refresh",
+    Command.CLICK_ELEMENT: "click", Command.SEND_KEYS_TO_ELEMENT: "type", Command.W3C_EXECUTE_SCRIPT: "script",
+}
+
+
+class SlowTracer:
+    """Keeps a rolling DevTools trace of one browser and saves it when something is slow.
+
+    Chrome traces continuously into a ring buffer, so nothing is written for fast
+    commands; when a navigation or interaction takes threshold_ms or longer the
+    buffer, which holds the slow part, is collected and tracing starts again.
+    """
+
+    def __init__(self, driver, threshold_ms, directory):
+        self.driver = driver
+        self.threshold_ms = threshold_ms
+        self.directory = directory
+        self.route = None
+        self._events = []
+        self._complete = threading.Event()
+        self.session = CdpSession.for_driver(driver)
+        self.session.on("Tracing.dataCollected", lambda params, session_id: self._events.extend(params["value"]))
+        self.session.on("Tracing.tracingComplete", lambda params, session_id: self._complete.set())
+        self._start()
+        command_hooks.listen(driver, self._on_command)
+
+    def _start(self):
+        self._events = []
+        self._complete.clear()
+        self.session.send("Tracing.start", {
+            "transferMode": "ReportEvents",
+            "traceConfig": {
+                "recordMode": "recordContinuously", "traceBufferSizeInKb": BUFFER_KB,
+                "includedCategories": CATEGORIES, "excludedCategories": ["*"],
+            },
+        })
+
+    def _on_command(self, command, params, run):
+        action = TRACED_COMMANDS.get(command)
+        if action is None:
+            return run()
+        if command == Command.GET:
+            self.route = route_of(params["url"])
+        start = time.perf_counter()
+        try:
+            return run()
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if elapsed_ms >= self.threshold_ms:
+                try:
+                    self.save(f"{action} {self.route or ''}", elapsed_ms)
+                except Exception:
+                    pass
+
+    def save(self, label, elapsed_ms=None):
+        """Write what the ring buffer holds and restart tracing; returns the file path or None"""
+        if len(saved) >= MAX_TRACES:
+            return None
+        self.session.send("Tracing.end")
+        if not self._complete.wait(60):
+            return None
+        events = self._events
+        self._start()
+
+        os.makedirs(self.directory, exist_ok=True)
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{test or 'trace'}_{label}").strip("_")[:120]
+        path = os.path.join(self.directory, f"trace_{name}_{time.strftime('%Y%m%d-%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({
+                "traceEvents": events,
+                "metadata": {"test": test, "label": label, "elapsed_ms": elapsed_ms, "url": self.route},
+            }, handle)
+        saved.append((path, label, elapsed_ms))
+        return path
+
+    def close(self):
+        command_hooks.unlisten(self.driver, self._on_command)
+        try:
+            self.session.send("Tracing.end")
+        except Exception:
+            pass
+        self.session.close()
+
+
+_threshold_ms = None
+_directory = HERE
+test = None
+saved = []
+
+
+def configure(threshold_ms, directory=None):
+    """Trace navigations and interactions slower than threshold_ms (None turns tracing off)"""
+    global _threshold_ms, _directory
+    _threshold_ms = threshold_ms
+    _directory = directory or HERE
+
+
+@contextmanager
+def slow_section(driver, label, threshold_ms=None):
+    """Save a trace if the block takes threshold_ms or longer (default: the configured threshold)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        limit = threshold_ms if threshold_ms is not None else _threshold_ms
+        tracer = getattr(driver, "_tracer", None)
+        if tracer is not None and limit is not None and elapsed_ms >= limit:
+            tracer.save(label, elapsed_ms)
+
+
+def capture(driver, label):
+    """Save the recent trace right now, whatever the timings; needs tracing to be on"""
+    tracer = getattr(driver, "_tracer", None)
+    return tracer.save(label) if tracer is not None else None
+
+
+def start_tracing(driver):
+    """driver_pool acquire hook"""
+    if _threshold_ms is None:
+        return
+    driver._tracer = SlowTracer(driver, _threshold_ms, _directory)
+
+
+def stop_tracing(driver):
+    """driver_pool release hook"""
+    tracer = getattr(driver, "_tracer", None)
+    if tracer is not None:
+        tracer.close()
+        driver._tracer = None
+
+
+def report():
+    if not saved:
+        return []
+    lines = [f"🧵 Saved {len(saved)} DevTools traces of slow steps (open in the Performance panel)"]
+    for path, label, elapsed_ms in saved:
+        took = f"{elapsed_ms:.0f}ms" if elapsed_ms is not None else "on demand"
+        lines.append(f"   {label:<30} {took:>9}  {os.path.relpath(path)}")
+    return lines
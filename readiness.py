@@ -0,0 +1,130 @@
+import os
+import time
+from selenium.common.exceptions import TimeoutException, WebDriverException # type: ignore
+from selenium.webdriver.support.ui import WebDriverWait # type: ignore
+
+
+DEFAULT_TIMEOUT = float(os.environ.get("PAWFINDER_WAIT_TIMEOUT", "10"))
+DEFAULT_POLL = 0.05
+NETWORK_IDLE_MS = 500
+DOM_QUIET_MS = 300
+
+
+# Installs (once per document) counters for in-flight fetch/XHR and the time of the
+# last network or DOM activity, then reports how long the page has been quiet.
+PROBE_JS = """
+if (!window.__pawReady) {
+    const state = window.__pawReady = {
+        inflight: 0, resources: 0,
+        lastNetwork: performance.now(), lastMutation: performance.now()
+    };
+    const touch = () => { state.lastNetwork = performance.now(); };
+    if (performance.setResourceTimingBufferSize) {
+        performance.setResourceTimingBufferSize(1000);
+    }
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function () {
+            state.inflight++;
+            touch();
+            return originalFetch.apply(this, arguments).finally(() => { state.inflight--; touch(); });
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.inflight++;
+        touch();
+        this.addEventListener('loadend', () => { state.inflight--; touch(); });
+        return originalSend.apply(this, arguments);
+    };
+    new MutationObserver(() => { state.lastMutation = performance.now(); }).observe(
+        document, {subtree: true, childList: true, attributes: true, characterData: true}
+    );
+}
+const state = window.__pawReady;
+const resources = performance.getEntriesByType('resource').length;
+if (resources !== state.resources) {
+    state.resources = resources;
+    state.lastNetwork = performance.now();
+}
+const now = performance.now();
+return {
+    ready_state: document.readyState,
+    inflight: state.inflight,
+    network_quiet_ms: now - state.lastNetwork,
+    dom_quiet_ms: now - state.lastMutation
+};
+"""
+
+
+class Readiness:
+    """Waits for real page signals instead of fixed time.sleep calls.
+
+    Every wait returns True as soon as its condition holds, or False once the
+    timeout runs out, so it can stand in for a sleep without changing test flow.
+    """
+
+    def __init__(self, driver, timeout=None, poll=DEFAULT_POLL):
+        self.driver = driver
+        self.timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        self.poll = poll
+
+    def until(self, condition, timeout=None):
+        """Generic wait on condition(driver); exceptions while polling count as 'not yet'"""
+        wait = WebDriverWait(
+            self.driver, self.timeout if timeout is None else timeout,
+            poll_frequency=self.poll, ignored_exceptions=(WebDriverException,)
+        )
+        try:
+            wait.until(condition)
+            return True
+        except TimeoutException:
+            return False
+
+    def probe(self):
+        return self.driver.execute_script(PROBE_JS)
+
+    def document_ready(self, timeout=None):
+        """document.readyState is 'complete'"""
+        return self.until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete", timeout
+        )
+
+    def route_change(self, from_url, timeout=None):
+        """The URL is no longer from_url (full navigation or client-side routing)"""
+        return self.until(lambda driver: driver.current_url != from_url, timeout)
+
+    def url_contains(self, fragment, timeout=None):
+        return self.until(lambda driver: fragment in driver.current_url, timeout)
+
+    def network_idle(self, idle_ms=NETWORK_IDLE_MS, timeout=None):
+        """No fetch/XHR in flight and no new resource entries for idle_ms"""
+        return self._quiet(
+            lambda state: state["inflight"] <= 0 and state["network_quiet_ms"] >= idle_ms,
+            idle_ms, timeout
+        )
+
+    def dom_quiet(self, quiet_ms=DOM_QUIET_MS, timeout=None):
+        """No DOM mutations for quiet_ms"""
+        return self._quiet(lambda state: state["dom_quiet_ms"] >= quiet_ms, quiet_ms, timeout)
+
+    def settled(self, idle_ms=NETWORK_IDLE_MS, quiet_ms=DOM_QUIET_MS, timeout=None):
+        """Document complete, network idle and DOM quiet: the replacement for 'sleep after an action'"""
+        return self._quiet(
+            lambda state: (
+                state["ready_state"] == "complete"
+                and state["inflight"] <= 0
+                and state["network_quiet_ms"] >= idle_ms
+                and state["dom_quiet_ms"] >= quiet_ms
+            ),
+            max(idle_ms, quiet_ms), timeout
+        )
+
+    def _quiet(self, is_quiet, window_ms, timeout):
+        # Never report quiet before a full window has passed since the call, so an
+        # action that only starts reacting a few ms later is not missed.
+        start = time.time()
+        return self.until(
+            lambda driver: (time.time() - start) * 1000 >= window_ms and is_quiet(self.probe()),
+            timeout
+        )
@@ -0,0 +1,225 @@
+import base64
+import fnmatch
+import json
+import threading
+from urllib.parse import urlsplit
+
+from cdp_session import CdpSession
+
+
+# 1x1 transparent GIF served instead of real images
+PLACEHOLDER_GIF = "R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"
+
+THIRD_PARTY = [
+    "*google-analytics.com/*", "*googletagmanager.com/*", "*doubleclick.net/*",
+    "*facebook.net/*", "*connect.facebook.com/*", "*hotjar.com/*", "*segment.io/*",
+    "*sentry.io/*", "*intercom.io/*", "*intercomcdn.com/*", "*clarity.ms/*",
+    "*fonts.googleapis.com/*", "*fonts.gstatic.com/*", "*youtube.com/embed/*",
+]
+
+
+class Policy:
+    """What to do with requests a test does not need.
+
+    block:             URL globs failed before they leave the browser
+    stubs:             URL glob -> {"status", "body", "content_type"} answered locally
+    block_types:       DevTools resource types (Font, Media, ...) failed once headers arrive
+    placeholder_types: resource types answered with a 1x1 GIF once headers arrive
+    allow:             URL globs never touched
+    """
+
+    def __init__(self, name, block=(), stubs=None, block_types=(), placeholder_types=(), allow=()):
+        self.name = name
+        self.block = list(block)
+        self.stubs = dict(stubs or {})
+        self.block_types = list(block_types)
+        self.placeholder_types = list(placeholder_types)
+        self.allow = list(allow)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        return cls(
+            data.get("name", path), data.get("block", ()), data.get("stubs"),
+            data.get("block_types", ()), data.get("placeholder_types", ()), data.get("allow", ()),
+        )
+
+    def patterns(self):
+        """Fetch.enable patterns: only matching requests ever pause"""
+        patterns = [{"urlPattern": glob, "requestStage": "Request"} for glob in self.block + list(self.stubs)]
+        # Type rules pause at the response so Content-Length tells how much was not downloaded
+        patterns += [
+            {"resourceType": kind, "requestStage": "Response"}
+            for kind in self.block_types + self.placeholder_types
+        ]
+        return patterns
+
+    def decide(self, url, resource_type):
+        """('block' | 'stub' | 'placeholder' | 'continue', rule)"""
+        if any(fnmatch.fnmatch(url, glob) for glob in self.allow):
+            return "continue", None
+        for glob, stub in self.stubs.items():
+            if fnmatch.fnmatch(url, glob):
+                return "stub", stub
+        for glob in self.block:
+            if fnmatch.fnmatch(url, glob):
+                return "block", glob
+        if resource_type in self.placeholder_types:
+            return "placeholder", resource_type
+        if resource_type in self.block_types:
+            return "block", resource_type
+        return "continue", None
+
+
+POLICIES = {
+    "off": None,
+    "functional": Policy(
+        "functional",
+        block=THIRD_PARTY,
+        stubs={"*/api/analytics*": {"status": 204, "body": ""}},
+        block_types=["Font", "Media"],
+        placeholder_types=["Image"],
+    ),
+    "third-party": Policy("third-party", block=THIRD_PARTY),
+}
+
+
+def load_policy(name_or_path):
+    if name_or_path in POLICIES:
+        return POLICIES[name_or_path]
+    return Policy.from_file(name_or_path)
+
+
+class InterceptStats:
+    """Requests and bytes the active policies kept off the network, for the whole run"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {"block": 0, "stub": 0, "placeholder": 0}
+        self.bytes_avoided = 0
+        self.hosts = {}
+        self.drivers = 0
+        self.unavailable = 0
+
+    def record(self, action, url, size):
+        host = urlsplit(url).netloc
+        with self._lock:
+            self.counts[action] += 1
+            self.bytes_avoided += size
+            self.hosts[host] = self.hosts.get(host, 0) + 1
+
+    @property
+    def requests_avoided(self):
+        return sum(self.counts.values())
+
+    def report(self):
+        if not self.drivers and not self.unavailable:
+            return []
+        lines = [
+            f"🚫 Request policy: {self.requests_avoided} requests avoided "
+            f"({self.counts['block']} blocked, {self.counts['stub']} stubbed, "
+            f"{self.counts['placeholder']} placeholder images), "
+            f"{self.bytes_avoided / 1024 / 1024:.1f} MB not downloaded across {self.drivers} browsers"
+        ]
+        top = sorted(self.hosts.items(), key=lambda item: -item[1])[:5]
+        if top:
+            lines.append("   " + ", ".join(f"{host} ×{count}" for host, count in top))
+        if self.unavailable:
+            lines.append(f"   ⚠️  {self.unavailable} browsers ran without interception (no DevTools connection)")
+        return lines
+
+
+class Interceptor:
+    """Applies a Policy to every tab of one browser through the DevTools Fetch domain"""
+
+    def __init__(self, driver, policy, stats):
+        self.policy = policy
+        self.stats = stats
+        self.session = CdpSession.for_driver(driver)
+        self.session.on("Fetch.requestPaused", self._paused)
+        patterns = policy.patterns()
+        self.session.attach_pages(
+            lambda session_id: self.session.send_async("Fetch.enable", {"patterns": patterns}, session_id)
+        )
+
+    def close(self):
+        self.session.close()
+
+    def _paused(self, params, session_id):
+        request_id = params["requestId"]
+        url = params["request"]["url"]
+        action, rule = self.policy.decide(url, params.get("resourceType"))
+        at_response = "responseStatusCode" in params or "responseErrorReason" in params
+
+        if action == "continue":
+            self.session.send_async("Fetch.continueRequest", {"requestId": request_id}, session_id)
+            return
+
+        size = _content_length(params.get("responseHeaders") or []) if at_response else 0
+        self.stats.record(action, url, size)
+
+        if action == "block":
+            self.session.send_async(
+                "Fetch.failRequest", {"requestId": request_id, "errorReason": "BlockedByClient"}, session_id
+            )
+        elif action == "stub":
+            body = rule.get("body", "")
+            if not isinstance(body, str):
+                body = json.dumps(body)
+            self.session.send_async("Fetch.fulfillRequest", {
+                "requestId": request_id,
+                "responseCode": rule.get("status", 200),
+                "responseHeaders": [{"name": "Content-Type", "value": rule.get("content_type", "application/json")}],
+                "body": base64.b64encode(body.encode("utf-8")).decode("ascii"),
+            }, session_id)
+        else:
+            self.session.send_async("Fetch.fulfillRequest", {
+                "requestId": request_id,
+                "responseCode": 200,
+                "responseHeaders": [{"name": "Content-Type", "value": "image/gif"}],
+                "body": PLACEHOLDER_GIF,
+            }, session_id)
+
+
+def _content_length(headers):
+    for header in headers:
+        if header["name"].lower() == "content-length":
+            try:
+                return int(header["value"])
+            except ValueError:
+                return 0
+    return 0
+
+
+_policy = None
+stats = InterceptStats()
+
+
+def set_policy(policy):
+    """Policy for drivers acquired from now on (None switches interception off)"""
+    global _policy
+    _policy = policy
+
+
+def current_policy():
+    return _policy
+
+
+def start_interception(driver):
+    """driver_pool acquire hook: put the current policy in front of this browser"""
+    if _policy is None:
+        return
+    try:
+        driver._interceptor = Interceptor(driver, _policy, stats)
+        stats.drivers += 1
+    except Exception:
+        stats.unavailable += 1
+
+
+def stop_interception(driver):
+    """driver_pool release hook; interception ends with the DevTools connection"""
+    interceptor = getattr(driver, "_interceptor", None)
+    if interceptor is not None:
+        interceptor.close()
+        driver._interceptor = None
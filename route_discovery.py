@@ -0,0 +1,154 @@
+import json
+import os
+import re
+import sys
+import threading
+import time
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MAX_AGE = float(os.environ.get("PAWFINDER_ROUTE_MAX_AGE", str(24 * 3600)))
+PROBE_TIMEOUT = 3
+PROBE_BYTES = 256 * 1024
+TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+
+_lock = threading.Lock()
+_resolved = {}
+
+
+def cache_path():
+    return os.environ.get("PAWFINDER_ROUTE_CACHE", os.path.join(HERE, ".route_cache.json"))
+
+
+def enabled():
+    return os.environ.get("PAWFINDER_ROUTE_CACHE") != "off"
+
+
+def probe(url):
+    """(status, final url, title, lower-cased body start) from one plain HTTP GET, no browser"""
+    request = Request(url, headers={"User-Agent": "pawfinder-route-probe"})
+    try:
+        with urlopen(request, timeout=PROBE_TIMEOUT) as response:
+            status, final_url = response.status, response.geturl()
+            body = response.read(PROBE_BYTES).decode("utf-8", "replace")
+    except HTTPError as error:
+        return error.code, url, "", ""
+    except (URLError, OSError, ValueError):
+        return None, url, "", ""
+
+    match = TITLE.search(body)
+    title = " ".join(match.group(1).split()) if match else ""
+    return status, final_url, title, body.lower()
+
+
+def looks_like(url, path, indicators):
+    """Same test the browser loop used: the page loads, is not a 404 and mentions an indicator"""
+    status, final_url, title, body = probe(url)
+    if status is None or status >= 400 or "404" in title:
+        return False
+    return (
+        any(indicator in title.lower() or indicator in body for indicator in indicators)
+        or path.lower() in final_url.lower()
+    )
+
+
+def _read():
+    try:
+        with open(cache_path(), encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write(entries):
+    path = cache_path()
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(entries, handle, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def _key(base_url, name):
+    return f"{base_url.rstrip('/')} {name}"
+
+
+def cached_route(base_url, name):
+    """URL found earlier in this process, or by any worker or run within MAX_AGE"""
+    key = _key(base_url, name)
+    with _lock:
+        if key in _resolved:
+            return _resolved[key]
+    if not enabled():
+        return None
+
+    entry = _read().get(key)
+    if entry and time.time() - entry["checked"] < MAX_AGE:
+        with _lock:
+            _resolved[key] = entry["url"]
+        return entry["url"]
+    return None
+
+
+def remember_route(base_url, name, url):
+    """Record a route found some other way (e.g. by following a link in the browser)"""
+    key = _key(base_url, name)
+    with _lock:
+        _resolved[key] = url
+    if not enabled():
+        return
+
+    entries = _read()
+    entries[key] = {"url": url, "checked": time.time()}
+    _write(entries)
+
+
+def forget_route(base_url, name):
+    """Drop a route that turned out to be wrong so the next lookup probes again"""
+    key = _key(base_url, name)
+    with _lock:
+        _resolved.pop(key, None)
+    if not enabled():
+        return
+    entries = _read()
+    if entries.pop(key, None) is not None:
+        _write(entries)
+
+
+def discover(base_url, name, paths, indicators):
+    """Resolve a logical route (e.g. 'sign-in') from candidate paths.
+
+    Answers from the cache when it can, otherwise probes the candidates over plain
+    HTTP in order. Returns the full URL, or None when no candidate looks right.
+    """
+    url = cached_route(base_url, name)
+    if url:
+        return url
+
+    for path in paths:
+        candidate = f"{base_url.rstrip('/')}{path}"
+        if looks_like(candidate, path, indicators):
+            remember_route(base_url, name, candidate)
+            return candidate
+    return None
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "clear":
+        if os.path.exists(cache_path()):
+            os.remove(cache_path())
+        print(f"🧹 Cleared {cache_path()}")
+        return 0
+
+    entries = _read()
+    if not entries:
+        print("🧭 No discovered routes")
+    for key, entry in sorted(entries.items()):
+        age = (time.time() - entry["checked"]) / 60
+        print(f"🧭 {key:<40} {entry['url']}  ({age:.0f} min old)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+import re
+from urllib.parse import urlsplit
+
+
+ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{24}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.I)
+
+
+def route_of(url):
+    """Route key for a URL: '/pets/5?tab=1' -> '/pets/<id>', 'http://host/' -> '/'"""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return url
+    segments = [
+        "<id>" if ID_SEGMENT.match(segment) else segment
+        for segment in parts.path.split("/") if segment
+    ]
+    return "/" + "/".join(segments)
@@ -0,0 +1,158 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STALE_AFTER_DAYS = 14
+
+_default_cache = None
+
+
+def cache_path():
+    return os.environ.get("PAWFINDER_SELECTOR_CACHE", os.path.join(HERE, ".selector_cache.json"))
+
+
+class SelectorCache:
+    """Remembers which fallback selector matched each logical element on each route.
+
+    Layout on disk: {route: {name: {"selectors": [...], "hits", "misses",
+    "last_hit", "last_miss", "updated"}}}.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or cache_path()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.entries = self._read()
+
+    def lookup(self, route, name):
+        """Selectors that won last time, or None"""
+        with self._lock:
+            entry = self.entries.get(route, {}).get(name)
+            return list(entry["selectors"]) if entry else None
+
+    def record_hit(self, route, name):
+        with self._lock:
+            entry = self.entries[route][name]
+            entry["hits"] += 1
+            entry["last_hit"] = time.time()
+            self._dirty = True
+
+    def record_miss(self, route, name, selectors):
+        """The cached selectors missed; remember the new winners, if there are any"""
+        now = time.time()
+        with self._lock:
+            entry = self.entries.setdefault(route, {}).setdefault(name, self._new_entry([]))
+            entry["misses"] += 1
+            entry["last_miss"] = now
+            if selectors:
+                entry["selectors"] = list(selectors)
+                entry["last_hit"] = now
+                entry["updated"] = now
+            self._dirty = True
+
+    def learn(self, route, name, selectors):
+        """First time this element is resolved on this route"""
+        with self._lock:
+            self.entries.setdefault(route, {})[name] = self._new_entry(selectors)
+            self._dirty = True
+
+    def stale_entries(self, max_age_days=STALE_AFTER_DAYS):
+        """(route, name, reason) for entries that no longer match or have not matched in a while"""
+        cutoff = time.time() - max_age_days * 86400
+        stale = []
+        with self._lock:
+            for route, names in sorted(self.entries.items()):
+                for name, entry in sorted(names.items()):
+                    if not entry["selectors"]:
+                        stale.append((route, name, "no selector matches any more"))
+                    elif (entry.get("last_miss") or 0) > (entry.get("last_hit") or 0):
+                        stale.append((route, name, f"{', '.join(entry['selectors'])} missed on last lookup"))
+                    elif (entry.get("last_hit") or 0) < cutoff:
+                        stale.append((route, name, f"not matched for over {max_age_days} days"))
+        return stale
+
+    def report(self):
+        stale = self.stale_entries()
+        if not stale:
+            return ["🗂️  Selector cache: no stale entries"]
+        lines = [f"🗂️  Selector cache: {len(stale)} stale entries"]
+        lines.extend(f"   {route:<16} {name:<20} {reason}" for route, name, reason in stale)
+        return lines
+
+    def save(self):
+        """Merge with whatever other workers wrote meanwhile, newest entry wins"""
+        with self._lock:
+            if not self._dirty:
+                return
+            merged = self._read()
+            for route, names in self.entries.items():
+                for name, entry in names.items():
+                    current = merged.setdefault(route, {}).get(name)
+                    if current is None or self._newest(entry) >= self._newest(current):
+                        merged[route][name] = entry
+            self.entries = merged
+
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump(merged, handle, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def _new_entry(self, selectors):
+        now = time.time()
+        return {
+            "selectors": list(selectors), "hits": 0, "misses": 0,
+            "last_hit": now, "last_miss": None, "updated": now,
+        }
+
+    def _newest(self, entry):
+        return max(entry.get("updated") or 0, entry.get("last_hit") or 0, entry.get("last_miss") or 0)
+
+
+def default_cache():
+    """Process-wide cache, or None when PAWFINDER_SELECTOR_CACHE=off"""
+    global _default_cache
+    if os.environ.get("PAWFINDER_SELECTOR_CACHE") == "off":
+        return None
+    if _default_cache is None:
+        _default_cache = SelectorCache()
+        atexit.register(_default_cache.save)
+    return _default_cache
+
+
+def loaded_cache():
+    """The process-wide cache if anything has used it"""
+    return _default_cache
+
+
+def main():
+    cache = SelectorCache()
+    if len(sys.argv) > 1 and sys.argv[1] == "clear":
+        if os.path.exists(cache.path):
+            os.remove(cache.path)
+        print(f"🧹 Cleared {cache.path}")
+        return 0
+
+    for route, names in sorted(cache.entries.items()):
+        print(route)
+        for name, entry in sorted(names.items()):
+            print(f"   {name:<20} {', '.join(entry['selectors']) or '-':<40} hits={entry['hits']} misses={entry['misses']}")
+    for line in cache.report():
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+import re
+import time
+from selenium.webdriver.common.by import By # type: ignore
+
+from routes import route_of
+from selector_cache import default_cache
+
+
+# Evaluates the whole candidate list in the page and returns the winning selector
+# with its elements. Candidates that are invalid in this browser are skipped.
+RESOLVE_JS = """
+const [candidates, mode, root, filters] = arguments;
+const scope = root || document;
+const keywords = (filters.text_any || []).map(k => k.toLowerCase());
+
+function query(candidate) {
+    if (candidate.kind === 'xpath') {
+        const result = document.evaluate(
+            candidate.selector, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        const nodes = [];
+        for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+        return nodes;
+    }
+    return Array.from(scope.querySelectorAll(candidate.selector));
+}
+
+function accept(el) {
+    if (filters.visible) {
+        const style = window.getComputedStyle(el);
+        if (!el.getClientRects().length || style.visibility === 'hidden' || style.display === 'none') {
+            return false;
+        }
+    }
+    if (filters.enabled && el.disabled) return false;
+    if (filters.min_height && el.getBoundingClientRect().height <= filters.min_height) return false;
+    if (keywords.length) {
+        const text = (el.innerText || '').toLowerCase();
+        if (!keywords.some(k => text.includes(k))) return false;
+    }
+    return true;
+}
+
+const seen = new Set();
+const elements = [];
+const winners = [];
+for (const candidate of candidates) {
+    let nodes;
+    try {
+        nodes = query(candidate);
+    } catch (e) {
+        continue;
+    }
+    const matched = nodes.filter(el => el.nodeType === 1 && !seen.has(el) && accept(el));
+    if (!matched.length) continue;
+    winners.push(candidate.selector);
+    if (mode === 'first') return {selectors: winners, elements: [matched[0]]};
+    matched.forEach(el => { seen.add(el); elements.push(el); });
+    if (mode === 'all') return {selectors: winners, elements: elements};
+}
+return {selectors: winners, elements: elements};
+"""
+
+CONTAINS = re.compile(r"^(?P<tag>[\w-]*):contains\(['\"](?P<text>.+)['\"]\)$")
+
+
+def to_candidate(selector):
+    """Normalise a selector string (or (By, value) pair) to {'kind', 'selector'}.
+
+    XPath is recognised by its leading '/', './' or '(' and jQuery-style
+    "tag:contains('Text')" is translated to the equivalent XPath.
+    """
+    if isinstance(selector, tuple):
+        by, value = selector
+        return {"kind": "xpath" if by == By.XPATH else "css", "selector": value}
+    if selector.startswith(("/", "./", "(")):
+        return {"kind": "xpath", "selector": selector}
+
+    contains = CONTAINS.match(selector)
+    if contains:
+        tag = contains.group("tag") or "*"
+        return {"kind": "xpath", "selector": f".//{tag}[contains(normalize-space(.), \"{contains.group('text')}\")]"}
+    return {"kind": "css", "selector": selector}
+
+
+class Match:
+    """Result of a resolve: the matching elements and the selector(s) that produced them"""
+
+    def __init__(self, selectors, elements):
+        self.selectors = selectors
+        self.elements = elements
+
+    @property
+    def selector(self):
+        return self.selectors[0] if self.selectors else None
+
+    @property
+    def element(self):
+        return self.elements[0] if self.elements else None
+
+    def __bool__(self):
+        return bool(self.elements)
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __iter__(self):
+        return iter(self.elements)
+
+
+class SelectorResolver:
+    """Resolves a fallback list of selectors in a single script round trip.
+
+    execute_script is not subject to implicitly_wait, so missing selectors cost
+    nothing instead of blocking for the full implicit wait each.
+
+    Passing name="search input" (a logical element name) makes the lookup go
+    through the per-route SelectorCache: last run's winner is tried on its own
+    first and the full list is only evaluated when it misses.
+    """
+
+    def __init__(self, driver, cache=None):
+        self.driver = driver
+        self.cache = default_cache() if cache is None else cache
+
+    def first(self, selectors, name=None, within=None, visible=True, enabled=True, timeout=0, **filters):
+        """First visible (and enabled) element across all candidates, in candidate order"""
+        return self._resolve(selectors, name, "first", within, dict(filters, visible=visible, enabled=enabled), timeout)
+
+    def all(self, selectors, name=None, within=None, visible=True, enabled=False, timeout=0, **filters):
+        """Every match of the first candidate that matches anything"""
+        return self._resolve(selectors, name, "all", within, dict(filters, visible=visible, enabled=enabled), timeout)
+
+    def union(self, selectors, name=None, within=None, visible=True, enabled=False, timeout=0, **filters):
+        """Every match of every candidate, de-duplicated, with all selectors that hit"""
+        return self._resolve(selectors, name, "union", within, dict(filters, visible=visible, enabled=enabled), timeout)
+
+    def _resolve(self, selectors, name, mode, within, filters, timeout):
+        if name is None or not self.cache or within is not None:
+            return self._run(selectors, mode, within, filters, timeout)
+
+        route = route_of(self.driver.current_url)
+        cached = self.cache.lookup(route, name)
+        if cached:
+            match = self._run(cached, mode, within, filters, 0)
+            if match:
+                self.cache.record_hit(route, name)
+                return match
+
+        match = self._run(selectors, mode, within, filters, timeout)
+        if cached:
+            self.cache.record_miss(route, name, match.selectors)
+        elif match:
+            self.cache.learn(route, name, match.selectors)
+        return match
+
+    def _run(self, selectors, mode, within, filters, timeout):
+        candidates = [to_candidate(selector) for selector in selectors]
+        deadline = time.time() + timeout
+        while True:
+            result = self.driver.execute_script(RESOLVE_JS, candidates, mode, within, filters)
+            match = Match(result["selectors"], result["elements"])
+            if match or time.time() >= deadline:
+                return match
+            time.sleep(0.1)
@@ -0,0 +1,34 @@
+from selenium.webdriver.chrome.options import Options # type: ignore
+
+from browser_daemon import CHROME_FLAGS, serves
+
+
+STATE = {"flags": CHROME_FLAGS}
+
+
+def chrome_options(*arguments):
+    options = Options()
+    for argument in arguments:
+        options.add_argument(argument)
+    return options
+
+
+def test_headless_subset_attaches():
+    assert serves(STATE, chrome_options("--headless", "--no-sandbox", "--window-size=1920,1080"))
+
+
+def test_headed_options_launch_their_own_chrome():
+    # The flags VeterinaryPageTests asks for: headed, everything else the daemon has
+    headed = chrome_options("--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu", "--window-size=1920,1080")
+    assert not serves(STATE, headed)
+    assert not serves(STATE, Options())
+
+
+def test_extra_flags_launch_their_own_chrome():
+    assert not serves(STATE, chrome_options("--headless=new", "--start-maximized"))
+    assert not serves(STATE, chrome_options("--headless=new", "--user-data-dir=/tmp/profile"))
+
+
+def test_headed_daemon_does_not_serve_headless_options():
+    headed_daemon = {"flags": [flag for flag in CHROME_FLAGS if not flag.startswith("--headless")]}
+    assert not serves(headed_daemon, chrome_options("--headless=new"))
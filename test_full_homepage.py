@@ -1,6 +1,5 @@
 
 
-import time
 from selenium import webdriver # type: ignore
 from selenium.webdriver.common.by import By # type: ignore
 from selenium.webdriver.common.keys import Keys # type: ignore
@@ -10,6 +9,13 @@ from selenium.webdriver.support.ui import Select # type: ignore
 from selenium.webdriver.chrome.options import Options # type: ignore
 from selenium.common.exceptions import TimeoutException, NoSuchElementException # type: ignore
 
+from driver_pool import acquire_driver, release_driver
+from readiness import Readiness
+from selector_resolver import SelectorResolver
+from dom_snapshot import snapshot
+from offline_dom import capture
+from interaction_profiler import InteractionProfiler
+
 
 class HomepagePetTests:
 
@@ -18,6 +24,9 @@ class HomepagePetTests:
         self.setup_driver()
         self.base_url = "http://localhost:3000/"
         self.wait = WebDriverWait(self.driver, 12)
+        self.ready = Readiness(self.driver)
+        self.resolver = SelectorResolver(self.driver)
+        self.interactions = InteractionProfiler(self.driver)
     
     def setup_driver(self):
        
@@ -26,7 +35,7 @@ class HomepagePetTests:
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--window-size=1920,1080")
         
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = acquire_driver(chrome_options)
         self.driver.implicitly_wait(8)
         print(" WebDriver initialized")
     
@@ -34,7 +43,7 @@ class HomepagePetTests:
         """Navigate to homepage"""
         print(f" Loading {self.base_url}")
         self.driver.get(self.base_url)
-        time.sleep(3)
+        self.ready.settled()
         print(f" Page loaded: {self.driver.title}")
     
     
@@ -54,20 +63,11 @@ class HomepagePetTests:
             ".search-input", "#search", ".pet-search"
         ]
         
-        search_input = None
-        for selector in search_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        search_input = element
-                        placeholder = element.get_attribute('placeholder') or ''
-                        print(f" Found search input: {selector} ('{placeholder}')")
-                        break
-                if search_input:
-                    break
-            except:
-                continue
+        match = self.resolver.first(search_selectors, name="search input")
+        search_input = match.element
+        if search_input:
+            placeholder = search_input.get_attribute('placeholder') or ''
+            print(f" Found search input: {match.selector} ('{placeholder}')")
         
         if not search_input:
             print("  No search input found on homepage")
@@ -81,8 +81,9 @@ class HomepagePetTests:
                 print(f" Searching for: {term}")
                 search_input.clear()
                 search_input.send_keys(term)
-                search_input.send_keys(Keys.ENTER)
-                time.sleep(3)
+                with self.interactions.measure("search", term):
+                    search_input.send_keys(Keys.ENTER)
+                self.ready.settled()
                 
                
                 new_url = self.driver.current_url
@@ -96,13 +97,10 @@ class HomepagePetTests:
                     "[data-testid*='results']", ".pets", ".listings"
                 ]
                 
-                for indicator in result_indicators:
-                    try:
-                        if self.driver.find_elements(By.CSS_SELECTOR, indicator):
-                            print(" Search results appeared on page")
-                            return True
-                    except:
-                        continue
+                page = capture(self.driver)
+                if any(page.exists(indicator) for indicator in result_indicators):
+                    print(" Search results appeared on page")
+                    return True
                 
             except Exception as e:
                 print(f" Search error for '{term}': {e}")
@@ -126,28 +124,12 @@ class HomepagePetTests:
         ]
         
       
-        nav_elements = []
-        
-      
-        for selector in nav_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                nav_elements.extend([el for el in elements if el.is_displayed()])
-            except:
-                continue
-        
-        
         text_searches = [
             "//a[contains(text(), 'Find') or contains(text(), 'Adopt') or contains(text(), 'Browse')]",
             "//button[contains(text(), 'Find') or contains(text(), 'Adopt') or contains(text(), 'Browse')]"
         ]
         
-        for xpath in text_searches:
-            try:
-                elements = self.driver.find_elements(By.XPATH, xpath)
-                nav_elements.extend([el for el in elements if el.is_displayed()])
-            except:
-                continue
+        nav_elements = self.resolver.union(nav_selectors + text_searches, name="find pets link").elements
         
         if not nav_elements:
             print(" No 'Find Pets' navigation found")
@@ -156,17 +138,20 @@ class HomepagePetTests:
         print(f" Found {len(nav_elements)} potential pet navigation elements")
         
       
-        for element in nav_elements[:3]: 
+        # Read every candidate in one round trip before the clicks below navigate away
+        for item in snapshot(self.driver, nav_elements[:3]): 
+            element = item.element
             try:
-                element_text = element.text.lower()
-                element_tag = element.tag_name
-                href = element.get_attribute('href') if element_tag == 'a' else ''
+                element_text = item.text.lower()
+                element_tag = item.tag
+                href = item.attr('href', '') if element_tag == 'a' else ''
                 
                 print(f" Testing navigation: '{element_text}' ({element_tag})")
                 
                 initial_url = self.driver.current_url
                 self.driver.execute_script("arguments[0].click();", element)
-                time.sleep(3)
+                self.ready.route_change(initial_url, timeout=3)
+                self.ready.settled()
                 
                 new_url = self.driver.current_url
                 if new_url != initial_url:
@@ -200,17 +185,10 @@ class HomepagePetTests:
             ".adoption-card", ".pet-profile"
         ]
         
-        pet_cards = []
-        for selector in pet_card_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    if element.is_displayed() and element.size['height'] > 50:
-                        text = element.text.lower()
-                        if any(keyword in text for keyword in ['breed', 'age', 'adopt', 'months', 'years', 'male', 'female']):
-                            pet_cards.append(element)
-            except:
-                continue
+        pet_cards = self.resolver.union(
+            pet_card_selectors, name="pet card", min_height=50,
+            text_any=['breed', 'age', 'adopt', 'months', 'years', 'male', 'female']
+        ).elements
         
         if pet_cards:
             print(f" Found {len(pet_cards)} pet cards on homepage")
@@ -236,14 +214,12 @@ class HomepagePetTests:
                 "[data-testid*='featured']", ".pets-section"
             ]
             
+            page = capture(self.driver)
             for selector in featured_selectors:
-                try:
-                    section = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if section.is_displayed():
-                        print(f" Found pets section: {selector}")
-                        return True
-                except:
-                    continue
+                sections = page.select(selector)
+                if sections and sections[0].visible:
+                    print(f" Found pets section: {selector}")
+                    return True
             
             print(" No pet cards found on homepage - might be on dedicated page")
             return True
@@ -264,10 +240,8 @@ class HomepagePetTests:
         filters_found = []
         for selector in filter_selectors:
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    if element.is_displayed():
-                        filters_found.append((element, selector))
+                for item in snapshot(self.driver, selector, visible_only=True):
+                    filters_found.append((item.element, selector))
             except:
                 continue
         
@@ -280,10 +254,8 @@ class HomepagePetTests:
         
         for selector in filter_button_selectors:
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    if element.is_displayed():
-                        filters_found.append((element, selector))
+                for item in snapshot(self.driver, selector, visible_only=True):
+                    filters_found.append((item.element, selector))
             except:
                 continue
         
@@ -306,8 +278,9 @@ class HomepagePetTests:
                 if len(options) > 1:
                     
                     initial_page = self.driver.page_source
-                    select.select_by_index(1)
-                    time.sleep(2)
+                    with self.interactions.measure("filter", selector_used):
+                        select.select_by_index(1)
+                    self.ready.settled()
                     
                     new_page = self.driver.page_source
                     if new_page != initial_page:
@@ -318,8 +291,8 @@ class HomepagePetTests:
                 print(f" Testing filter button: {selector_used}")
                 
                 initial_page = self.driver.page_source
-                self.driver.execute_script("arguments[0].click();", first_filter)
-                time.sleep(2)
+                self.interactions.click(first_filter, "filter", selector_used)
+                self.ready.settled()
                 
                 new_page = self.driver.page_source
                 if new_page != initial_page:
@@ -344,22 +317,9 @@ class HomepagePetTests:
             ".fa-heart", ".heart-icon"
         ]
         
-        favorite_buttons = []
-        for selector in favorite_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                favorite_buttons.extend([el for el in elements if el.is_displayed()])
-            except:
-                continue
-        
-       
-        try:
-            xpath_favorites = self.driver.find_elements(
-                By.XPATH, "//button[contains(@aria-label, 'favorite') or contains(text(), '♥') or contains(text(), '🤍') or contains(text(), '❤')]"
-            )
-            favorite_buttons.extend([btn for btn in xpath_favorites if btn.is_displayed()])
-        except:
-            pass
+        favorite_buttons = self.resolver.union(favorite_selectors + [
+            "//button[contains(@aria-label, 'favorite') or contains(text(), '♥') or contains(text(), '🤍') or contains(text(), '❤')]"
+        ], name="favorite button").elements
         
         if not favorite_buttons:
             print("  No favorite buttons found")
@@ -377,8 +337,8 @@ class HomepagePetTests:
             initial_aria = first_fav.get_attribute('aria-label') or ''
             
             
-            self.driver.execute_script("arguments[0].click();", first_fav)
-            time.sleep(1)
+            self.interactions.click(first_fav, "favorite")
+            self.ready.dom_quiet()
             
             
             new_class = first_fav.get_attribute('class') or ''
@@ -394,14 +354,12 @@ class HomepagePetTests:
                 "[data-testid*='notification']"
             ]
             
+            page = capture(self.driver)
             for selector in notification_selectors:
-                try:
-                    notifications = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if notifications and notifications[0].is_displayed():
-                        print(" Favorite action showed feedback")
-                        return True
-                except:
-                    continue
+                notifications = page.select(selector)
+                if notifications and notifications[0].visible:
+                    print(" Favorite action showed feedback")
+                    return True
             
         except Exception as e:
             print(f" Favorite test error: {e}")
@@ -457,7 +415,7 @@ class HomepagePetTests:
     def cleanup(self):
         
         try:
-            self.driver.quit()
+            release_driver(self.driver)
             print("\n Browser closed")
         except:
             pass
@@ -2,10 +2,11 @@ from selenium import webdriver # type: ignore
 from selenium.webdriver.common.by import By # type: ignore
 from selenium.webdriver.support.ui import WebDriverWait # type: ignore
 from selenium.webdriver.support import expected_conditions as EC # type: ignore
-import time
+
+from driver_pool import acquire_driver, release_driver
 
 def test_homepage_loads_and_signin_button():
-    driver = webdriver.Chrome()
+    driver = acquire_driver()
     driver.get("http://localhost:3000/")
 
     try:
@@ -34,7 +35,6 @@ def test_homepage_loads_and_signin_button():
         print(driver.page_source)  
 
     finally:
-        time.sleep(2)
-        driver.quit()
+        release_driver(driver)
 
 #thik ase
\ No newline at end of file
@@ -1,31 +1,44 @@
 from selenium import webdriver # type: ignore
 from selenium.webdriver.common.by import By # type: ignore
-from selenium.webdriver.chrome.service import Service # type: ignore
 from selenium.webdriver.support.ui import WebDriverWait # type: ignore
 from selenium.webdriver.support import expected_conditions as EC # type: ignore
-import time
+
+from auth_state import capture_state, enabled, load_state, restore_state, save_state
+from auth_stub import stub_url
+from driver_pool import acquire_driver, release_driver
+from readiness import Readiness
+
+GOOGLE_ACCOUNT = "google"
 
 def setup_driver():
     options = webdriver.ChromeOptions()
     
-    # Optional: use a persistent user profile to stay signed into Google
-    options.add_argument("--user-data-dir=/tmp/selenium")  # path to profile
-    options.add_argument("--start-maximized")
+    # Headless in a throwaway profile; a signed-in Google session comes from auth_state
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
     
-    service = Service()
-    driver = webdriver.Chrome(service=service, options=options)
-    return driver
+    return acquire_driver(options)
 
 def test_google_signin():
     driver = setup_driver()
     wait = WebDriverWait(driver, 20)
+    ready = Readiness(driver)
 
     try:
+        # A saved Google session lets the popup finish on its own instead of waiting for a human
+        saved = load_state(GOOGLE_ACCOUNT) if enabled() else None
+        if saved is not None:
+            restore_state(driver, saved)
+            print("🔐 Restored saved Google session")
+
         driver.get("http://localhost:3000/sign-in")
 
-        # Wait for iframe
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "iframe")))
-        iframe = driver.find_element(By.TAG_NAME, "iframe")
+        # Wait for iframe; with the stand-in running it must be the one served from there
+        provider = stub_url()
+        frame = (By.CSS_SELECTOR, f"iframe[src^='{provider}']") if provider else (By.TAG_NAME, "iframe")
+        iframe = wait.until(EC.presence_of_element_located(frame))
         driver.switch_to.frame(iframe)
 
         # Wait for Google Sign-In button
@@ -33,24 +46,35 @@ def test_google_signin():
         google_btn.click()
 
         # Switch to the new window
-        time.sleep(3)
+        ready.until(lambda d: len(d.window_handles) > 1, timeout=3)
         driver.switch_to.window(driver.window_handles[-1])
 
-        print("🟡 Waiting for manual Google sign-in or use of saved session...")
-        time.sleep(20)  # Give time for manual login if not already signed in
+        if provider:
+            # The local stand-in consents immediately and closes the popup itself
+            popup_timeout = 5
+        else:
+            print("🟡 No auth stand-in (--auth-stub); waiting for the saved Google session...")
+            popup_timeout = 20
+        # The popup closes once the provider has signed the browser in
+        ready.until(lambda d: len(d.window_handles) == 1, timeout=popup_timeout)
 
         # Switch back to original window
         driver.switch_to.window(driver.window_handles[0])
         driver.switch_to.default_content()
 
-        time.sleep(5)
+        ready.settled(timeout=5)
         assert "localhost:3000" in driver.current_url
+        if enabled():
+            save_state(capture_state(driver, GOOGLE_ACCOUNT))
         print("✅ Google Sign-In test passed.")
     
     except Exception as e:
         print(f"❌ Test failed: {e}")
+        # Against the stand-in nothing waits on a human, so a failure is a real one
+        if stub_url():
+            raise
     finally:
-        driver.quit()
+        release_driver(driver)
 
 if __name__ == "__main__":
     test_google_signin()
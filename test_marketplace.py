@@ -1,6 +1,5 @@
 
 
-import time
 from selenium import webdriver # type: ignore
 from selenium.webdriver.common.by import By # type: ignore
 from selenium.webdriver.common.keys import Keys # type: ignore
@@ -9,6 +8,11 @@ from selenium.webdriver.support import expected_conditions as EC # type: ignore
 from selenium.webdriver.chrome.options import Options # type: ignore
 from selenium.common.exceptions import TimeoutException, NoSuchElementException # type: ignore
 
+from auth_state import signed_in
+from driver_pool import acquire_driver, release_driver
+from readiness import Readiness
+from selector_resolver import SelectorResolver
+
 
 LOGIN_REQUIRED = True
 LOGIN_URL = "http://localhost:3000/sign-in"
@@ -19,6 +23,8 @@ class MarketplaceTests:
     def __init__(self):
         self.setup_driver()
         self.wait = WebDriverWait(self.driver, 10)
+        self.ready = Readiness(self.driver)
+        self.resolver = SelectorResolver(self.driver)
         self.base_url = "http://localhost:3000/marketplace"
 
     def setup_driver(self):
@@ -28,13 +34,27 @@ class MarketplaceTests:
         chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument("--headless=new")  
 
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = acquire_driver(chrome_options)
         self.driver.implicitly_wait(8)
         print("✅ WebDriver initialized")
 
     def login_if_needed(self):
         if not LOGIN_REQUIRED:
             return
+        # The form is only submitted once per run; later tests get the saved session injected
+        if signed_in(self.driver, USERNAME, self.submit_login, self.has_session):
+            print("✅ Signed in")
+
+    def has_session(self):
+        """The marketplace opens without a sign-in redirect and offers to sign out"""
+        self.navigate_to_marketplace()
+        if "sign-in" in self.driver.current_url:
+            return False
+        return bool(self.driver.find_elements(
+            By.XPATH, "//a[contains(@href, 'sign-out')] | //button[contains(., 'Sign Out') or contains(., 'Sign out')]"
+        ))
+
+    def submit_login(self):
         print("🔐 Logging in...")
         self.driver.get(LOGIN_URL)
 
@@ -42,14 +62,19 @@ class MarketplaceTests:
             self.driver.find_element(By.NAME, "email").send_keys(USERNAME)
             self.driver.find_element(By.NAME, "password").send_keys(PASSWORD)
             self.driver.find_element(By.TAG_NAME, "form").submit()
-            time.sleep(2)
+            if not self.ready.route_change(LOGIN_URL, timeout=2):
+                print("❌ Login failed: still on the sign-in page")
+                return False
+            self.ready.settled()
             print("✅ Logged in successfully")
+            return True
         except Exception as e:
             print(f"❌ Login failed: {e}")
+            return False
 
     def navigate_to_marketplace(self):
         self.driver.get(self.base_url)
-        time.sleep(2)
+        self.ready.settled()
         print(f"🌐 Loaded {self.driver.current_url}")
 
     def test_page_loads_with_products(self):
@@ -68,17 +93,10 @@ class MarketplaceTests:
             ".grid > div", ".products .product"
         ]
 
-        products_found = 0
-        for selector in product_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                visible = [e for e in elements if e.is_displayed()]
-                if visible:
-                    print(f"✅ Found {len(visible)} product(s) with selector: {selector}")
-                    products_found = len(visible)
-                    break
-            except:
-                continue
+        products = self.resolver.all(product_selectors, name="product card")
+        products_found = len(products)
+        if products:
+            print(f"✅ Found {products_found} product(s) with selector: {products.selector}")
 
         if products_found == 0:
             print("⚠️  No products visible. Here's part of the page source:")
@@ -134,7 +152,7 @@ class MarketplaceTests:
 
     def cleanup(self):
         try:
-            self.driver.quit()
+            release_driver(self.driver)
             print("🧹 Browser closed")
         except:
             pass
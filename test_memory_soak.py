@@ -0,0 +1,184 @@
+import pytest # type: ignore
+import sys
+from selenium.webdriver.chrome.options import Options # type: ignore
+
+from driver_pool import acquire_driver, release_driver
+from readiness import Readiness
+
+
+ROUTES = ["/", "/pets/5", "/marketplace", "/veterinary"]
+# Allowed growth per cycle, per route, once the first (warm-up) cycle is discarded
+DEFAULT_LIMITS = {"heap_kb": 512, "nodes": 200, "listeners": 50}
+
+# Client-side navigation keeps the same JS heap alive, which is where a leak shows;
+# a full page load would throw the heap away every time
+CLIENT_NAVIGATE_JS = """
+const path = arguments[0];
+if (window.next && window.next.router && window.next.router.push) {
+    window.next.router.push(path);
+    return 'router';
+}
+const link = Array.from(document.querySelectorAll('a[href]')).find(a => a.getAttribute('href') === path);
+if (link) {
+    link.click();
+    return 'link';
+}
+return null;
+"""
+
+
+def parse_limits(text):
+    """'heap_kb=512,nodes=200' -> DEFAULT_LIMITS with those values replaced"""
+    limits = dict(DEFAULT_LIMITS)
+    for part in filter(None, (text or "").split(",")):
+        name, _, value = part.partition("=")
+        if name.strip() not in DEFAULT_LIMITS:
+            raise ValueError(f"unknown soak limit {name!r} (choose from {', '.join(DEFAULT_LIMITS)})")
+        limits[name.strip()] = float(value)
+    return limits
+
+
+def slope(values):
+    """Least-squares growth per cycle"""
+    count = len(values)
+    if count < 2:
+        return 0.0
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    spread = sum((x - mean_x) ** 2 for x in range(count))
+    return sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values)) / spread
+
+
+class MemorySoakTests:
+    """Navigates the main routes over and over in one session and watches memory after each cycle"""
+
+    def __init__(self, cycles=10, limits=None):
+        self.base_url = "http://localhost:3000"
+        # Growth is fitted over the cycles after the warm-up one, so at least two of those
+        self.cycles = max(cycles, 3)
+        self.limits = limits or dict(DEFAULT_LIMITS)
+        self.samples = {route: [] for route in ROUTES}
+        self.navigation_modes = {}
+        self.setup_driver()
+        self.ready = Readiness(self.driver)
+
+    def setup_driver(self):
+        chrome_options = Options()
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--window-size=1920,1080")
+
+        self.driver = acquire_driver(chrome_options)
+        print("✅ WebDriver initialized")
+
+    def navigate(self, route):
+        """Client-side when the app allows it, otherwise a full load"""
+        mode = None
+        if not self.driver.current_url.startswith(self.base_url):
+            self.driver.get(self.base_url + route)
+        else:
+            mode = self.driver.execute_script(CLIENT_NAVIGATE_JS, route)
+            if mode is None:
+                self.driver.get(self.base_url + route)
+            else:
+                self.ready.url_contains(route)
+        self.ready.settled()
+        self.navigation_modes[route] = mode or "full load"
+
+    def sample(self):
+        """JS heap, DOM nodes and event listeners after forcing GC"""
+        self.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        self.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        heap = self.driver.execute_cdp_cmd("Runtime.getHeapUsage", {})
+        counters = self.driver.execute_cdp_cmd("Memory.getDOMCounters", {})
+        return {
+            "heap_kb": heap["usedSize"] / 1024,
+            "nodes": counters["nodes"],
+            "listeners": counters["jsEventListeners"],
+        }
+
+    def soak(self):
+        print(f"\n🧪 Memory soak: {self.cycles} cycles over {', '.join(ROUTES)}")
+        print("-" * 50)
+        for cycle in range(self.cycles):
+            for route in ROUTES:
+                self.navigate(route)
+                self.samples[route].append(self.sample())
+            last = self.samples[ROUTES[-1]][-1]
+            print(f"🔁 Cycle {cycle + 1}: heap {last['heap_kb']:.0f}KB, {last['nodes']} nodes, "
+                  f"{last['listeners']} listeners")
+
+    def growth(self):
+        """{route: {metric: growth per cycle}}, ignoring the warm-up cycle"""
+        return {
+            route: {
+                metric: slope([sample[metric] for sample in samples[1:]]) for metric in DEFAULT_LIMITS
+            }
+            for route, samples in self.samples.items() if len(samples) > 2
+        }
+
+    def report(self):
+        growth = self.growth()
+        failures = []
+        print("\n📊 Growth per cycle (after warm-up)")
+        print(f"{'route':<14} {'navigation':<11} {'heap KB':>9} {'nodes':>8} {'listeners':>10}")
+        for route, metrics in growth.items():
+            over = [metric for metric, value in metrics.items() if value > self.limits[metric]]
+            failures.extend(f"{route} {metric} +{metrics[metric]:.1f}/cycle > {self.limits[metric]:g}" for metric in over)
+            first, last = self.samples[route][1], self.samples[route][-1]
+            print(
+                f"{route:<14} {self.navigation_modes.get(route, '-'):<11} {metrics['heap_kb']:>+9.1f} "
+                f"{metrics['nodes']:>+8.1f} {metrics['listeners']:>+10.1f}  "
+                f"{'❌' if over else '✅'} (heap {first['heap_kb']:.0f} → {last['heap_kb']:.0f}KB)"
+            )
+        for failure in failures:
+            print(f"❌ {failure}")
+        return failures
+
+    def test_memory_stays_flat(self):
+        self.soak()
+        failures = self.report()
+        print(f"🎯 Test Result: {'✅ PASSED' if not failures else '❌ FAILED'}")
+        return not failures
+
+    def cleanup(self):
+        try:
+            release_driver(self.driver)
+            print("🧹 Browser closed")
+        except Exception:
+            pass
+
+
+def main():
+    """python test_memory_soak.py [CYCLES]"""
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print("PawFinder memory soak")
+    print("Make sure your Next.js app is running on http://localhost:3000")
+
+    tester = MemorySoakTests(cycles)
+    try:
+        return 0 if tester.test_memory_stays_flat() else 1
+    except KeyboardInterrupt:
+        print("\n⏹️  Soak interrupted")
+        return 1
+    finally:
+        tester.cleanup()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+class TestMemorySoak:
+    @pytest.fixture(autouse=True)
+    def setup(self, request):
+        cycles = request.config.getoption("--soak-cycles")
+        if not cycles:
+            pytest.skip("memory soak runs only with --soak-cycles N")
+        self.tester = MemorySoakTests(cycles, parse_limits(request.config.getoption("--soak-limits")))
+        yield
+        self.tester.cleanup()
+
+    def test_memory_stays_flat(self):
+        assert self.tester.test_memory_stays_flat()
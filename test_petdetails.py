@@ -4,7 +4,8 @@ from selenium.webdriver.common.by import By # type: ignore
 from selenium.webdriver.chrome.options import Options # type: ignore
 from selenium.webdriver.support.ui import WebDriverWait # type: ignore
 from selenium.webdriver.support import expected_conditions as EC # type: ignore
-import time
+
+from driver_pool import acquire_driver, release_driver
 
 
 class PetDetailPageTests:
@@ -22,11 +23,11 @@ class PetDetailPageTests:
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--no-sandbox")
 
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = acquire_driver(chrome_options)
         self.driver.implicitly_wait(10)
 
     def cleanup(self):
-        self.driver.quit()
+        release_driver(self.driver)
 
     def test_page_loads(self):
         """Check if the pet details page loads successfully"""
@@ -1,5 +1,4 @@
 
-import time
 import pytest # type: ignore
 from selenium import webdriver # type: ignore
 from selenium.webdriver.common.by import By # type: ignore
@@ -14,6 +13,16 @@ from selenium.common.exceptions import ( # type: ignore
     ElementClickInterceptedException
 )
 
+from auth_stub import stub_url
+from driver_pool import acquire_driver, release_driver
+from readiness import Readiness
+from selector_resolver import SelectorResolver
+from dom_snapshot import snapshot
+from route_discovery import discover, forget_route, remember_route
+
+
+SIGNIN_INDICATORS = ["sign in", "login", "email", "password", "authenticate"]
+
 
 class SignInPageTests:
    
@@ -25,6 +34,8 @@ class SignInPageTests:
             "/sign-in", "/signin", "/login", "/auth/signin", "/auth/login"
         ]
         self.wait = WebDriverWait(self.driver, 15)
+        self.ready = Readiness(self.driver)
+        self.resolver = SelectorResolver(self.driver)
         
        
         self.test_credentials = {
@@ -43,76 +54,26 @@ class SignInPageTests:
         chrome_options.add_argument("--window-size=1920,1080")
        
         
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = acquire_driver(chrome_options)
         self.driver.implicitly_wait(10)
         print("✅ WebDriver initialized for sign-in tests")
     
     def find_signin_page(self):
-        """Find and navigate to the sign-in page"""
-        signin_url = None
+        """Navigate to the sign-in page; its route is discovered once and shared via route_discovery"""
+        signin_url = discover(self.base_url, "sign-in", self.signin_urls, SIGNIN_INDICATORS)
         
-        
-        for url_path in self.signin_urls:
-            test_url = f"{self.base_url}{url_path}"
-            try:
-                print(f"🔍 Trying: {test_url}")
-                self.driver.get(test_url)
-                time.sleep(2)
-                
-                current_url = self.driver.current_url
-                page_title = self.driver.title.lower()
-                page_source = self.driver.page_source.lower()
-                
-                
-                signin_indicators = [
-                    "sign in", "login", "email", "password", "authenticate"
-                ]
-                
-                is_signin_page = (
-                    any(indicator in page_title for indicator in signin_indicators) or
-                    any(indicator in page_source for indicator in signin_indicators) or
-                    url_path.lower() in current_url.lower()
-                )
-                
-                if is_signin_page and "404" not in page_title:
-                    signin_url = test_url
-                    print(f"✅ Found sign-in page: {signin_url}")
-                    break
-                    
-            except Exception as e:
-                print(f"❌ Error accessing {test_url}: {e}")
-                continue
+        if signin_url:
+            self.driver.get(signin_url)
+            self.ready.settled()
+            if "404" in self.driver.title:
+                print(f"❌ Cached sign-in route is gone: {signin_url}")
+                forget_route(self.base_url, "sign-in")
+                signin_url = None
         
         if not signin_url:
-            
-            self.driver.get(self.base_url)
-            time.sleep(2)
-            
-            signin_link_selectors = [
-                "a[href*='sign-in']", "a[href*='signin']", "a[href*='login']",
-                "a:contains('Sign In')", "a:contains('Login')",
-                "[data-testid*='signin']", "[data-testid*='login']",
-                ".signin-link", ".login-link"
-            ]
-            
-            for selector in signin_link_selectors:
-                try:
-                    
-                    if "contains" in selector:
-                        xpath = f"//a[contains(text(), 'Sign In') or contains(text(), 'Login') or contains(text(), 'Sign in')]"
-                        links = self.driver.find_elements(By.XPATH, xpath)
-                    else:
-                        links = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    if links and links[0].is_displayed():
-                        print(f"🔗 Found sign-in link: {selector}")
-                        links[0].click()
-                        time.sleep(2)
-                        signin_url = self.driver.current_url
-                        break
-                        
-                except Exception:
-                    continue
+            signin_url = self.follow_signin_link()
+            if signin_url:
+                remember_route(self.base_url, "sign-in", signin_url)
         
         if signin_url:
             print(f"📍 Using sign-in page: {signin_url}")
@@ -121,6 +82,29 @@ class SignInPageTests:
             print("❌ Could not find sign-in page")
             return None
     
+    def follow_signin_link(self):
+        """Fallback when no candidate URL works: follow a sign-in link from the homepage"""
+        self.driver.get(self.base_url)
+        self.ready.settled()
+        
+        signin_link_selectors = [
+            "a[href*='sign-in']", "a[href*='signin']", "a[href*='login']",
+            "a:contains('Sign In')", "a:contains('Sign in')", "a:contains('Login')",
+            "[data-testid*='signin']", "[data-testid*='login']",
+            ".signin-link", ".login-link"
+        ]
+        
+        # execute_script ignores the implicit wait, so missing candidates cost nothing
+        match = self.resolver.first(signin_link_selectors, name="sign-in link", enabled=False)
+        if not match:
+            return None
+        
+        print(f"🔗 Found sign-in link: {match.selector}")
+        match.element.click()
+        self.ready.route_change(self.base_url + "/", timeout=2)
+        self.ready.settled()
+        return self.driver.current_url
+    
     def get_form_elements(self):
         """Get sign-in form elements"""
         elements = {}
@@ -133,15 +117,10 @@ class SignInPageTests:
             "[data-testid*='email']", "[data-testid*='username']"
         ]
         
-        for selector in email_selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if element.is_displayed() and element.is_enabled():
-                    elements['email'] = element
-                    print(f"✅ Found email field: {selector}")
-                    break
-            except:
-                continue
+        match = self.resolver.first(email_selectors, name="email input")
+        if match:
+            elements['email'] = match.element
+            print(f"✅ Found email field: {match.selector}")
         
    
         password_selectors = [
@@ -149,16 +128,10 @@ class SignInPageTests:
             "[data-testid*='password']", ".password-input"
         ]
         
-        for selector in password_selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if element.is_displayed() and element.is_enabled():
-                    elements['password'] = element
-                    print(f"✅ Found password field: {selector}")
-                    break
-            except:
-                continue
-        
+        match = self.resolver.first(password_selectors, name="password input")
+        if match:
+            elements['password'] = match.element
+            print(f"✅ Found password field: {match.selector}")
         
         submit_selectors = [
             "button[type='submit']", "input[type='submit']",
@@ -167,20 +140,10 @@ class SignInPageTests:
             ".signin-btn", ".login-btn", ".submit-btn"
         ]
         
-        for selector in submit_selectors:
-            try:
-                if "contains" in selector:
-                    xpath = "//button[contains(text(), 'Sign In') or contains(text(), 'Login') or contains(text(), 'Submit')]"
-                    element = self.driver.find_element(By.XPATH, xpath)
-                else:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                if element.is_displayed() and element.is_enabled():
-                    elements['submit'] = element
-                    print(f"✅ Found submit button: {selector}")
-                    break
-            except:
-                continue
+        match = self.resolver.first(submit_selectors, name="submit button")
+        if match:
+            elements['submit'] = match.element
+            print(f"✅ Found submit button: {match.selector}")
         
         return elements
     
@@ -225,7 +188,7 @@ class SignInPageTests:
         print("🔘 Testing empty form submission...")
         try:
             elements['submit'].click()
-            time.sleep(2)
+            self.ready.settled()
             
             
             error_selectors = [
@@ -274,7 +237,7 @@ class SignInPageTests:
                 elements['password'].send_keys("somepassword")
             
             elements['submit'].click()
-            time.sleep(2)
+            self.ready.settled()
             
             
             current_url = self.driver.current_url
@@ -313,7 +276,8 @@ class SignInPageTests:
            
             initial_url = self.driver.current_url
             submit_element.click()
-            time.sleep(3)
+            self.ready.route_change(initial_url, timeout=3)
+            self.ready.settled()
             
            
             new_url = self.driver.current_url
@@ -398,7 +362,9 @@ class SignInPageTests:
                             
                             initial_type = password_element.get_attribute('type')
                             toggle.click()
-                            time.sleep(1)
+                            self.ready.until(
+                                lambda d: password_element.get_attribute('type') != initial_type, timeout=1
+                            )
                             
                             new_type = password_element.get_attribute('type')
                             
@@ -471,7 +437,7 @@ class SignInPageTests:
                
                 initial_state = remember_element.is_selected()
                 remember_element.click()
-                time.sleep(0.5)
+                self.ready.until(lambda d: remember_element.is_selected() != initial_state, timeout=0.5)
                 
                 new_state = remember_element.is_selected()
                 
@@ -524,7 +490,7 @@ class SignInPageTests:
                
                 initial_url = self.driver.current_url
                 forgot_link.click()
-                time.sleep(2)
+                self.ready.route_change(initial_url, timeout=2)
                 
                 new_url = self.driver.current_url
                 
@@ -533,7 +499,7 @@ class SignInPageTests:
                     
                    
                     self.driver.back()
-                    time.sleep(1)
+                    self.ready.settled()
                 else:
                     print("⚠️  Forgot password link clicked but no navigation")
                     
@@ -544,10 +510,51 @@ class SignInPageTests:
         
         return True
     
+    def check_stand_in_google_login(self, provider):
+        """Google button in the stand-in's sign-in iframe must finish the popup sign-in"""
+        if not self.find_signin_page():
+            print("❌ Cannot find sign-in page")
+            return False
+        
+        signin_url = self.driver.current_url
+        main_window = self.driver.current_window_handle
+        try:
+            iframe = self.wait.until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, f"iframe[src^='{provider}']")
+            ))
+            self.driver.switch_to.frame(iframe)
+            button = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid*='google']")))
+            print("Found google login button")
+            button.click()
+        except TimeoutException:
+            print(f"❌ No Google button in the sign-in iframe from {provider}")
+            return False
+        
+        # The stand-in consents immediately, closes its popup and sends the app page onwards
+        if not self.ready.until(lambda d: len(d.window_handles) > 1, timeout=3):
+            print("❌ Google button did not open a sign-in popup")
+            return False
+        if not self.ready.until(lambda d: len(d.window_handles) == 1, timeout=5):
+            print("❌ Sign-in popup did not close")
+            return False
+        self.driver.switch_to.window(main_window)
+        self.driver.switch_to.default_content()
+        if not self.ready.route_change(signin_url, timeout=5):
+            print("❌ Still on the sign-in page after Google sign-in")
+            return False
+        
+        print(f"✅ Google sign-in through the stand-in landed on {self.driver.current_url}")
+        return True
+    
     def test_social_login_options(self):
         """Test 7: Social login buttons"""
         print("\n🧪 TEST 7: Social Login Options")
         print("-" * 45)
+        
+        # The real providers need a human; the stand-in's flow is checked end to end
+        provider = stub_url()
+        if provider:
+            return self.check_stand_in_google_login(provider)
        
         social_providers = ['google', 'facebook', 'twitter', 'github', 'apple']
         social_buttons = []
@@ -597,7 +604,7 @@ class SignInPageTests:
                 
                 initial_url = self.driver.current_url
                 button.click()
-                time.sleep(2)
+                self.ready.route_change(initial_url, timeout=2)
                 
                 new_url = self.driver.current_url
                 
@@ -605,7 +612,7 @@ class SignInPageTests:
                     print(f" Social login redirected to: {new_url}")
                    
                     self.driver.back()
-                    time.sleep(1)
+                    self.ready.settled()
                 else:
                     print("  Social button clicked but no redirect")
                     
@@ -625,33 +632,22 @@ class SignInPageTests:
         accessibility_score = 0
         
         
-        for field_name, element in elements.items():
-            if field_name in ['email', 'password']:
-                try:
-                    
-                    aria_label = element.get_attribute('aria-label')
-                    if aria_label:
-                        print(f" {field_name} has aria-label: '{aria_label}'")
-                        accessibility_score += 1
-                    
-                    
-                    field_id = element.get_attribute('id')
-                    if field_id:
-                        try:
-                            label = self.driver.find_element(By.CSS_SELECTOR, f"label[for='{field_id}']")
-                            print(f" {field_name} has associated label")
-                            accessibility_score += 1
-                        except:
-                            pass
-                    
-                
-                    placeholder = element.get_attribute('placeholder')
-                    if placeholder:
-                        print(f" {field_name} has placeholder: '{placeholder}'")
-                        accessibility_score += 1
-                        
-                except Exception as e:
-                    print(f" Error checking {field_name} accessibility: {e}")
+        field_names = [name for name in ['email', 'password'] if name in elements]
+        fields = snapshot(self.driver, [elements[name] for name in field_names]) if field_names else []
+        for field_name, field in zip(field_names, fields):
+            aria_label = field.attr('aria-label')
+            if aria_label:
+                print(f" {field_name} has aria-label: '{aria_label}'")
+                accessibility_score += 1
+            
+            if field.attr('id') and field.labels:
+                print(f" {field_name} has associated label")
+                accessibility_score += 1
+            
+            placeholder = field.attr('placeholder')
+            if placeholder:
+                print(f" {field_name} has placeholder: '{placeholder}'")
+                accessibility_score += 1
         
 
         try:
@@ -664,7 +660,6 @@ class SignInPageTests:
                 
                 for i in range(5): 
                     ActionChains(self.driver).send_keys(Keys.TAB).perform()
-                    time.sleep(0.3)
                     
                     focused_element = self.driver.switch_to.active_element
                     if focused_element.is_displayed():
@@ -731,7 +726,7 @@ class SignInPageTests:
     def cleanup(self):
         """Clean up resources"""
         try:
-            self.driver.quit()
+            release_driver(self.driver)
             print("\n🧹 Browser closed")
         except:
             pass
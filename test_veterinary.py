@@ -1,7 +1,6 @@
 
 
 import pytest # type: ignore
-import time
 import sys
 from selenium import webdriver # type: ignore
 from selenium.webdriver.common.by import By # type: ignore
@@ -16,6 +15,14 @@ from selenium.common.exceptions import ( # type: ignore
     ElementClickInterceptedException
 )
 
+from driver_pool import acquire_driver, release_driver
+from readiness import Readiness
+from selector_resolver import SelectorResolver
+from offline_dom import capture
+from perf_trace import slow_section
+from interaction_profiler import InteractionProfiler
+from web_vitals import measure
+
 
 class VeterinaryPageTests:
     """Selenium tests for the veterinary page"""
@@ -24,6 +31,9 @@ class VeterinaryPageTests:
         self.setup_driver()
         self.base_url = "http://localhost:3000/veterinary"
         self.wait = WebDriverWait(self.driver, 15)
+        self.ready = Readiness(self.driver)
+        self.resolver = SelectorResolver(self.driver)
+        self.interactions = InteractionProfiler(self.driver)
     
     def setup_driver(self):
         """Setup Chrome WebDriver"""
@@ -37,7 +47,7 @@ class VeterinaryPageTests:
         # chrome_options.add_argument("--headless")
         
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = acquire_driver(chrome_options)
             self.driver.implicitly_wait(10)
             print("✅ Chrome WebDriver initialized successfully")
         except Exception as e:
@@ -50,7 +60,7 @@ class VeterinaryPageTests:
         try:
             print(f"🌐 Navigating to {self.base_url}")
             self.driver.get(self.base_url)
-            time.sleep(3)
+            self.ready.settled()
             print(f"✅ Successfully loaded: {self.driver.title}")
             return True
         except Exception as e:
@@ -65,19 +75,20 @@ class VeterinaryPageTests:
         if not self.navigate_to_page():
             return False
         
+        # Everything below is read-only, so check it against one captured DOM
+        page = capture(self.driver)
+        
         # Check URL
-        current_url = self.driver.current_url
+        current_url = page.url
         print(f"📍 Current URL: {current_url}")
         
         # Check page title
-        page_title = self.driver.title
+        page_title = page.title
         print(f"📄 Page Title: {page_title}")
         
         # Check if veterinary-related content exists
         veterinary_keywords = ["veterinary", "vet", "doctor", "clinic", "appointment"]
-        page_source = self.driver.page_source.lower()
-        
-        found_keywords = [keyword for keyword in veterinary_keywords if keyword in page_source]
+        found_keywords = page.contains(*veterinary_keywords)
         print(f"🔍 Found veterinary keywords: {found_keywords}")
         
         # Look for main content areas
@@ -85,16 +96,10 @@ class VeterinaryPageTests:
             "main", "section", ".container", "[data-testid]", ".veterinary", ".vet"
         ]
         
-        main_content_found = False
-        for selector in content_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    print(f"✅ Found main content: {selector} ({len(elements)} elements)")
-                    main_content_found = True
-                    break
-            except:
-                continue
+        selector, elements = page.first(content_selectors)
+        main_content_found = bool(elements)
+        if main_content_found:
+            print(f"✅ Found main content: {selector} ({len(elements)} elements)")
         
         if not main_content_found:
             print("⚠️  No obvious main content containers found")
@@ -120,16 +125,10 @@ class VeterinaryPageTests:
             "#search"
         ]
         
-        search_input = None
-        for selector in search_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements and elements[0].is_displayed():
-                    search_input = elements[0]
-                    print(f"✅ Found search input: {selector}")
-                    break
-            except:
-                continue
+        match = self.resolver.first(search_selectors, name="search input")
+        search_input = match.element
+        if search_input:
+            print(f"✅ Found search input: {match.selector}")
         
         if search_input:
             try:
@@ -138,10 +137,12 @@ class VeterinaryPageTests:
                 
                 for term in search_terms:
                     print(f"🔍 Searching for: {term}")
-                    search_input.clear()
-                    search_input.send_keys(term)
-                    search_input.send_keys(Keys.ENTER)
-                    time.sleep(2)
+                    with slow_section(self.driver, f"search {term}"):
+                        search_input.clear()
+                        search_input.send_keys(term)
+                        with self.interactions.measure("search", term):
+                            search_input.send_keys(Keys.ENTER)
+                        self.ready.settled()
                     
                    
                     page_source_after = self.driver.page_source
@@ -172,19 +173,9 @@ class VeterinaryPageTests:
             ".grid > div", ".list-item"
         ]
         
-        vet_cards = []
-        for selector in vet_card_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                   
-                    for element in elements:
-                        if element.is_displayed():
-                            text = element.text.lower()
-                            if any(keyword in text for keyword in ['dr', 'doctor', 'vet', 'dvm', 'clinic']):
-                                vet_cards.append(element)
-            except:
-                continue
+        vet_cards = self.resolver.union(
+            vet_card_selectors, name="vet card", text_any=['dr', 'doctor', 'vet', 'dvm', 'clinic']
+        ).elements
         
         if vet_cards:
             print(f"✅ Found {len(vet_cards)} potential veterinarian listings")
@@ -230,11 +221,12 @@ class VeterinaryPageTests:
  
         nav_selectors = ["nav", ".navigation", ".navbar", ".header", "[data-testid*='nav']"]
         nav_found = False
+        page = capture(self.driver)
         
         for selector in nav_selectors:
             try:
-                nav_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if nav_elements and nav_elements[0].is_displayed():
+                nav_elements = page.select(selector)
+                if nav_elements and nav_elements[0].visible:
                     print(f"✅ Found navigation: {selector}")
                     nav_found = True
                     
@@ -257,16 +249,14 @@ class VeterinaryPageTests:
         filters_found = 0
         for selector in filter_selectors:
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    if element.is_displayed():
-                        text = element.text.lower() if element.text else ""
-                        placeholder = element.get_attribute("placeholder") or ""
-                        
-                        if any(keyword in (text + placeholder).lower() 
-                               for keyword in ["specialty", "location", "emergency", "filter", "category"]):
-                            filters_found += 1
-                            print(f"✅ Found filter element: {text or placeholder or selector}")
+                for element in page.select(selector, visible=True):
+                    text = element.text.lower()
+                    placeholder = element.attr("placeholder") or ""
+                    
+                    if any(keyword in (text + placeholder).lower() 
+                           for keyword in ["specialty", "location", "emergency", "filter", "category"]):
+                        filters_found += 1
+                        print(f"✅ Found filter element: {text or placeholder or selector}")
             except:
                 continue
         
@@ -295,7 +285,7 @@ class VeterinaryPageTests:
             try:
                 print(f"📱 Testing {device} viewport ({width}x{height})")
                 self.driver.set_window_size(width, height)
-                time.sleep(2)
+                self.ready.dom_quiet()
                 
               
                 body = self.driver.find_element(By.TAG_NAME, "body")
@@ -337,9 +327,6 @@ class VeterinaryPageTests:
         print("\n🧪 TEST 6: Basic Performance")
         print("-" * 50)
         
-        start_time = time.time()
-        
-       
         self.driver.refresh()
         
       
@@ -347,7 +334,14 @@ class VeterinaryPageTests:
             WebDriverWait(self.driver, 15).until(
                 lambda driver: driver.execute_script("return document.readyState") == "complete"
             )
-            load_time = time.time() - start_time
+            # Browser-side timings from navigation start, without WebDriver round trips
+            vitals = measure(self.driver)
+            if vitals is None or not (vitals.load or vitals.dom_content_loaded):
+                print("❌ No load or DOMContentLoaded timing was captured for this page")
+                return False
+            print(f"⏱️  TTFB {vitals.ttfb} ms, FCP {vitals.fcp} ms, LCP {vitals.lcp} ms, "
+                  f"DOMContentLoaded {vitals.dom_content_loaded} ms, CLS {vitals.cls}")
+            load_time = (vitals.load or vitals.dom_content_loaded) / 1000
             print(f"⏱️  Page load time: {load_time:.2f} seconds")
             
             if load_time < 5:
@@ -413,7 +407,7 @@ class VeterinaryPageTests:
     def cleanup(self):
         """Clean up resources"""
         try:
-            self.driver.quit()
+            release_driver(self.driver)
             print("\n🧹 Browser closed successfully")
         except:
             pass
@@ -470,6 +464,7 @@ class TestVeterinaryPage:
     def test_responsive_layout(self):
         assert self.tester.test_responsive_design()
     
+    @pytest.mark.intercept("off")
     def test_performance_acceptable(self):
         assert self.tester.test_performance_basic()
 
@@ -2,10 +2,11 @@ from selenium import webdriver # type: ignore
 from selenium.webdriver.common.by import By # type: ignore 
 from selenium.webdriver.support.ui import WebDriverWait # type: ignore 
 from selenium.webdriver.support import expected_conditions as EC # type: ignore 
-import time
+
+from driver_pool import acquire_driver, release_driver
 
 def test_view_details_from_homepage():
-    driver = webdriver.Chrome()
+    driver = acquire_driver()
     driver.get("http://localhost:3000/")
 
     try:
@@ -29,7 +30,6 @@ def test_view_details_from_homepage():
         print(driver.page_source)
 
     finally:
-        time.sleep(2)
-        driver.quit()
+        release_driver(driver)
 
   #thik ase
\ No newline at end of file
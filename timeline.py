@@ -0,0 +1,352 @@
+import glob
+import html
+import json
+import os
+import sys
+import threading
+import time
+
+from selenium.common.exceptions import NoSuchElementException # type: ignore
+from selenium.webdriver.remote.command import Command # type: ignore
+from selenium.webdriver.support.ui import WebDriverWait # type: ignore
+
+import command_hooks
+import driver_pool
+
+
+# (key, label, colour); test_code is whatever a test spends outside every other category
+CATEGORIES = [
+    ("chrome_startup", "Chrome startup", "#d1495b"),
+    ("sleep", "time.sleep", "#edae49"),
+    ("implicit_wait", "Implicit-wait stalls", "#f26419"),
+    ("explicit_wait", "WebDriverWait polling", "#8e6c8a"),
+    ("navigation", "Navigation", "#00798c"),
+    ("webdriver", "Other WebDriver commands", "#66a182"),
+    ("test_code", "Test code and assertions", "#c9d1d9"),
+]
+LABELS = {key: label for key, label, _ in CATEGORIES}
+
+NAVIGATION_COMMANDS = {Command.GET, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH}
+FIND_COMMANDS = {
+    Command.FIND_ELEMENT, Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS
+}
+# A find that succeeds faster than this did not wait on the implicit timeout
+STALL_SECONDS = 0.1
+
+
+class Timeline:
+    """Spans of wall time by category, attributed to the test running at the time.
+
+    Only the thread that installed the profiler is timed, so stub servers and
+    other background threads sleeping on their own do not show up. Spans do
+    not nest: a find_element inside a WebDriverWait is part of the wait.
+    """
+
+    def __init__(self, worker):
+        self.worker = worker
+        self.thread = threading.get_ident()
+        self.started = time.time()
+        self.spans = []
+        self.tests = []
+        self.current = None
+        self._depth = 0
+
+    def timing(self):
+        return threading.get_ident() == self.thread and self._depth == 0
+
+    def add(self, category, name, start, end):
+        test = self.current["nodeid"] if self.current else None
+        self.spans.append({"category": category, "name": name, "start": start, "end": end, "test": test})
+
+    def timed(self, category, name, run):
+        """run() inside a span, unless another span is already open"""
+        if not self.timing():
+            return run()
+        self._depth += 1
+        start = time.time()
+        try:
+            return run()
+        finally:
+            self._depth -= 1
+            self.add(category, name, start, time.time())
+
+    def begin_test(self, nodeid):
+        self.current = {"nodeid": nodeid, "start": time.time(), "outcome": "passed"}
+
+    def set_outcome(self, outcome):
+        if self.current is not None and self.current["outcome"] != "failed":
+            self.current["outcome"] = outcome
+
+    def end_test(self):
+        test, self.current = self.current, None
+        if test is None:
+            return
+        test["end"] = time.time()
+        test["breakdown"] = breakdown(
+            [span for span in self.spans if span["test"] == test["nodeid"]], test["end"] - test["start"]
+        )
+        self.tests.append(test)
+
+    def to_dict(self):
+        return {
+            "worker": self.worker,
+            "started": self.started,
+            "finished": time.time(),
+            "tests": self.tests,
+            "spans": self.spans,
+        }
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle)
+
+    def report(self):
+        if not self.tests:
+            return []
+        totals = {}
+        for test in self.tests:
+            for category, seconds in test["breakdown"].items():
+                totals[category] = totals.get(category, 0.0) + seconds
+        overall = sum(totals.values()) or 1.0
+        lines = [f"🕒 Time breakdown over {len(self.tests)} tests ({overall:.1f}s)"]
+        for category, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+            if not seconds:
+                continue
+            lines.append(f"   {LABELS[category]:<28} {seconds:>7.1f}s {seconds / overall * 100:>5.1f}%")
+        return lines
+
+
+def breakdown(spans, duration):
+    seconds = {}
+    for span in spans:
+        seconds[span["category"]] = seconds.get(span["category"], 0.0) + span["end"] - span["start"]
+    seconds["test_code"] = max(duration - sum(seconds.values()), 0.0)
+    return {key: round(seconds.get(key, 0.0), 4) for key, _, _ in CATEGORIES}
+
+
+recorder = None
+_originals = {}
+
+
+def _on_command(driver, command, params, run):
+    if command == Command.SET_TIMEOUTS and params and "implicit" in params:
+        driver._implicit_wait = params["implicit"] / 1000
+    if recorder is None or not recorder.timing():
+        return run()
+
+    recorder._depth += 1
+    start = time.time()
+    category = "navigation" if command in NAVIGATION_COMMANDS else "webdriver"
+    missed = False
+    try:
+        result = run()
+        if command in (Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENTS) and isinstance(result, dict):
+            missed = not result.get("value")
+        return result
+    except NoSuchElementException:
+        missed = True
+        raise
+    finally:
+        recorder._depth -= 1
+        end = time.time()
+        if command in FIND_COMMANDS and getattr(driver, "_implicit_wait", 0) and (
+            missed or end - start > STALL_SECONDS
+        ):
+            category = "implicit_wait"
+        recorder.add(category, command, start, end)
+
+
+def _watch_commands(driver):
+    """driver_pool acquire hook"""
+    driver._timeline_listener = lambda command, params, run: _on_command(driver, command, params, run)
+    command_hooks.listen(driver, driver._timeline_listener)
+
+
+def _unwatch_commands(driver):
+    """driver_pool release hook"""
+    listener = getattr(driver, "_timeline_listener", None)
+    if listener is not None:
+        command_hooks.unlisten(driver, listener)
+        driver._timeline_listener = None
+
+
+def install(worker="0"):
+    """Start timing Chrome launches, sleeps, waits and WebDriver commands in this process"""
+    global recorder
+    if recorder is not None:
+        return recorder
+    recorder = Timeline(worker)
+    _originals.update(
+        sleep=time.sleep, until=WebDriverWait.until, until_not=WebDriverWait.until_not,
+        launch_chrome=driver_pool.launch_chrome,
+    )
+
+    def sleep(seconds):
+        return recorder.timed("sleep", f"sleep({seconds:g})", lambda: _originals["sleep"](seconds))
+
+    def until(self, method, message=""):
+        return recorder.timed("explicit_wait", _describe(method), lambda: _originals["until"](self, method, message))
+
+    def until_not(self, method, message=""):
+        return recorder.timed(
+            "explicit_wait", "not " + _describe(method), lambda: _originals["until_not"](self, method, message)
+        )
+
+    def launch_chrome(options):
+        return recorder.timed("chrome_startup", "launch", lambda: _originals["launch_chrome"](options))
+
+    time.sleep = sleep
+    WebDriverWait.until = until
+    WebDriverWait.until_not = until_not
+    driver_pool.launch_chrome = launch_chrome
+    driver_pool.add_driver_hook(_watch_commands, _unwatch_commands)
+    return recorder
+
+
+def uninstall():
+    global recorder
+    if recorder is None:
+        return
+    time.sleep = _originals["sleep"]
+    WebDriverWait.until = _originals["until"]
+    WebDriverWait.until_not = _originals["until_not"]
+    driver_pool.launch_chrome = _originals["launch_chrome"]
+    driver_pool.remove_driver_hook(_watch_commands)
+    recorder = None
+
+
+def _describe(method):
+    name = getattr(method, "__name__", None) or type(method).__name__
+    locator = getattr(method, "locator", None)
+    return f"{name} {locator[1]}" if locator else name
+
+
+def write(directory):
+    """Save this process's timeline and re-render the HTML from every worker file in directory"""
+    os.makedirs(directory, exist_ok=True)
+    recorder.save(os.path.join(directory, f"timeline-w{recorder.worker}.json"))
+    # A lone pytest run shows only itself; parallel workers share the page
+    if os.environ.get("PAWFINDER_WORKER") is None:
+        paths = [os.path.join(directory, f"timeline-w{recorder.worker}.json")]
+    else:
+        paths = None
+    return render(directory, paths)
+
+
+def load(directory, paths=None):
+    timelines = []
+    for path in paths or sorted(glob.glob(os.path.join(directory, "timeline-w*.json"))):
+        with open(path, encoding="utf-8") as handle:
+            timelines.append(json.load(handle))
+    return timelines
+
+
+def render(directory, paths=None):
+    """Write timeline.html (Gantt lanes per worker plus per-test breakdown) and return its path"""
+    timelines = load(directory, paths)
+    path = os.path.join(directory, "timeline.html")
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(to_html(timelines))
+    return path
+
+
+def to_html(timelines):
+    origin = min((timeline["started"] for timeline in timelines), default=0)
+    end = max((timeline["finished"] for timeline in timelines), default=origin + 1)
+    total = max(end - origin, 0.001)
+
+    def left(moment):
+        return f"{(moment - origin) / total * 100:.3f}%"
+
+    def width(start, stop):
+        return f"{max(stop - start, 0) / total * 100:.3f}%"
+
+    lanes = []
+    rows = []
+    totals = {key: 0.0 for key, _, _ in CATEGORIES}
+    for timeline in sorted(timelines, key=lambda timeline: str(timeline["worker"])):
+        bars = []
+        for test in timeline["tests"]:
+            title = html.escape(f"{test['nodeid']} ({test['outcome']}, {test['end'] - test['start']:.2f}s)")
+            bars.append(
+                f'<div class="test {test["outcome"]}" style="left:{left(test["start"])};'
+                f'width:{width(test["start"], test["end"])}" title="{title}"></div>'
+            )
+            rows.append((timeline["worker"], test))
+            for key, seconds in test["breakdown"].items():
+                totals[key] += seconds
+        for span in timeline["spans"]:
+            if span["test"] is None:
+                continue
+            title = html.escape(f"{LABELS[span['category']]}: {span['name']} ({span['end'] - span['start']:.3f}s)")
+            bars.append(
+                f'<div class="span {span["category"]}" style="left:{left(span["start"])};'
+                f'width:{width(span["start"], span["end"])}" title="{title}"></div>'
+            )
+        lanes.append(f'<div class="lane"><div class="name">worker {html.escape(str(timeline["worker"]))}</div>'
+                     f'<div class="track">{"".join(bars)}</div></div>')
+
+    overall = sum(totals.values()) or 1.0
+    legend = "".join(
+        f'<span><i class="{key}"></i>{label}: {totals[key]:.1f}s ({totals[key] / overall * 100:.0f}%)</span>'
+        for key, label, _ in sorted(CATEGORIES, key=lambda category: -totals[category[0]])
+    )
+    header = "".join(f"<th>{label}</th>" for _, label, _ in CATEGORIES)
+    body = []
+    for worker, test in sorted(rows, key=lambda row: row[1]["start"] - row[1]["end"]):
+        duration = test["end"] - test["start"] or 1.0
+        stacked = "".join(
+            f'<i class="{key}" style="width:{seconds / duration * 100:.2f}%"></i>'
+            for key, seconds in test["breakdown"].items() if seconds
+        )
+        cells = "".join(f"<td>{test['breakdown'][key]:.2f}</td>" for key, _, _ in CATEGORIES)
+        body.append(
+            f'<tr class="{test["outcome"]}"><td>{html.escape(test["nodeid"])}</td><td>{html.escape(str(worker))}</td>'
+            f'<td>{test["end"] - test["start"]:.2f}</td><td><div class="stack">{stacked}</div></td>{cells}</tr>'
+        )
+    colours = "".join(f".{key}{{background:{colour}}}" for key, _, colour in CATEGORIES)
+    return HTML_TEMPLATE % {
+        "total": total, "colours": colours, "legend": legend, "lanes": "".join(lanes),
+        "header": header, "rows": "".join(body),
+    }
+
+
+HTML_TEMPLATE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>PawFinder run timeline</title>
+<style>
+body{font:13px system-ui,sans-serif;margin:20px;color:#222}
+.legend span{margin-right:14px;white-space:nowrap}.legend i,.stack i{display:inline-block;height:10px}
+.legend i{width:10px;margin-right:4px}
+.lane{display:flex;align-items:center;margin:6px 0}.name{width:80px;flex:none}
+.track{position:relative;flex:1;height:34px;background:#f6f8fa}
+.test{position:absolute;top:0;height:34px;box-sizing:border-box;border:1px solid #555;background:#c9d1d9}
+.test.failed{border-color:#d00;border-width:2px}
+.span{position:absolute;top:6px;height:22px;min-width:1px}
+table{border-collapse:collapse;margin-top:20px}td,th{padding:3px 8px;border-bottom:1px solid #eee;text-align:right}
+td:first-child,th:first-child{text-align:left}tr.failed td:first-child{color:#d00}
+.stack{display:flex;width:160px;height:10px;background:#eee}
+%(colours)s
+</style></head><body>
+<h2>Run timeline (%(total).1fs wall time)</h2>
+<div class="legend">%(legend)s</div>
+%(lanes)s
+<table><tr><th>test</th><th>worker</th><th>seconds</th><th></th>%(header)s</tr>%(rows)s</table>
+</body></html>
+"""
+
+
+def main():
+    """Re-render timeline.html from the JSON files in a --timeline directory"""
+    if len(sys.argv) < 2:
+        print("Usage: python timeline.py TIMELINE_DIR")
+        return 2
+    timelines = load(sys.argv[1])
+    if not timelines:
+        print(f"❌ No timeline-w*.json files in {sys.argv[1]}")
+        return 1
+    print(f"🕒 Wrote {render(sys.argv[1])} from {len(timelines)} workers")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+
+import web_vitals
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_RUNS = 10
+MIN_BASELINE = 5
+# Modified z-score (Iglewicz & Hoaglin) above which a value is an outlier against the baseline
+Z_THRESHOLD = 3.5
+MIN_SLOWDOWN = 0.10
+# Differences smaller than these are noise whatever the statistics say
+MIN_DELTA = {"seconds": 0.25, "ms": 20.0, "cls": 0.01, "requests": 2, "transfer_bytes": 20 * 1024}
+ROUTE_METRICS = web_vitals.FIELDS + ("requests", "transfer_bytes")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY, started REAL, finished REAL, revision TEXT, exit_status INTEGER
+);
+CREATE TABLE IF NOT EXISTS test_durations (
+    run_id TEXT, worker TEXT, test TEXT, outcome TEXT, seconds REAL
+);
+CREATE TABLE IF NOT EXISTS route_samples (
+    run_id TEXT, test TEXT, route TEXT, metric TEXT, value REAL
+);
+CREATE TABLE IF NOT EXISTS command_counts (
+    run_id TEXT, test TEXT, command TEXT, count INTEGER
+);
+CREATE INDEX IF NOT EXISTS test_durations_test ON test_durations (test, run_id);
+CREATE INDEX IF NOT EXISTS route_samples_route ON route_samples (route, metric, run_id);
+"""
+
+
+def store_path():
+    return os.environ.get("PAWFINDER_TIMING_DB", os.path.join(HERE, ".timings.sqlite"))
+
+
+def new_run_id():
+    """Shared by parallel workers through PAWFINDER_RUN_ID, so their rows make one run"""
+    return os.environ.get("PAWFINDER_RUN_ID") or time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=HERE, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+class RunTimings:
+    """Per-test durations of the current pytest run, summed over setup, call and teardown"""
+
+    def __init__(self):
+        self.run_id = new_run_id()
+        self.started = time.time()
+        self.tests = {}
+
+    def add_report(self, report):
+        entry = self.tests.setdefault(report.nodeid, {"seconds": 0.0, "outcome": "passed"})
+        entry["seconds"] += report.duration
+        if report.failed:
+            entry["outcome"] = "failed"
+        elif report.skipped and entry["outcome"] != "failed":
+            entry["outcome"] = "skipped"
+
+
+current = None
+
+
+class TimingStore:
+    def __init__(self, path=None):
+        self.path = path or store_path()
+        self.db = sqlite3.connect(self.path, timeout=30)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def save_run(self, timings, navigations=(), command_counts=None, exit_status=None):
+        worker = os.environ.get("PAWFINDER_WORKER", "0")
+        with self.db:
+            self.db.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+                "finished = excluded.finished, exit_status = MAX(COALESCE(exit_status, 0), excluded.exit_status)",
+                (timings.run_id, timings.started, time.time(), git_revision(), exit_status),
+            )
+            self.db.executemany(
+                "INSERT INTO test_durations VALUES (?, ?, ?, ?, ?)",
+                [(timings.run_id, worker, test, entry["outcome"], entry["seconds"]) for test, entry in timings.tests.items()],
+            )
+            self.db.executemany(
+                "INSERT INTO route_samples VALUES (?, ?, ?, ?, ?)",
+                [
+                    (timings.run_id, vitals.test, vitals.route, metric, getattr(vitals, metric))
+                    for vitals in navigations for metric in ROUTE_METRICS if getattr(vitals, metric) is not None
+                ],
+            )
+            self.db.executemany(
+                "INSERT INTO command_counts VALUES (?, ?, ?, ?)",
+                [
+                    (timings.run_id, test, command, count)
+                    for test, counts in (command_counts or {}).items() for command, count in counts.items()
+                ],
+            )
+
+    def set_exit_status(self, run_id, exit_status):
+        with self.db:
+            self.db.execute("UPDATE runs SET exit_status = MAX(COALESCE(exit_status, 0), ?) WHERE id = ?", (exit_status, run_id))
+
+    def runs(self, limit=20):
+        return self.db.execute(
+            "SELECT runs.id, started, finished, revision, exit_status, COUNT(test_durations.test) "
+            "FROM runs LEFT JOIN test_durations ON test_durations.run_id = runs.id "
+            "GROUP BY runs.id ORDER BY started DESC LIMIT ?", (limit,)
+        ).fetchall()
+
+    def latest_run(self):
+        row = self.db.execute("SELECT id FROM runs ORDER BY started DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def _baseline_runs(self, run_id):
+        started = self.db.execute("SELECT started FROM runs WHERE id = ?", (run_id,)).fetchone()
+        if started is None:
+            return []
+        return [row[0] for row in self.db.execute(
+            "SELECT id FROM runs WHERE started < ? ORDER BY started DESC", (started[0],)
+        )]
+
+    def test_series(self, run_ids):
+        """{test: {run_id: seconds}} for passing tests"""
+        series = {}
+        marks = ",".join("?" * len(run_ids))
+        for run_id, test, seconds in self.db.execute(
+            f"SELECT run_id, test, SUM(seconds) FROM test_durations WHERE outcome = 'passed' "
+            f"AND run_id IN ({marks}) GROUP BY run_id, test", run_ids
+        ):
+            series.setdefault(test, {})[run_id] = seconds
+        return series
+
+    def route_series(self, run_ids):
+        """{(route, metric): {run_id: median over the run's navigations}}"""
+        samples = {}
+        marks = ",".join("?" * len(run_ids))
+        for run_id, route, metric, value in self.db.execute(
+            f"SELECT run_id, route, metric, value FROM route_samples WHERE run_id IN ({marks})", run_ids
+        ):
+            samples.setdefault((route, metric), {}).setdefault(run_id, []).append(value)
+        return {
+            key: {run_id: statistics.median(values) for run_id, values in runs.items()}
+            for key, runs in samples.items()
+        }
+
+    def regressions(self, run_id=None):
+        """Tests and route metrics of run_id that are significantly slower than their rolling baseline"""
+        run_id = run_id or self.latest_run()
+        if run_id is None:
+            return []
+        history = self._baseline_runs(run_id)
+        found = []
+        tests = self.test_series([run_id] + history)
+        for test, values in sorted(tests.items()):
+            regression = detect(test, "seconds", values, run_id, history)
+            if regression:
+                found.append(regression)
+        routes = self.route_series([run_id] + history)
+        for (route, metric), values in sorted(routes.items()):
+            regression = detect(route, metric, values, run_id, history)
+            if regression:
+                found.append(regression)
+        return found
+
+
+class Regression:
+    def __init__(self, subject, metric, value, baseline, z, samples):
+        self.subject = subject
+        self.metric = metric
+        self.value = value
+        self.baseline = baseline
+        self.z = z
+        self.samples = samples
+
+    @property
+    def slowdown(self):
+        return self.value / self.baseline - 1 if self.baseline else float("inf")
+
+    def describe(self):
+        unit = {"seconds": "s", "cls": "", "requests": "", "transfer_bytes": "B"}.get(self.metric, "ms")
+        precision = 3 if self.metric in ("cls", "seconds") else 0
+        what = self.subject if self.metric == "seconds" else f"{self.subject} {self.metric}"
+        return (
+            f"{what}: {self.value:.{precision}f}{unit} vs baseline median {self.baseline:.{precision}f}{unit} "
+            f"(+{self.slowdown * 100:.0f}%, z={self.z:.1f}, {self.samples} runs)"
+        )
+
+
+def detect(subject, metric, values, run_id, history):
+    """Modified z-score of this run's value against the last BASELINE_RUNS runs that measured it"""
+    if run_id not in values:
+        return None
+    baseline = [values[old] for old in history if old in values][:BASELINE_RUNS]
+    if len(baseline) < MIN_BASELINE:
+        return None
+    value = values[run_id]
+    median = statistics.median(baseline)
+    mad = statistics.median(abs(sample - median) for sample in baseline)
+    # A perfectly steady baseline still has some noise; assume at least 1% of the median
+    mad = max(mad, abs(median) * 0.01, 1e-9)
+    z = 0.6745 * (value - median) / mad
+    floor = MIN_DELTA.get(metric, MIN_DELTA["ms"])
+    if z > Z_THRESHOLD and value - median >= floor and value >= median * (1 + MIN_SLOWDOWN):
+        return Regression(subject, metric, value, median, z, len(baseline))
+    return None
+
+
+def report(regressions, run_id):
+    if not regressions:
+        return [f"🗄️  Timing store: run {run_id} saved, no regressions against the rolling baseline"]
+    lines = [f"🐢 Timing store: {len(regressions)} regressions in run {run_id}"]
+    lines.extend(f"   ❌ {regression.describe()}" for regression in regressions)
+    return lines
+
+
+def main():
+    """python timing_store.py [runs | regressions [RUN_ID] | clear]"""
+    command = sys.argv[1] if len(sys.argv) > 1 else "runs"
+    if command == "clear":
+        if os.path.exists(store_path()):
+            os.remove(store_path())
+        print(f"🧹 Cleared {store_path()}")
+        return 0
+
+    store = TimingStore()
+    try:
+        if command == "regressions":
+            run_id = sys.argv[2] if len(sys.argv) > 2 else store.latest_run()
+            found = store.regressions(run_id)
+            for line in report(found, run_id):
+                print(line)
+            return 1 if found else 0
+
+        print(f"🗄️  {store.path}")
+        for run_id, started, finished, revision, exit_status, tests in store.runs():
+            status = {0: "✅", None: "❔"}.get(exit_status, "❌")
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(started))
+            print(f"   {status} {run_id:<24} {when}  {revision or '-':<8} {tests:>3} tests  {finished - started:>7.1f}s")
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
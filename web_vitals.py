@@ -0,0 +1,317 @@
+import json
+import statistics
+import threading
+from selenium.webdriver.remote.command import Command # type: ignore
+
+import command_hooks
+from routes import route_of
+
+
+HISTORY_KEY = "__pawfinder_vitals"
+
+# Installed on every new document: observes paints, LCP and layout shifts from the
+# start of the load, and files the page's final numbers in sessionStorage when it is
+# left, so pages reached by clicks are not lost before the next collection.
+INIT_JS = r"""
+(() => {
+    if (window.__pawVitals) return;
+    const vitals = window.__pawVitals = {lcp: null, cls: 0, longTasks: 0, saved: false};
+    if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(1000);
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({type, buffered: true});
+        } catch (e) {}
+    };
+    observe('largest-contentful-paint', entry => { vitals.lcp = entry.startTime; });
+    observe('layout-shift', entry => { if (!entry.hadRecentInput) vitals.cls += entry.value; });
+    observe('longtask', entry => { vitals.longTasks += entry.duration; });
+
+    vitals.summary = () => {
+        const nav = performance.getEntriesByType('navigation')[0] || {};
+        const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+        const hydration = performance.getEntriesByName('Next.js-hydration')[0]
+            || performance.getEntries().find(entry => /hydrat/i.test(entry.name));
+        const resources = performance.getEntriesByType('resource');
+        const round = value => value === undefined || value === null ? null : Math.round(value * 10) / 10;
+        // Cross-origin entries without Timing-Allow-Origin report 0 bytes; they still count as requests
+        const inventory = {document: {requests: 1, transfer: nav.transferSize || 0, decoded: nav.decodedBodySize || 0}};
+        resources.forEach(entry => {
+            const kind = kindOf(entry);
+            const bucket = inventory[kind] || (inventory[kind] = {requests: 0, transfer: 0, decoded: 0});
+            bucket.requests += 1;
+            bucket.transfer += entry.transferSize || 0;
+            bucket.decoded += entry.decodedBodySize || 0;
+        });
+        return {
+            id: String(performance.timeOrigin),
+            // The document's own URL: after client-side navigation location.href is another route
+            url: nav.name || location.href,
+            type: nav.type || null,
+            ttfb: round(nav.responseStart),
+            fcp: round(fcp && fcp.startTime),
+            lcp: round(vitals.lcp),
+            cls: Math.round(vitals.cls * 10000) / 10000,
+            dom_content_loaded: round(nav.domContentLoadedEventEnd || null),
+            load: round(nav.loadEventEnd || null),
+            hydration: hydration ? round(hydration.startTime + (hydration.duration || 0)) : null,
+            long_task_ms: round(vitals.longTasks),
+            requests: resources.length + 1,
+            transfer_bytes: resources.reduce((sum, entry) => sum + (entry.transferSize || 0), nav.transferSize || 0),
+            resources: inventory
+        };
+    };
+    const kindOf = entry => {
+        const type = entry.contentType || '';
+        const path = entry.name.split(/[?#]/)[0].toLowerCase();
+        if (/javascript|ecmascript/.test(type) || /\.m?js$/.test(path) || entry.initiatorType === 'script') return 'js';
+        if (type === 'text/css' || /\.css$/.test(path)) return 'css';
+        if (/^font\//.test(type) || /\.(woff2?|ttf|otf|eot)$/.test(path)) return 'font';
+        if (/^image\//.test(type) || /\.(png|jpe?g|gif|webp|avif|svg|ico)$/.test(path)
+            || entry.initiatorType === 'img' || entry.initiatorType === 'image') return 'image';
+        if (/json/.test(type) || entry.initiatorType === 'fetch' || entry.initiatorType === 'xmlhttprequest') return 'api';
+        return 'other';
+    };
+    const save = () => {
+        if (vitals.saved) return;
+        vitals.saved = true;
+        try {
+            const history = JSON.parse(sessionStorage.getItem('%s') || '[]');
+            history.push(vitals.summary());
+            sessionStorage.setItem('%s', JSON.stringify(history));
+        } catch (e) {}
+    };
+    addEventListener('pagehide', save);
+})();
+""" % (HISTORY_KEY, HISTORY_KEY)
+
+# Pages left since the last collection, plus the current one (which may still change)
+COLLECT_JS = """
+const history = JSON.parse(sessionStorage.getItem('%s') || '[]');
+sessionStorage.removeItem('%s');
+const current = window.__pawVitals ? window.__pawVitals.summary() : null;
+return {history: history, current: current};
+""" % (HISTORY_KEY, HISTORY_KEY)
+
+FIELDS = ("ttfb", "fcp", "lcp", "cls", "dom_content_loaded", "load", "hydration", "long_task_ms")
+# Network inventory buckets; "api" is XHR/fetch and JSON responses
+RESOURCE_TYPES = ("document", "js", "css", "image", "font", "api", "other")
+
+
+class PageVitals:
+    """Browser-reported timings for one document, all in ms from navigation start (CLS is unitless)"""
+
+    def __init__(self, data, test=None, intercept=None):
+        self.id = data["id"]
+        self.url = data["url"]
+        self.route = route_of(data["url"])
+        self.type = data.get("type")
+        self.ttfb = data.get("ttfb")
+        self.fcp = data.get("fcp")
+        self.lcp = data.get("lcp")
+        self.cls = data.get("cls")
+        self.dom_content_loaded = data.get("dom_content_loaded")
+        self.load = data.get("load")
+        self.hydration = data.get("hydration")
+        self.long_task_ms = data.get("long_task_ms")
+        self.requests = data.get("requests")
+        self.transfer_bytes = data.get("transfer_bytes", 0)
+        self.resources = data.get("resources")
+        self.test = test
+        # Request policy the browser ran under; its stubs and placeholders skew timings and weights
+        self.intercept = intercept or data.get("intercept")
+
+    def resource(self, kind, field):
+        """requests, transfer or decoded (bytes) for one resource type; None when not inventoried"""
+        if self.resources is None:
+            return None
+        return self.resources.get(kind, {}).get(field, 0)
+
+    def to_dict(self):
+        data = {
+            name: getattr(self, name) for name in ("url", "route", "type", "test", "intercept", "requests", "transfer_bytes", "resources")
+        }
+        data.update({name: getattr(self, name) for name in FIELDS})
+        return data
+
+    def __repr__(self):
+        parts = ", ".join(f"{name}={getattr(self, name)}" for name in FIELDS if getattr(self, name) is not None)
+        return f"<PageVitals {self.route} {parts}>"
+
+
+class VitalsCollector:
+    """Collects PageVitals for every document one driver loads"""
+
+    def __init__(self, driver, recorder):
+        self.driver = driver
+        self.recorder = recorder
+        self.seen = set()
+        self.pending = None
+        self.intercept = _policy_name(driver)
+        self.script_id = driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": INIT_JS}
+        )["identifier"]
+        command_hooks.listen(driver, self._on_command)
+
+    def collect(self):
+        """Record pages left since the last call, and the current page as it stands now"""
+        try:
+            result = self.driver.execute_script(COLLECT_JS)
+        except Exception:
+            return None
+        for data in result["history"]:
+            self._record(data)
+        if result["current"] is None or not result["current"]["url"].startswith("http"):
+            return None
+        # The current page can still shift or paint; keep the newest reading until it is left
+        if self.pending is not None and self.pending["id"] != result["current"]["id"]:
+            self._flush_pending()
+        self.pending = result["current"]
+        return PageVitals(result["current"], self.recorder.test, self.intercept)
+
+    def close(self):
+        self.collect()
+        self._flush_pending()
+        command_hooks.unlisten(self.driver, self._on_command)
+        try:
+            self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": self.script_id})
+        except Exception:
+            pass
+
+    def _on_command(self, command, params, run):
+        if command == Command.GET:
+            self.collect()
+            self._flush_pending()
+        return run()
+
+    def _flush_pending(self):
+        if self.pending is not None:
+            self._record(self.pending)
+            self.pending = None
+
+    def _record(self, data):
+        if data["id"] in self.seen or data.get("ttfb") is None:
+            return
+        self.seen.add(data["id"])
+        self.recorder.add(PageVitals(data, self.recorder.test, self.intercept))
+
+
+class VitalsRecorder:
+    """Every navigation of the run, tagged with the test that made it"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = []
+        self.test = None
+
+    def add(self, vitals):
+        with self._lock:
+            self.records.append(vitals)
+
+    def by_route(self):
+        routes = {}
+        for vitals in self.records:
+            routes.setdefault(vitals.route, []).append(vitals)
+        return routes
+
+    def intercepted(self):
+        return [vitals for vitals in self.records if vitals.intercept]
+
+    def report(self):
+        if not self.records:
+            return []
+        lines = [f"📏 Web vitals: {len(self.records)} navigations (median ms; CLS unitless)"]
+        lines.append(f"   {'route':<20} {'n':>3} {'TTFB':>7} {'FCP':>7} {'LCP':>7} {'CLS':>7} {'DCL':>7} {'load':>7}")
+        for route, records in sorted(self.by_route().items()):
+            cells = [_median(records, name) for name in ("ttfb", "fcp", "lcp", "cls", "dom_content_loaded", "load")]
+            formatted = [
+                "-" if value is None else (f"{value:.3f}" if name == "cls" else f"{value:.0f}")
+                for name, value in zip(("ttfb", "fcp", "lcp", "cls", "dcl", "load"), cells)
+            ]
+            lines.append(f"   {route:<20} {len(records):>3} " + " ".join(f"{cell:>7}" for cell in formatted))
+        intercepted = self.intercepted()
+        if intercepted:
+            lines.append(
+                f"   ⚠️  {len(intercepted)} navigations ran under a request policy "
+                f"({', '.join(sorted({vitals.intercept for vitals in intercepted}))}); "
+                f"use --intercept off for real-world numbers"
+            )
+        return lines
+
+    def weight_report(self):
+        """Median KB transferred / decoded and requests per resource type, per route.
+
+        Navigations made under a request policy are left out: blocked fonts and
+        placeholder images would make every page look light.
+        """
+        routes = {}
+        for vitals in self.records:
+            if vitals.resources is not None and not vitals.intercept:
+                routes.setdefault(vitals.route, []).append(vitals)
+        if not routes:
+            if self.intercepted():
+                return ["📦 Resource weight: not reported, every navigation ran under a request policy (--intercept off)"]
+            return []
+        lines = ["📦 Resource weight per route (median KB transferred/decoded ×requests)"]
+        lines.append(f"   {'route':<20} " + " ".join(f"{kind:>13}" for kind in RESOURCE_TYPES) + "  heaviest")
+        for route, records in sorted(routes.items()):
+            medians = {
+                kind: [
+                    statistics.median(vitals.resource(kind, field) for vitals in records)
+                    for field in ("transfer", "decoded", "requests")
+                ]
+                for kind in RESOURCE_TYPES
+            }
+            cells = [
+                f"{transfer / 1024:.0f}/{decoded / 1024:.0f}×{requests:.0f}" if requests else "-"
+                for transfer, decoded, requests in medians.values()
+            ]
+            total = sum(values[1] for values in medians.values()) or 1
+            heaviest = max(medians, key=lambda kind: medians[kind][1])
+            lines.append(
+                f"   {route:<20} " + " ".join(f"{cell:>13}" for cell in cells)
+                + f"  {heaviest} {medians[heaviest][1] / total * 100:.0f}% of decoded"
+            )
+        return lines
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump([vitals.to_dict() for vitals in self.records], handle, indent=2)
+
+
+def _median(records, name):
+    values = [getattr(vitals, name) for vitals in records if getattr(vitals, name) is not None]
+    return statistics.median(values) if values else None
+
+
+recorder = VitalsRecorder()
+
+
+def measure(driver):
+    """PageVitals of the page the driver is on right now (LCP/CLS as they stand)"""
+    collector = getattr(driver, "_vitals", None)
+    if collector is not None:
+        return collector.collect()
+    # Buffered observers report asynchronously, so give them a frame before reading
+    data = driver.execute_async_script(INIT_JS + """
+const done = arguments[arguments.length - 1];
+requestAnimationFrame(() => setTimeout(() => done(window.__pawVitals.summary()), 0));
+""")
+    return PageVitals(data, recorder.test, _policy_name(driver))
+
+
+def _policy_name(driver):
+    interceptor = getattr(driver, "_interceptor", None)
+    return interceptor.policy.name if interceptor is not None else None
+
+
+def start_collecting(driver):
+    """driver_pool acquire hook"""
+    driver._vitals = VitalsCollector(driver, recorder)
+
+
+def stop_collecting(driver):
+    """driver_pool release hook"""
+    collector = getattr(driver, "_vitals", None)
+    if collector is not None:
+        collector.close()
+        driver._vitals = None